@@ -1,5 +1,5 @@
 from app.config.cache import get_cache
-from app.config.database import get_db
+from app.config.database import DbRunner, get_async_db, get_db
 from app.config.settings import Settings, get_settings
 
-__all__ = ["get_cache", "get_db", "Settings", "get_settings"]
+__all__ = ["get_cache", "get_db", "get_async_db", "DbRunner", "Settings", "get_settings"]
@@ -1,10 +1,42 @@
+import time
+
 import redis
+from redis.client import Pipeline
 
+from app.config.metrics import REDIS_COMMAND_DURATION
 from app.config.settings import get_settings
 
 settings = get_settings()
 
-redis_client = redis.Redis(decode_responses=True).from_url(settings.cache_connection_string)
+
+class InstrumentedPipeline(Pipeline):
+    """Pipeline that records the latency of each round trip."""
+
+    def execute(self, raise_on_error: bool = True):
+        start = time.perf_counter()
+        try:
+            return super().execute(raise_on_error)
+        finally:
+            REDIS_COMMAND_DURATION.labels("PIPELINE").observe(time.perf_counter() - start)
+
+
+class InstrumentedRedis(redis.Redis):
+    """Redis client that records the latency of every command."""
+
+    def execute_command(self, *args, **options):
+        start = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            REDIS_COMMAND_DURATION.labels(str(args[0]).upper()).observe(time.perf_counter() - start)
+
+    def pipeline(self, transaction=True, shard_hint=None) -> Pipeline:
+        return InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
+redis_client = InstrumentedRedis.from_url(settings.cache_connection_string, decode_responses=True)
 
 
 def get_cache():
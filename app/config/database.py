@@ -1,13 +1,172 @@
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import Engine, exc
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection, QueuePool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
 
+from app.config.metrics import DB_POOL_TIMEOUTS, DB_POOL_WAIT
 from app.config.settings import get_settings
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Key under which the owning AsyncSession is stored in its sync session's `info`
+ASYNC_SESSION_KEY = "async_session"
+
 settings = get_settings()
 
-engine = create_engine(settings.db_connection_string)
+
+class PoolTelemetry:
+    """Checkout counters for a connection pool: how often and how long callers waited."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False) -> None:
+        """Record one checkout attempt and the time it took."""
+        if timed_out:
+            DB_POOL_TIMEOUTS.inc()
+        else:
+            DB_POOL_WAIT.observe(waited)
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+                return
+            self._checkouts += 1
+            self._wait_seconds_total += waited
+            self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of the checkout counters."""
+        with self._lock:
+            return {
+                "checkouts": self._checkouts,
+                "timeouts": self._timeouts,
+                "wait_ms_avg": round(
+                    1000 * self._wait_seconds_total / self._checkouts if self._checkouts else 0, 3
+                ),
+                "wait_ms_max": round(1000 * self._wait_seconds_max, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every `connect()` so pool sizing can be based on real wait times."""
+
+    telemetry: PoolTelemetry
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.telemetry = PoolTelemetry()
+
+    def connect(self) -> PoolProxiedConnection:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.telemetry.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.telemetry.record(time.perf_counter() - start)
+        return connection  # type: ignore[no-any-return]
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout telemetry."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout telemetry."""
 
 
-def get_db():
+def _pool_options() -> dict[str, Any]:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+engine = create_engine(
+    settings.db_connection_string, poolclass=InstrumentedQueuePool, **_pool_options()
+)
+
+async_engine = (
+    create_async_engine(
+        settings.db_async_connection_string,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **_pool_options(),
+    )
+    if settings.db_async
+    else None
+)
+
+
+def get_pool_stats(db_engine: Engine) -> dict[str, Any]:
+    """Occupancy and checkout telemetry of an engine's connection pool."""
+    pool = db_engine.pool
+    stats: dict[str, Any] = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }
+    if isinstance(pool, QueuePool):
+        stats |= {
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+        }
+    if isinstance(pool, _InstrumentedPoolMixin):
+        stats |= pool.telemetry.stats()
+    return stats
+
+
+def get_db() -> Generator[Session, None, None]:
     """Get the database session."""
     with Session(engine) as db:
         yield db
+
+
+async def get_async_db() -> AsyncGenerator[Session, None]:
+    """
+    Get a database session backed by the async engine.
+
+    Repositories keep working against the synchronous `Session` API: they receive the
+    AsyncSession's sync facade, and `DbRunner` drives their calls through `run_sync` so
+    every round trip is awaited on the event loop instead of blocking it.
+    """
+    if async_engine is None:
+        raise RuntimeError("Async database engine is disabled (set DB_ASYNC=true)")
+
+    async with AsyncSession(async_engine, expire_on_commit=False) as db:
+        db.sync_session.info[ASYNC_SESSION_KEY] = db
+        yield db.sync_session
+
+
+class DbRunner:
+    """Runs blocking repository and service calls without stalling the event loop."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """
+        Run `fn` against the request's database session.
+
+        With the async engine the call runs inside `AsyncSession.run_sync`, otherwise it
+        is offloaded to the worker thread pool.
+        """
+        async_session: AsyncSession | None = self.session.info.get(ASYNC_SESSION_KEY)
+        if async_session is not None:
+            return await async_session.run_sync(lambda _: fn(*args, **kwargs))
+        return await run_in_threadpool(fn, *args, **kwargs)
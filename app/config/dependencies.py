@@ -1,20 +1,28 @@
+import secrets
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from redis.client import Redis
 from sqlmodel import Session
 
-from app.config import Settings, get_cache, get_db, get_settings
-from app.domain.models.account import Account
+from app.config import DbRunner, Settings, get_async_db, get_cache, get_db, get_settings
+from app.config.hashing import PasswordHasherPool, get_password_hasher_pool
+from app.config.health import ReadinessProbe, get_readiness_probe
+from app.config.reaper import SessionReaper, get_session_reaper
+from app.config.revocation import RevocationList, get_revocation_list
+from app.config.throttle import LoginThrottle
 from app.domain.models.user import User
 from app.domain.repositories import (
     AccountRepository,
     ApplicationRepository,
     AuthRepository,
+    CachedJobRepository,
     FavoriteRepository,
     JobRepository,
+    PrincipalRepository,
+    RefreshTokenRepository,
     SessionRepository,
     UserRepository,
 )
@@ -24,6 +32,8 @@ from app.domain.repositories.interfaces import (
     IAuthRepository,
     IFavoriteRepository,
     IJobRepository,
+    IPrincipalRepository,
+    IRefreshTokenRepository,
     ISessionRepository,
     IUserRepository,
 )
@@ -43,14 +53,97 @@ from app.services.interfaces import (
     IJobService,
     IUserService,
 )
+from app.services.interfaces.auth import AuthenticatedAccount
 
 # HTTP Bearer scheme for token authentication
 http_bearer = HTTPBearer()
 
-# Database dependency
-SessionDep = Annotated[Session, Depends(get_db)]
+# Database dependency (async engine when enabled in settings)
+SessionDep = Annotated[Session, Depends(get_async_db if get_settings().db_async else get_db)]
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 CacheDep = Annotated[Redis, Depends(get_cache)]
+PasswordHasherPoolDep = Annotated[PasswordHasherPool, Depends(get_password_hasher_pool)]
+ReadinessProbeDep = Annotated[ReadinessProbe, Depends(get_readiness_probe)]
+RevocationListDep = Annotated[RevocationList, Depends(get_revocation_list)]
+SessionReaperDep = Annotated[SessionReaper, Depends(get_session_reaper)]
+
+
+def get_login_throttle(
+    cache: CacheDep,
+    settings: SettingsDep,
+) -> LoginThrottle | None:
+    """Get the sign-in throttle, or None when disabled in settings."""
+    if not settings.login_throttle_enabled:
+        return None
+    return LoginThrottle(
+        cache,
+        ip_capacity=settings.login_throttle_ip_capacity,
+        ip_per_minute=settings.login_throttle_ip_per_minute,
+        email_capacity=settings.login_throttle_email_capacity,
+        email_per_minute=settings.login_throttle_email_per_minute,
+    )
+
+
+LoginThrottleDep = Annotated[LoginThrottle | None, Depends(get_login_throttle)]
+
+
+def get_client_ip(request: Request, settings: SettingsDep) -> str:
+    """
+    Get the client IP address, as seen by the first proxy we trust.
+
+    Each proxy appends the address it received the request from to X-Forwarded-For, so
+    with `TRUSTED_PROXY_COUNT` proxies in front of the API the client is the entry that
+    many hops from the right. Everything further left was sent by the client and can be
+    forged. Without trusted proxies the headers are ignored and the peer address is used.
+
+    Returns:
+        Client IP address as a string, or "unknown" if unavailable
+    """
+    if settings.trusted_proxy_count > 0:
+        hops = [
+            hop.strip()
+            for hop in request.headers.get("X-Forwarded-For", "").split(",")
+            if hop.strip()
+        ]
+        if len(hops) >= settings.trusted_proxy_count:
+            return hops[-settings.trusted_proxy_count]
+
+    if request.client:
+        return request.client.host
+
+    return "unknown"
+
+
+ClientIpDep = Annotated[str, Depends(get_client_ip)]
+
+
+def require_internal_token(
+    settings: SettingsDep,
+    x_internal_token: str | None = Header(None, alias="x-internal-token"),
+) -> None:
+    """
+    Allow the internal endpoints only to callers presenting `INTERNAL_API_TOKEN`.
+
+    Without a configured token the endpoints are disabled. Callers without the token get
+    404, so the endpoints are not advertised.
+    """
+    expected = settings.internal_api_token
+    if (
+        not expected
+        or not x_internal_token
+        or not secrets.compare_digest(x_internal_token.encode(), expected.encode())
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+def get_db_runner(
+    session: SessionDep,
+) -> DbRunner:
+    """Get the runner that executes service calls off the event loop."""
+    return DbRunner(session)
+
+
+DbRunnerDep = Annotated[DbRunner, Depends(get_db_runner)]
 
 
 # Repository dependencies
@@ -63,16 +156,24 @@ def get_user_repository(
 
 def get_auth_repository(
     settings: SettingsDep,
+    hasher_pool: PasswordHasherPoolDep,
 ) -> IAuthRepository:
     """Get the auth repository."""
-    return AuthRepository(settings)
+    return AuthRepository(settings, hasher_pool)
 
 
 def get_job_repository(
     session: SessionDep,
+    cache: CacheDep,
+    settings: SettingsDep,
 ) -> IJobRepository:
-    """Get the job repository."""
-    return JobRepository(session)
+    """Get the job repository, behind the read-through job cache."""
+    return CachedJobRepository(
+        JobRepository(session),
+        cache,
+        ttl_seconds=settings.job_cache_ttl_seconds,
+        pages=settings.job_cache_pages,
+    )
 
 
 def get_account_repository(
@@ -98,9 +199,29 @@ def get_favorite_repository(
 
 def get_application_repository(
     session: SessionDep,
+    cache: CacheDep,
 ) -> IApplicationRepository:
-    """Get the application repository."""
-    return ApplicationRepository(session)
+    """Get the application repository, keeping the cached application counts current."""
+    return ApplicationRepository(session, cache)
+
+
+def get_principal_repository(
+    cache: CacheDep,
+    settings: SettingsDep,
+) -> IPrincipalRepository:
+    """Get the authenticated principal cache repository."""
+    return PrincipalRepository(
+        cache,
+        settings.principal_cache_ttl_seconds,
+        version_ttl_seconds=settings.access_token_expire_minutes * 60,
+    )
+
+
+def get_refresh_token_repository(
+    cache: CacheDep,
+) -> IRefreshTokenRepository:
+    """Get the refresh token rotation repository."""
+    return RefreshTokenRepository(cache)
 
 
 UserRepositoryDep = Annotated[IUserRepository, Depends(get_user_repository)]
@@ -110,6 +231,10 @@ FavoriteRepositoryDep = Annotated[IFavoriteRepository, Depends(get_favorite_repo
 AccountRepositoryDep = Annotated[IAccountRepository, Depends(get_account_repository)]
 SessionRepositoryDep = Annotated[ISessionRepository, Depends(get_session_repository)]
 ApplicationRepositoryDep = Annotated[IApplicationRepository, Depends(get_application_repository)]
+PrincipalRepositoryDep = Annotated[IPrincipalRepository, Depends(get_principal_repository)]
+RefreshTokenRepositoryDep = Annotated[
+    IRefreshTokenRepository, Depends(get_refresh_token_repository)
+]
 
 
 # Service dependencies
@@ -119,6 +244,11 @@ def get_auth_service(
     user_repository: UserRepositoryDep,
     session_repository: SessionRepositoryDep,
     account_repository: AccountRepositoryDep,
+    principal_repository: PrincipalRepositoryDep,
+    revocation_list: RevocationListDep,
+    refresh_token_repository: RefreshTokenRepositoryDep,
+    login_throttle: LoginThrottleDep,
+    settings: SettingsDep,
 ) -> IAuthService:
     """Get the auth service."""
     return AuthService(
@@ -127,15 +257,22 @@ def get_auth_service(
         user_repository,
         session_repository,
         account_repository,
+        principal_repository,
+        revocation_list if settings.token_blacklist_local else None,
+        account_claims=settings.access_token_account_claims,
+        revocation_ttl_seconds=settings.access_token_expire_minutes * 60,
+        refresh_token_repository=refresh_token_repository,
+        login_throttle=login_throttle,
     )
 
 
 def get_user_service(
     user_repository: UserRepositoryDep,
     session_repository: SessionRepositoryDep,
+    principal_repository: PrincipalRepositoryDep,
 ) -> IUserService:
     """Get the user service."""
-    return UserService(user_repository, session_repository)
+    return UserService(user_repository, session_repository, principal_repository)
 
 
 def get_job_service(
@@ -147,9 +284,10 @@ def get_job_service(
 
 def get_account_service(
     account_repository: AccountRepositoryDep,
+    principal_repository: PrincipalRepositoryDep,
 ) -> IAccountService:
     """Get the account service."""
-    return AccountService(account_repository)
+    return AccountService(account_repository, principal_repository)
 
 
 def get_favorite_service(
@@ -181,12 +319,13 @@ ApplicationServiceDep = Annotated[IApplicationService, Depends(get_application_s
 
 
 # Authentication dependency - Gets authenticated user from JWT token
-def get_authenticated_user(
+async def get_authenticated_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(http_bearer)],
     auth_service: AuthServiceDep,
+    db: DbRunnerDep,
 ) -> User:
     """Get the authenticated user."""
-    return auth_service.get_authenticated_user(credentials.credentials)
+    return await db.run(auth_service.get_authenticated_user, credentials.credentials)
 
 
 def get_auth_token(
@@ -196,15 +335,17 @@ def get_auth_token(
     return credentials.credentials
 
 
-def get_authenticated_account(
+async def get_authenticated_account(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(http_bearer)],
     auth_service: Annotated[IAuthService, Depends(get_auth_service)],
+    db: DbRunnerDep,
     x_account_id: str = Header(..., alias="x-account-id"),
-) -> Account:
+) -> AuthenticatedAccount:
     """
     Get and validate authenticated account from x-account-id header.
 
-    Ensures the authenticated user owns the specified account.
+    Ensures the authenticated user owns the specified account. Only the account's id, user
+    and type are known; load the account when anything else is needed.
     """
     try:
         account_id = UUID(x_account_id)
@@ -215,9 +356,9 @@ def get_authenticated_account(
         ) from exc
 
     # This will validate authentication and ownership
-    return auth_service.get_authenticated_account(credentials.credentials, account_id)
+    return await db.run(auth_service.get_authenticated_account, credentials.credentials, account_id)
 
 
 AuthenticatedUserDep = Annotated[User, Depends(get_authenticated_user)]
 AuthTokenDep = Annotated[str, Depends(get_auth_token)]
-AuthenticatedAccountDep = Annotated[Account, Depends(get_authenticated_account)]
+AuthenticatedAccountDep = Annotated[AuthenticatedAccount, Depends(get_authenticated_account)]
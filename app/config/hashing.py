@@ -0,0 +1,197 @@
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ParamSpec, TypeVar
+
+from fastapi import HTTPException, status
+from pwdlib.hashers.argon2 import Argon2Hasher
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.config.settings import get_settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+settings = get_settings()
+
+# OWASP's lowest recommended Argon2id configuration: 19 MiB of memory and two passes
+MIN_MEMORY_COST = 19 * 1024
+MIN_TIME_COST = 2
+
+
+class PasswordHasherPool:
+    """
+    Bounded worker pool for Argon2 password hashing and verification.
+
+    At most `max_workers` hashes run at once and at most `max_pending` more may wait
+    for a worker. Anything beyond that is rejected with 503 so a login storm sheds load
+    instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="argon2")
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._processed = 0
+        self._rejected = 0
+
+    def run(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run `fn` on the pool, blocking the caller (or its greenlet) until it finishes."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication service is busy, please retry",
+                headers={"Retry-After": "1"},
+            )
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+            # Inside AsyncSession.run_sync we are on the event loop thread: wait on the
+            # future through the greenlet bridge instead of blocking the loop.
+            if in_greenlet():
+                return await_only(asyncio.wrap_future(future))
+            return future.result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._processed += 1
+            self._slots.release()
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool utilisation and queue depth."""
+        with self._lock:
+            in_flight = self._in_flight
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": in_flight,
+                "queue_depth": max(0, in_flight - self.max_workers),
+                "processed": self._processed,
+                "rejected": self._rejected,
+            }
+
+
+password_hasher_pool = PasswordHasherPool(
+    settings.password_hash_workers, settings.password_hash_max_pending
+)
+
+
+def get_password_hasher_pool() -> PasswordHasherPool:
+    """Get the password hasher pool."""
+    return password_hasher_pool
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    """Argon2 cost parameters with the median hash latency measured for them."""
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    latency_ms: float
+
+    def env(self) -> dict[str, str]:
+        """The parameters as the settings that configure them."""
+        return {
+            "PASSWORD_HASH_TIME_COST": str(self.time_cost),
+            "PASSWORD_HASH_MEMORY_COST": str(self.memory_cost),
+            "PASSWORD_HASH_PARALLELISM": str(self.parallelism),
+        }
+
+
+def measure_argon2(time_cost: int, memory_cost: int, parallelism: int, samples: int = 3) -> float:
+    """Median time in milliseconds to hash a password with the given parameters."""
+    hasher = Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_argon2(
+    budget_ms: float,
+    parallelism: int,
+    max_memory_cost: int = 1024 * 1024,
+    max_time_cost: int = 10,
+    samples: int = 3,
+) -> Argon2Parameters:
+    """
+    Find the costliest Argon2 parameters whose hash latency on this machine fits the budget.
+
+    Starting from the OWASP minimum, memory is doubled first, since it is what makes
+    guessing expensive on GPUs, and then passes are added while the budget allows. The
+    minimum is returned even if it does not fit, as nothing weaker should be used.
+    """
+    time_cost, memory_cost = MIN_TIME_COST, MIN_MEMORY_COST
+    latency = measure_argon2(time_cost, memory_cost, parallelism, samples)
+
+    while memory_cost * 2 <= max_memory_cost:
+        candidate = measure_argon2(time_cost, memory_cost * 2, parallelism, samples)
+        if candidate > budget_ms:
+            break
+        memory_cost, latency = memory_cost * 2, candidate
+
+    while time_cost < max_time_cost:
+        candidate = measure_argon2(time_cost + 1, memory_cost, parallelism, samples)
+        if candidate > budget_ms:
+            break
+        time_cost, latency = time_cost + 1, candidate
+
+    return Argon2Parameters(time_cost, memory_cost, parallelism, round(latency, 1))
+
+
+def write_env(path: Path, values: dict[str, str]) -> None:
+    """Set the given variables in an env file, replacing their current lines if present."""
+    lines = path.read_text().splitlines() if path.exists() else []
+    pending = dict(values)
+    for i, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if key in pending:
+            lines[i] = f'{key}="{pending.pop(key)}"'
+    lines += [f'{key}="{value}"' for key, value in pending.items()]
+    path.write_text("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Calibrate Argon2 password hashing to a latency budget on this machine."
+    )
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="target hash latency")
+    parser.add_argument("--parallelism", type=int, default=settings.password_hash_parallelism)
+    parser.add_argument(
+        "--max-memory-mib", type=int, default=1024, help="never use more memory than this"
+    )
+    parser.add_argument("--write", type=Path, help="env file to write the parameters to")
+    args = parser.parse_args()
+
+    parameters = calibrate_argon2(
+        args.budget_ms, args.parallelism, max_memory_cost=args.max_memory_mib * 1024
+    )
+    print(
+        f"time_cost={parameters.time_cost} memory_cost={parameters.memory_cost} KiB "
+        f"parallelism={parameters.parallelism}: {parameters.latency_ms} ms per hash"
+    )
+    if parameters.latency_ms > args.budget_ms:
+        print(f"The minimum recommended parameters exceed the {args.budget_ms} ms budget")
+    if args.write:
+        write_env(args.write, parameters.env())
+        print(f"Written to {args.write}")
+    else:
+        for key, value in parameters.env().items():
+            print(f'{key}="{value}"')
@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from redis import Redis
+from sqlalchemy import Engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from app.config.cache import redis_client
+from app.config.database import async_engine, engine
+from app.config.settings import get_settings
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class ReadinessReport:
+    """Outcome of a readiness probe round."""
+
+    ready: bool
+    checks: dict[str, dict[str, Any]]
+    checked_at: datetime
+
+
+class ReadinessProbe:
+    """
+    Probes the database and the cache with tight timeouts.
+
+    The outcome is cached for `ttl_seconds` and concurrent callers share one probe round,
+    so load balancer polling never turns into load on the dependencies.
+    """
+
+    def __init__(
+        self,
+        db_engine: Engine,
+        cache: Redis,
+        timeout_seconds: float,
+        ttl_seconds: float,
+        db_async_engine: AsyncEngine | None = None,
+    ):
+        self.db_engine = db_engine
+        self.db_async_engine = db_async_engine
+        self.cache = cache
+        self.timeout_seconds = timeout_seconds
+        self.ttl_seconds = ttl_seconds
+        self._lock = asyncio.Lock()
+        self._report: ReadinessReport | None = None
+        self._report_time = 0.0
+
+    def _is_fresh(self) -> bool:
+        return self._report is not None and time.monotonic() - self._report_time < self.ttl_seconds
+
+    async def check(self) -> ReadinessReport:
+        """Return the cached report, probing the dependencies if it has expired."""
+        if self._is_fresh():
+            return self._report  # type: ignore[return-value]
+        async with self._lock:
+            if self._is_fresh():
+                return self._report  # type: ignore[return-value]
+            database, cache = await asyncio.gather(
+                self._probe(self._ping_database), self._probe(self._ping_cache)
+            )
+            checks = {"database": database, "cache": cache}
+            self._report = ReadinessReport(
+                ready=all(check["status"] == "up" for check in checks.values()),
+                checks=checks,
+                checked_at=datetime.now(),
+            )
+            self._report_time = time.monotonic()
+            return self._report
+
+    async def _probe(self, ping: Callable[[], Awaitable[Any]]) -> dict[str, Any]:
+        start = time.perf_counter()
+        error = None
+        try:
+            await asyncio.wait_for(ping(), timeout=self.timeout_seconds)
+        except TimeoutError:
+            error = "timeout"
+        except Exception as e:  # any failure means the dependency is down
+            error = type(e).__name__
+        result: dict[str, Any] = {
+            "status": "down" if error else "up",
+            "latency_ms": round(1000 * (time.perf_counter() - start), 3),
+        }
+        if error:
+            result["error"] = error
+        return result
+
+    def _select_one(self) -> None:
+        with self.db_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    async def _ping_database(self) -> None:
+        if self.db_async_engine is not None:
+            async with self.db_async_engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            return
+        await run_in_threadpool(self._select_one)
+
+    async def _ping_cache(self) -> None:
+        await run_in_threadpool(self.cache.ping)
+
+
+readiness_probe = ReadinessProbe(
+    engine,
+    redis_client,
+    timeout_seconds=settings.health_probe_timeout_seconds,
+    ttl_seconds=settings.health_cache_seconds,
+    db_async_engine=async_engine,
+)
+
+
+def get_readiness_probe() -> ReadinessProbe:
+    """Get the readiness probe."""
+    return readiness_probe
@@ -0,0 +1,145 @@
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Set for multi-worker deployments: every worker writes its samples to files in this
+# directory and `/metrics` aggregates them, whichever worker serves the scrape.
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Label for requests that matched no route, so unknown paths cannot explode cardinality
+UNMATCHED_ROUTE = "unmatched"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_connections_checked_out",
+    "Database connections checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=FAST_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts",
+    "Pool checkouts that gave up after DB_POOL_TIMEOUT.",
+)
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds",
+    "Redis round trip latency by command (PIPELINE for pipelines).",
+    ["command"],
+    buckets=FAST_BUCKETS,
+)
+AUTH_PRINCIPAL_CACHE = Counter(
+    "auth_principal_cache_lookups",
+    "Authenticated principal cache lookups by outcome.",
+    ["outcome"],
+)
+AUTH_LOGIN_THROTTLED = Counter(
+    "auth_login_throttled",
+    "Sign-in attempts rejected by the login throttle.",
+)
+AUTH_REFRESH_ROTATIONS = Counter(
+    "auth_refresh_rotations",
+    "Refresh token rotations by outcome (rotated, revoked or reused).",
+    ["outcome"],
+)
+AUTH_REVOCATION_CHECKS = Counter(
+    "auth_revocation_checks",
+    "Token blacklist checks by where they were answered.",
+    ["source"],
+)
+
+
+@event.listens_for(Pool, "checkout")
+def _connection_checked_out(*_) -> None:
+    DB_POOL_CHECKED_OUT.inc()
+
+
+@event.listens_for(Pool, "checkin")
+def _connection_checked_in(*_) -> None:
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def is_multiprocess() -> bool:
+    """Whether samples are shared between workers through `PROMETHEUS_MULTIPROC_DIR`."""
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def render_metrics() -> bytes:
+    """Metrics in the Prometheus text format, aggregated over all workers if shared."""
+    registry = REGISTRY
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_worker_stopped() -> None:
+    """Drop this worker's live gauges from the aggregated metrics."""
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+class MetricsMiddleware:
+    """
+    Records latency and in-flight requests per route template.
+
+    The route is read from the scope once routing matched it, so `/jobs/{job_id}` is a
+    single series however many jobs are requested.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - start
+            )
@@ -0,0 +1,96 @@
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine import Connection, ExceptionContext
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+# Key under which a connection keeps the start times of its in-flight statements
+_QUERY_START_KEY = "query_start"
+
+
+class QueryStats:
+    """Statements issued and time spent in the database while serving one request."""
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.count = 0
+        self.duration = 0.0
+
+    @property
+    def route(self) -> str:
+        """The matched route template, or the raw path before routing."""
+        route = self.scope.get("route")
+        path = getattr(route, "path", None) or self.scope.get("path", "")
+        return f"{self.scope.get('method', '')} {path}"
+
+    def server_timing(self) -> str:
+        """`Server-Timing` value with the statement count and total database time."""
+        return f'db;dur={self.duration * 1000:.3f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query(conn: Connection, *_) -> None:
+    conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_query(conn: Connection, cursor, statement: str, *_) -> None:
+    elapsed = time.perf_counter() - conn.info[_QUERY_START_KEY].pop()
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.count += 1
+    stats.duration += elapsed
+    if elapsed * 1000 >= settings.db_slow_query_ms:
+        logger.warning("Slow query (%.1f ms) in %s: %s", elapsed * 1000, stats.route, statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_query(context: ExceptionContext) -> None:
+    if context.connection is not None and context.connection.info.get(_QUERY_START_KEY):
+        context.connection.info[_QUERY_START_KEY].pop()
+
+
+class QueryStatsMiddleware:
+    """
+    Counts the SQL statements of each request and reports them in `Server-Timing`.
+
+    The counters live in a context variable, which reaches the threadpool the DbRunner
+    dispatches to and the greenlets of the async engine. Statements slower than
+    `DB_SLOW_QUERY_MS` are logged with the route that issued them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current_stats.set(stats)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(SERVER_TIMING_HEADER, stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
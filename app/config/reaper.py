@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+
+from redis import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import Engine
+from sqlmodel import Session
+
+from app.config.cache import redis_client
+from app.config.database import engine
+from app.config.settings import get_settings
+from app.domain.repositories.refresh import RefreshTokenRepository
+from app.domain.repositories.session import SessionRepository
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+REAPER_LOCK_KEY = "lock:session-reaper"
+
+
+class SessionReaper:
+    """
+    Periodically writes the session expiries of refresh token rotations and deactivates
+    expired sessions.
+
+    Each run first takes `REAPER_LOCK_KEY` in Redis for one interval and leaves it to
+    expire, so across all workers the sessions are reaped at most once per interval. The
+    expiries recorded by refresh token rotations since the last run are written in one
+    batched UPDATE first, so a session refreshed in the meantime is not taken for
+    expired. The expired sessions are then deactivated in UPDATEs of at most `batch_size`
+    rows, each in its own short transaction, until a batch comes back short.
+    """
+
+    def __init__(
+        self,
+        db_engine: Engine,
+        cache: Redis,
+        interval_seconds: float,
+        batch_size: int,
+    ):
+        self.engine = db_engine
+        self.cache = cache
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.refresh_tokens = RefreshTokenRepository(cache)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._runs = 0
+        self._skipped = 0
+        self._deactivated_total = 0
+        self._last_deactivated = 0
+        self._expiries_total = 0
+        self._last_run_at: datetime | None = None
+        self._last_duration_ms = 0.0
+
+    def start(self) -> None:
+        """Start the background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="session-reaper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def run_once(self) -> int | None:
+        """
+        Reap expired sessions if no other worker did within the interval.
+
+        Returns the number of deactivated sessions, or None when the run was skipped.
+        """
+        if not self.cache.set(REAPER_LOCK_KEY, "1", nx=True, ex=max(1, int(self.interval_seconds))):
+            with self._lock:
+                self._skipped += 1
+            return None
+
+        started = time.perf_counter()
+        deactivated = 0
+        with Session(self.engine) as db:
+            repository = SessionRepository(db)
+            expiries = self.refresh_tokens.get_pending_expiries()
+            repository.update_expiries(expiries)
+            self.refresh_tokens.clear_pending_expiries(expiries)
+            while not self._stop.is_set():
+                count = repository.deactivate_expired_sessions(self.batch_size)
+                deactivated += count
+                if count < self.batch_size:
+                    break
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            self._runs += 1
+            self._deactivated_total += deactivated
+            self._expiries_total += len(expiries)
+            self._last_deactivated = deactivated
+            self._last_run_at = datetime.now(UTC)
+            self._last_duration_ms = duration_ms
+        logger.info(
+            "Updated %d session expiries and deactivated %d expired sessions in %.1f ms",
+            len(expiries),
+            deactivated,
+            duration_ms,
+        )
+        return deactivated
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Snapshot of the runs of this worker and the sessions they updated and deactivated."""
+        with self._lock:
+            return {
+                "runs": self._runs,
+                "skipped": self._skipped,
+                "deactivated_total": self._deactivated_total,
+                "last_deactivated": self._last_deactivated,
+                "expiries_updated_total": self._expiries_total,
+                "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+                "last_duration_ms": round(self._last_duration_ms, 3),
+            }
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except RedisError:
+                logger.warning("Session reaper could not take its lock", exc_info=True)
+            except Exception:
+                logger.exception("Session reaper run failed")
+            self._stop.wait(self.interval_seconds)
+
+
+session_reaper = SessionReaper(
+    engine,
+    redis_client,
+    interval_seconds=settings.session_reaper_interval_seconds,
+    batch_size=settings.session_reaper_batch_size,
+)
+
+
+def get_session_reaper() -> SessionReaper:
+    """Get the per-worker expired session reaper."""
+    return session_reaper
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if session_reaper.run_once() is None:
+        logger.info(
+            "Skipped: sessions were reaped less than %ss ago",
+            settings.session_reaper_interval_seconds,
+        )
@@ -0,0 +1,259 @@
+import logging
+import math
+import threading
+import time
+from collections.abc import Sequence
+from uuid import UUID
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from app.config.cache import redis_client
+from app.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+BLACKLIST_PREFIX = "blacklist:"
+BLACKLIST_CHANNEL = "blacklist:revoked"
+SESSION_EPOCH_PREFIX = "revoked:session:"
+USER_EPOCH_PREFIX = "revoked:user:"
+EPOCH_CHANNEL = "revoked:epochs"
+
+
+def epoch_keys(session_id: UUID, user_id: UUID) -> list[str]:
+    """Redis keys of the revocation epochs of a session and of its user."""
+    return [f"{SESSION_EPOCH_PREFIX}{session_id}", f"{USER_EPOCH_PREFIX}{user_id}"]
+
+
+def revocation_keys(jti: str, session_id: UUID, user_id: UUID) -> list[str]:
+    """Redis keys that can revoke a token: its blacklist entry and its epochs."""
+    return [f"{BLACKLIST_PREFIX}{jti}", *epoch_keys(session_id, user_id)]
+
+
+def is_revoked_by(values: Sequence[bytes | str | None], issued_at: float) -> bool:
+    """
+    Whether a token is revoked, given the values of its `revocation_keys`.
+
+    An epoch is the time its session or user was revoked: every token issued before it
+    is revoked, without having to know their IDs.
+    """
+    blacklisted, *epochs = values
+    return bool(blacklisted) or any(epoch and float(epoch) > issued_at for epoch in epochs)
+
+
+class RevocationList:
+    """
+    Per-worker copy of the Redis token blacklist and revocation epochs.
+
+    A listener thread subscribes to `BLACKLIST_CHANNEL` and `EPOCH_CHANNEL`, loads every
+    `blacklist:*` and `revoked:*` key once subscribed, then applies each published
+    revocation. While the copy is in sync,
+    a token missing from it is known not to be revoked and needs no Redis round trip.
+    The copy counts as in sync only while the listener has polled within
+    `max_staleness_seconds`, so a stalled or disconnected listener sends callers back to
+    Redis instead of silently missing revocations.
+    """
+
+    def __init__(
+        self,
+        cache: Redis,
+        max_staleness_seconds: float,
+        max_entries: int,
+        poll_seconds: float = 1.0,
+    ):
+        self.cache = cache
+        self.max_staleness_seconds = max_staleness_seconds
+        self.max_entries = max_entries
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._revoked: dict[str, float] = {}
+        self._epochs: dict[str, tuple[float, float]] = {}
+        self._loaded = False
+        self._heartbeat = 0.0
+        self._last_load = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._local_hits = 0
+        self._fallbacks = 0
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="revocation-list", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_seconds + 1)
+        with self._lock:
+            self._loaded = False
+
+    def is_synced(self) -> bool:
+        """Whether the local copy can answer for Redis."""
+        with self._lock:
+            return self._loaded and time.monotonic() - self._heartbeat < self.max_staleness_seconds
+
+    def is_revoked(
+        self,
+        jti: str,
+        session_id: UUID | None = None,
+        user_id: UUID | None = None,
+        issued_at: float = 0.0,
+    ) -> bool | None:
+        """
+        Check a token against the local copy, including its session and user epochs.
+
+        Returns None when the copy is out of sync and the caller must ask Redis.
+        """
+        if not self.is_synced():
+            with self._lock:
+                self._fallbacks += 1
+            return None
+        keys = epoch_keys(session_id, user_id) if session_id and user_id else []
+        now = time.time()
+        with self._lock:
+            self._local_hits += 1
+            expires_at = self._revoked.get(jti)
+            epochs = [self._epochs.get(key) for key in keys]
+        if expires_at is not None and expires_at > now:
+            return True
+        return any(entry and entry[1] > now and entry[0] > issued_at for entry in epochs)
+
+    def add(self, jti: str, expires_at: float) -> None:
+        """
+        Record a revoked token until its expiry (epoch seconds).
+
+        When the copy is full even after dropping expired entries it is discarded, and
+        callers go back to Redis until the listener manages to reload it.
+        """
+        now = time.time()
+        with self._lock:
+            if self._make_room(now) and expires_at > now:
+                self._revoked[jti] = expires_at
+
+    def add_epoch(self, key: str, epoch: float, expires_at: float) -> None:
+        """Record the revocation epoch stored under `key` until `expires_at`."""
+        now = time.time()
+        with self._lock:
+            if self._make_room(now) and expires_at > now:
+                current = self._epochs.get(key)
+                self._epochs[key] = (max(epoch, current[0]) if current else epoch, expires_at)
+
+    def _make_room(self, now: float) -> bool:
+        """Drop expired entries when full; discard the copy if it is still full."""
+        if len(self._revoked) + len(self._epochs) >= self.max_entries:
+            self._revoked = {key: expiry for key, expiry in self._revoked.items() if expiry > now}
+            self._epochs = {key: entry for key, entry in self._epochs.items() if entry[1] > now}
+        if len(self._revoked) + len(self._epochs) >= self.max_entries:
+            logger.warning("Revocation list is full, falling back to Redis")
+            self._revoked = {}
+            self._epochs = {}
+            self._loaded = False
+            return False
+        return True
+
+    def stats(self) -> dict[str, int | bool]:
+        """Snapshot of the local copy and how often it answered for Redis."""
+        synced = self.is_synced()
+        with self._lock:
+            return {
+                "synced": synced,
+                "entries": len(self._revoked) + len(self._epochs),
+                "local_hits": self._local_hits,
+                "fallbacks": self._fallbacks,
+            }
+
+    def _load(self) -> None:
+        """Copy every blacklisted token and revocation epoch from Redis."""
+        self._last_load = time.monotonic()
+        now = time.time()
+        keys = list(self.cache.scan_iter(match=f"{BLACKLIST_PREFIX}*", count=1000))
+        revoked_keys = list(self.cache.scan_iter(match="revoked:*", count=1000))
+        if len(keys) + len(revoked_keys) >= self.max_entries:
+            logger.warning(
+                "Blacklist has %d tokens and %d epochs, too many to hold locally",
+                len(keys),
+                len(revoked_keys),
+            )
+            return
+        pipe = self.cache.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        for key in revoked_keys:
+            pipe.get(key)
+            pipe.ttl(key)
+        results = pipe.execute()
+        revoked = {
+            key.removeprefix(BLACKLIST_PREFIX): now + ttl
+            for key, ttl in zip(keys, results[: len(keys)], strict=True)
+            if ttl > 0
+        }
+        epoch_results = results[len(keys) :]
+        epochs = {
+            # -1: the epoch was stored without expiry
+            key: (float(epoch), now + ttl if ttl >= 0 else math.inf)
+            for key, epoch, ttl in zip(
+                revoked_keys, epoch_results[::2], epoch_results[1::2], strict=True
+            )
+            if epoch and ttl != -2
+        }
+        with self._lock:
+            self._revoked = revoked
+            self._epochs = epochs
+            self._loaded = True
+            self._heartbeat = time.monotonic()
+
+    def _apply(self, channel: str, data: str) -> None:
+        try:
+            if channel == EPOCH_CHANNEL:
+                key, epoch, expires_at = data.rsplit(":", 2)
+                self.add_epoch(key, float(epoch), float(expires_at))
+            else:
+                jti, _, expires_at = data.rpartition(":")
+                self.add(jti, float(expires_at))
+        except ValueError:
+            logger.warning("Ignoring malformed revocation message: %r", data)
+
+    def _listen(self) -> None:
+        while not self._stop.is_set():
+            pubsub = self.cache.pubsub(ignore_subscribe_messages=True)
+            try:
+                # Subscribe before loading so no revocation falls between the two.
+                pubsub.subscribe(BLACKLIST_CHANNEL, EPOCH_CHANNEL)
+                self._load()
+                while not self._stop.is_set():
+                    if (
+                        not self._loaded
+                        and time.monotonic() - self._last_load >= self.max_staleness_seconds
+                    ):
+                        self._load()
+                    message = pubsub.get_message(timeout=self.poll_seconds)
+                    if message and message["type"] == "message":
+                        self._apply(message["channel"], message["data"])
+                    with self._lock:
+                        self._heartbeat = time.monotonic()
+            except RedisError:
+                logger.warning("Revocation listener disconnected, retrying", exc_info=True)
+                with self._lock:
+                    self._loaded = False
+                self._stop.wait(self.poll_seconds)
+            finally:
+                pubsub.close()
+
+
+revocation_list = RevocationList(
+    redis_client,
+    max_staleness_seconds=settings.token_blacklist_max_staleness_seconds,
+    max_entries=settings.token_blacklist_max_entries,
+)
+
+
+def get_revocation_list() -> RevocationList:
+    """Get the per-worker token revocation list."""
+    return revocation_list
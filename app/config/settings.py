@@ -20,14 +20,52 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     db_connection_string: str
+    db_async: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_slow_query_ms: float = 200.0
     cache_connection_string: str
     secret_key: str
     algorithm: str
     access_token_expire_minutes: int
     refresh_token_expire_minutes: int
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 16
+    password_hash_time_cost: int = 3
+    password_hash_memory_cost: int = 65536
+    password_hash_parallelism: int = 4
+    login_throttle_enabled: bool = True
+    login_throttle_ip_capacity: int = 20
+    login_throttle_ip_per_minute: float = 10.0
+    login_throttle_email_capacity: int = 5
+    login_throttle_email_per_minute: float = 1.0
+    trusted_proxy_count: int = 0
+    principal_cache_ttl_seconds: int = 30
+    access_token_account_claims: bool = True
+    token_blacklist_local: bool = True
+    token_blacklist_max_staleness_seconds: float = 5.0
+    token_blacklist_max_entries: int = 100_000
+    job_cache_ttl_seconds: int = 300
+    job_cache_pages: int = 3
+    session_reaper_enabled: bool = True
+    session_reaper_interval_seconds: int = 300
+    session_reaper_batch_size: int = 1000
+    health_probe_timeout_seconds: float = 1.0
+    health_cache_seconds: float = 2.0
+    internal_api_token: str | None = None
 
     model_config = SettingsConfigDict(env_file=".env")
 
+    @property
+    def db_async_connection_string(self) -> str:
+        """Connection string for the async engine (asyncpg / aiosqlite drivers)."""
+        scheme, _, rest = self.db_connection_string.partition("://")
+        driver = "sqlite+aiosqlite" if scheme.startswith("sqlite") else "postgresql+asyncpg"
+        return f"{driver}://{rest}"
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,86 @@
+import math
+import time
+
+from fastapi import HTTPException, status
+from redis import Redis
+
+from app.config.metrics import AUTH_LOGIN_THROTTLED
+
+# KEYS: one bucket per key; ARGV: now, then capacity and refill per second for each key.
+# Takes a token from every bucket, or from none when any of them is empty, and returns
+# whether the attempt is allowed with the milliseconds until it would be.
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local tokens = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = capacity
+    if bucket[1] then
+        local elapsed = math.max(0, now - tonumber(bucket[2]))
+        available = math.min(capacity, tonumber(bucket[1]) + elapsed * rate)
+    end
+    tokens[i] = available
+    if available < 1 then
+        wait = math.max(wait, (1 - available) / rate)
+    end
+end
+if wait > 0 then
+    return {0, math.ceil(wait * 1000)}
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local rate = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', tokens[i] - 1, 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000))
+end
+return {1, 0}
+"""
+
+
+class LoginThrottle:
+    """
+    Token buckets that limit sign-in attempts per client IP and per email.
+
+    Both buckets are checked and drawn from by one Lua script, before the user is looked
+    up or any password is hashed, so a credential-stuffing burst is turned away at the
+    cost of a single Redis round trip instead of an Argon2 verification. A rejected
+    attempt takes no token. Each bucket holds `capacity` attempts and refills at
+    `per_minute`, and its key expires once it would be full again.
+    """
+
+    def __init__(
+        self,
+        cache: Redis,
+        ip_capacity: int,
+        ip_per_minute: float,
+        email_capacity: int,
+        email_per_minute: float,
+    ):
+        self.ip_capacity = ip_capacity
+        self.ip_rate = ip_per_minute / 60
+        self.email_capacity = email_capacity
+        self.email_rate = email_per_minute / 60
+        self._take = cache.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def check(self, client_ip: str, email: str) -> None:
+        """Take an attempt from the IP and email buckets, or raise 429 if either is empty."""
+        allowed, wait_ms = self._take(
+            keys=[f"throttle:signin:ip:{client_ip}", f"throttle:signin:email:{email.lower()}"],
+            args=[
+                time.time(),
+                self.ip_capacity,
+                self.ip_rate,
+                self.email_capacity,
+                self.email_rate,
+            ],
+        )
+        if not allowed:
+            AUTH_LOGIN_THROTTLED.inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many sign-in attempts, please retry later",
+                headers={"Retry-After": str(max(1, math.ceil(int(wait_ms) / 1000)))},
+            )
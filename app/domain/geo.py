@@ -0,0 +1,68 @@
+import math
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 12
+KM_PER_DEGREE = 6371.0 * math.pi / 180
+
+# Upper bound on the number of geohash cells a proximity query may scan.
+MAX_COVERING_CELLS = 16
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a geohash of `precision` characters."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars: list[str] = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, interval = (longitude, lon_range) if even else (latitude, lat_range)
+        mid = (interval[0] + interval[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            interval[0] = mid
+        else:
+            bits <<= 1
+            interval[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """Height and width in degrees of a geohash cell of `precision` characters."""
+    bits = 5 * precision
+    return 180.0 / 2 ** (bits // 2), 360.0 / 2 ** ((bits + 1) // 2)
+
+
+def covering_cells(latitude: float, longitude: float, radius_km: float) -> list[str]:
+    """
+    Geohash prefixes whose cells together cover a circle around a coordinate.
+
+    Uses the finest precision that covers the circle's bounding box with at most
+    `MAX_COVERING_CELLS` cells, so a query scans few, tight index ranges.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE
+    lon_delta = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+    min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+    min_lon, max_lon = longitude - lon_delta, longitude + lon_delta
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = _cell_size(precision)
+        rows = range(math.floor((min_lat + 90) / height), math.floor((max_lat + 90) / height) + 1)
+        cols = range(math.floor((min_lon + 180) / width), math.floor((max_lon + 180) / width) + 1)
+        if len(rows) * len(cols) > MAX_COVERING_CELLS and precision > 1:
+            continue
+        cells = set()
+        for row in rows:
+            cell_lat = min(-90 + (row + 0.5) * height, 90 - height / 2)
+            for col in cols:
+                cell_lon = (-180 + (col + 0.5) * width + 180) % 360 - 180
+                cells.add(encode_geohash(cell_lat, cell_lon, precision))
+        return sorted(cells)
+    return []
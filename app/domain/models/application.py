@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Column, Enum, Field, Relationship, SQLModel
 
 from app.domain.models.fields import created_at_field, updated_at_field
@@ -23,7 +23,11 @@ class ApplicationStatus(str, enum.Enum):
 class Application(SQLModel, table=True):
     """Application model: a Droner applies to a Job posted by an Account."""
 
-    __table_args__ = (UniqueConstraint("job_id", "account_id", name="uix_application_job_account"),)
+    __table_args__ = (
+        UniqueConstraint("job_id", "account_id", name="uix_application_job_account"),
+        Index("ix_application_job_id_created_at_id", "job_id", "created_at", "id"),
+        Index("ix_application_account_id_created_at_id", "account_id", "created_at", "id"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
     job_id: uuid.UUID = Field(foreign_key="job.id", index=True)
@@ -46,3 +50,26 @@ class ApplicationCreate(SQLModel):
 class ApplicationUpdate(SQLModel):
     status: ApplicationStatus | None = None
     message: str | None = None
+
+
+class ApplicationBatchOutcome(str, enum.Enum):
+    UPDATED = "UPDATED"
+    NOT_FOUND = "NOT_FOUND"
+
+
+class ApplicationBatchResult(SQLModel):
+    """Outcome of one status transition of a batch update."""
+
+    application_id: uuid.UUID
+    status: ApplicationStatus
+    outcome: ApplicationBatchOutcome
+    updated_at: datetime | None = None
+
+
+class ApplicationCounts(SQLModel):
+    """Number of applications of a job in each status."""
+
+    pending: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    withdrawn: int = 0
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.domain.models.fields import created_at_field
@@ -14,6 +15,11 @@ if TYPE_CHECKING:
 class Favorite(SQLModel, table=True):
     """Favorite model."""
 
+    __table_args__ = (
+        UniqueConstraint("account_id", "job_id", name="uix_favorite_account_job"),
+        Index("ix_favorite_account_id_created_at_id", "account_id", "created_at", "id"),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
     job_id: uuid.UUID = Field(foreign_key="job.id", index=True)
     account_id: uuid.UUID = Field(foreign_key="account.id", index=True)
@@ -2,8 +2,11 @@ import uuid
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel, CheckConstraint
+from sqlalchemy import ColumnElement, Index, text
+from sqlalchemy.orm import Mapped
+from sqlmodel import CheckConstraint, Field, Relationship, SQLModel, func
 
+from app.domain.geo import GEOHASH_PRECISION
 from app.domain.models.fields import created_at_field, updated_at_field
 
 if TYPE_CHECKING:
@@ -18,6 +21,7 @@ class Job(SQLModel, table=True):
     __table_args__ = (
         CheckConstraint("budget >= 0", name="chk_budget_non_negative"),
         CheckConstraint("end_date >= start_date", name="chk_end_date_after_start_date"),
+        Index("ix_job_created_at_id", "created_at", "id"),
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
@@ -26,6 +30,9 @@ class Job(SQLModel, table=True):
     description: str
     budget: float
     location: str
+    latitude: float | None = None
+    longitude: float | None = None
+    geohash: str | None = Field(default=None, max_length=GEOHASH_PRECISION, index=True)
     start_date: date
     end_date: date
     created_at: datetime = created_at_field()
@@ -36,6 +43,34 @@ class Job(SQLModel, table=True):
     favorites: list["Favorite"] = Relationship(back_populates="job")
 
 
+JOB_SEARCH_CONFIG = "simple"
+
+
+def job_search_document(
+    title: ColumnElement[str] | Mapped[str], description: ColumnElement[str] | Mapped[str]
+):
+    """Weighted Postgres `tsvector` over a job's title (A) and description (B)."""
+    # Inlined literals keep the expression identical to the index definition regardless of
+    # how the driver binds parameters, so the planner can match it.
+    config = text(f"'{JOB_SEARCH_CONFIG}'::regconfig")
+    return func.setweight(func.to_tsvector(config, title), text("'A'")).op("||")(
+        func.setweight(func.to_tsvector(config, description), text("'B'"))
+    )
+
+
+def job_search_query(query: str):
+    """Postgres `tsquery` for free-form user input, in the job search configuration."""
+    return func.websearch_to_tsquery(text(f"'{JOB_SEARCH_CONFIG}'::regconfig"), query)
+
+
+# Expression index backing full-text search; the query must use the same expression.
+Index(
+    "ix_job_search_document",
+    job_search_document(Job.__table__.c.title, Job.__table__.c.description),  # type: ignore[attr-defined]
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
+
+
 class JobUpdate(SQLModel):
     """Job update model."""
 
@@ -48,5 +83,7 @@ class JobUpdate(SQLModel):
     description: str | None = None
     budget: float | None = None
     location: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
     start_date: date | None = None
     end_date: date | None = None
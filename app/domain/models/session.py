@@ -2,6 +2,7 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.domain.models.fields import created_at_field, updated_at_field
@@ -14,6 +15,16 @@ class UserSession(SQLModel, table=True):
     """User session model."""
 
     __tablename__ = "session"
+    __table_args__ = (
+        # Only active sessions are ever reaped, so the reaper's scan stays proportional to
+        # the live sessions rather than the whole history.
+        Index(
+            "ix_session_active_expires_at",
+            "expires_at",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, index=True)
     user_id: uuid.UUID = Field(foreign_key="user.id", index=True)
@@ -0,0 +1,142 @@
+import base64
+import binascii
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Protocol, TypeVar
+from uuid import UUID
+
+import orjson
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Keyed(Protocol):
+    """A row that can be paginated on `(created_at, id)`."""
+
+    id: UUID
+    created_at: datetime
+
+
+T = TypeVar("T")
+
+
+def _encode_token(values: list[Any]) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(values)).rstrip(b"=").decode()
+
+
+def _decode_token(token: str) -> list[Any]:
+    values = orjson.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after the last row of a page ordered by `(created_at, id)` descending."""
+
+    created_at: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        return _encode_token([self.created_at.isoformat(), str(self.id)])
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Decode a token produced by `encode`, raising ValueError if it is malformed."""
+        try:
+            created_at, id_ = _decode_token(token)
+            return cls(created_at=datetime.fromisoformat(created_at), id=UUID(id_))
+        except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    def after(self, created_at: Any, id_: Any) -> ColumnElement[bool]:
+        """Keyset predicate selecting the rows that follow this cursor."""
+        return tuple_(created_at, id_) < (self.created_at, self.id)
+
+
+@dataclass(frozen=True)
+class DistanceCursor:
+    """Position after the last row of a page ordered by `(distance, id)` ascending."""
+
+    distance: float
+    id: UUID
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        return _encode_token([self.distance, str(self.id)])
+
+    @classmethod
+    def decode(cls, token: str) -> "DistanceCursor":
+        """Decode a token produced by `encode`, raising ValueError if it is malformed."""
+        try:
+            distance, id_ = _decode_token(token)
+            return cls(distance=float(distance), id=UUID(id_))
+        except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    def after(self, distance: Any, id_: Any) -> ColumnElement[bool]:
+        """Keyset predicate selecting the rows that follow this cursor."""
+        return tuple_(distance, id_) > (self.distance, self.id)
+
+
+def _created_at_cursor(row: Keyed) -> str:
+    return Cursor(row.created_at, row.id).encode()
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """A page of rows and the cursor of the next page, if there is one."""
+
+    items: Sequence[T]
+    next_cursor: str | None
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[T],
+        limit: int,
+        cursor_for: Callable[[T], str] = _created_at_cursor,  # type: ignore[assignment]
+    ) -> "Page[T]":
+        """
+        Build a page from up to `limit + 1` rows; the extra row signals a next page.
+
+        `cursor_for` encodes the cursor of a row; by default rows are keyed on
+        `(created_at, id)`.
+        """
+        if len(rows) <= limit:
+            return cls(items=rows, next_cursor=None)
+        items = rows[:limit]
+        return cls(items=items, next_cursor=cursor_for(items[-1]))
+
+    def headers(self) -> dict[str, str]:
+        """Response headers advertising the next page cursor, if there is one."""
+        return {NEXT_CURSOR_HEADER: self.next_cursor} if self.next_cursor else {}
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def parse_cursor(token: str | None) -> Cursor | None:
+    """Decode a client supplied cursor, rejecting malformed tokens with 400."""
+    if token is None:
+        return None
+    try:
+        return Cursor.decode(token)
+    except ValueError as e:
+        raise _invalid_cursor() from e
+
+
+def parse_distance_cursor(token: str | None) -> DistanceCursor | None:
+    """Decode a client supplied distance cursor, rejecting malformed tokens with 400."""
+    if token is None:
+        return None
+    try:
+        return DistanceCursor.decode(token)
+    except ValueError as e:
+        raise _invalid_cursor() from e
@@ -1,8 +1,11 @@
 from app.domain.repositories.account import AccountRepository
 from app.domain.repositories.application import ApplicationRepository
 from app.domain.repositories.auth import AuthRepository
+from app.domain.repositories.cached_job import CachedJobRepository
 from app.domain.repositories.favorite import FavoriteRepository
 from app.domain.repositories.job import JobRepository
+from app.domain.repositories.principal import PrincipalRepository
+from app.domain.repositories.refresh import RefreshTokenRepository
 from app.domain.repositories.session import SessionRepository
 from app.domain.repositories.user import UserRepository
 
@@ -10,8 +13,11 @@ __all__ = [
     "UserRepository",
     "AuthRepository",
     "JobRepository",
+    "CachedJobRepository",
     "AccountRepository",
     "SessionRepository",
     "FavoriteRepository",
     "ApplicationRepository",
+    "PrincipalRepository",
+    "RefreshTokenRepository",
 ]
@@ -1,47 +1,88 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import Session, select
+from redis.client import Redis
+from sqlalchemy import case, cast, literal, update
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, col, desc, select
 
-from app.domain.models.application import Application, ApplicationUpdate
+from app.domain.models.application import Application, ApplicationStatus, ApplicationUpdate
+from app.domain.pagination import Cursor
+from app.domain.repositories.cached_job import application_counts_version_key
 from app.domain.repositories.interfaces.application import IApplicationRepository
 
 
 class ApplicationRepository(IApplicationRepository):
-    def __init__(self, session: Session):
+    """
+    Application repository.
+
+    Given the cache, every write bumps the version of its job's cached application counts
+    once committed (see `CachedJobRepository`), so no caller can leave stale counts behind.
+    """
+
+    def __init__(self, session: Session, cache: Redis | None = None):
         self.session = session
+        self.cache = cache
+
+    def _invalidate_counts(self, job_id: UUID) -> None:
+        if self.cache is not None:
+            self.cache.incr(application_counts_version_key(job_id))
 
     def create(self, application: Application) -> Application:
         """Create a new application entry in the database."""
         self.session.add(application)
         self.session.commit()
         self.session.refresh(application)
+        self._invalidate_counts(application.job_id)
         return application
 
     def get_by_id(self, application_id: UUID) -> Application | None:
         """Retrieve an application by ID."""
         return self.session.get(Application, application_id)
 
+    @staticmethod
+    def _page(statement, offset: int, limit: int, cursor: Cursor | None):
+        """Order newest first and apply keyset and offset/limit pagination."""
+        if cursor:
+            statement = statement.where(
+                cursor.after(col(Application.created_at), col(Application.id))
+            )
+        return (
+            statement.order_by(desc(Application.created_at), desc(Application.id))
+            .offset(offset)
+            .limit(limit)
+        )
+
     def get_by_job_id(
-        self, job_id: UUID, offset: int = 0, limit: int = 100
+        self, job_id: UUID, offset: int = 0, limit: int = 100, cursor: Cursor | None = None
     ) -> Sequence[Application]:
-        """List applications for a given job."""
-        statement = (
-            select(Application).where(Application.job_id == job_id).offset(offset).limit(limit)
-        )
-        return list(self.session.exec(statement).all())
+        """List applications for a given job, newest first."""
+        statement = select(Application).where(Application.job_id == job_id)
+        return list(self.session.exec(self._page(statement, offset, limit, cursor)).all())
 
     def get_by_account_id(
-        self, account_id: UUID, offset: int = 0, limit: int = 100
+        self,
+        account_id: UUID,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Cursor | None = None,
+        status: ApplicationStatus | None = None,
+        include_job: bool = False,
     ) -> Sequence[Application]:
-        """List applications submitted by an account."""
-        statement = (
-            select(Application)
-            .where(Application.account_id == account_id)
-            .offset(offset)
-            .limit(limit)
-        )
-        return list(self.session.exec(statement).all())
+        """
+        List applications submitted by an account, newest first.
+
+        With `include_job`, each application's job is loaded by the same query through a
+        JOIN, so reading `application.job` issues no further statements.
+        """
+        statement = select(Application).where(Application.account_id == account_id)
+        if status is not None:
+            statement = statement.where(Application.status == status)
+        if include_job:
+            job = joinedload(Application.job, innerjoin=True)  # type: ignore[arg-type]
+            statement = statement.options(job)
+        return list(self.session.exec(self._page(statement, offset, limit, cursor)).all())
 
     def get_by_job_and_account(self, job_id: UUID, account_id: UUID) -> Application | None:
         """Get an application by job_id and account_id, if it exists."""
@@ -60,13 +101,40 @@ class ApplicationRepository(IApplicationRepository):
         self.session.add(db_app)
         self.session.commit()
         self.session.refresh(db_app)
+        self._invalidate_counts(db_app.job_id)
         return db_app
 
+    def update_statuses(
+        self, job_id: UUID, statuses: Mapping[UUID, ApplicationStatus]
+    ) -> dict[UUID, datetime]:
+        """Set the status of several applications of a job in a single UPDATE."""
+        status_type = Application.__table__.c.status.type  # type: ignore[attr-defined]
+        new_status = case(
+            {
+                application_id: cast(literal(value, status_type), status_type)
+                for application_id, value in statuses.items()
+            },
+            value=col(Application.id),
+        )
+        statement = (
+            update(Application)
+            .where(col(Application.job_id) == job_id, col(Application.id).in_(list(statuses)))
+            .values(status=new_status)
+            .returning(col(Application.id), col(Application.updated_at))
+            .execution_options(synchronize_session=False)
+        )
+        updated = dict(self.session.exec(statement).all())
+        self.session.commit()
+        if updated:
+            self._invalidate_counts(job_id)
+        return updated
+
     def delete(self, application_id: UUID) -> bool:
         """Delete (withdraw) an application by ID."""
         db_app = self.get_by_id(application_id)
         if db_app:
             self.session.delete(db_app)
             self.session.commit()
+            self._invalidate_counts(db_app.job_id)
             return True
         return False
@@ -3,7 +3,9 @@ from datetime import UTC, datetime, timedelta
 
 import jwt
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.config.hashing import PasswordHasherPool
 from app.config.settings import Settings
 from app.domain.repositories.interfaces.auth import IAuthRepository, JwtTokenType
 
@@ -11,25 +13,47 @@ from app.domain.repositories.interfaces.auth import IAuthRepository, JwtTokenTyp
 class AuthRepository(IAuthRepository):
     """Auth repository."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, hasher_pool: PasswordHasherPool | None = None):
         self.settings = settings
-        self.hasher = PasswordHash.recommended()
+        self.hasher = PasswordHash(
+            (
+                Argon2Hasher(
+                    time_cost=settings.password_hash_time_cost,
+                    memory_cost=settings.password_hash_memory_cost,
+                    parallelism=settings.password_hash_parallelism,
+                ),
+            )
+        )
+        self.hasher_pool = hasher_pool
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.hasher.verify(plain_password, hashed_password)
+        if self.hasher_pool is None:
+            return self.hasher.verify(plain_password, hashed_password)
+        return self.hasher_pool.run(self.hasher.verify, plain_password, hashed_password)
+
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        if self.hasher_pool is None:
+            return self.hasher.verify_and_update(plain_password, hashed_password)
+        return self.hasher_pool.run(self.hasher.verify_and_update, plain_password, hashed_password)
 
     def hash_password(self, plain_password: str) -> str:
-        return self.hasher.hash(plain_password)
+        if self.hasher_pool is None:
+            return self.hasher.hash(plain_password)
+        return self.hasher_pool.run(self.hasher.hash, plain_password)
 
     def decode_token(self, token: str) -> dict:
         """Decode a token and return raw payload dictionary."""
         return jwt.decode(token, self.settings.secret_key, algorithms=[self.settings.algorithm])  # type: ignore[no-any-return]
 
-    def create_token(self, data: dict) -> tuple[str, str, datetime]:
+    def create_token(
+        self, data: dict, access_claims: dict | None = None, refresh_jti: str | None = None
+    ) -> tuple[str, str, datetime]:
         iat = datetime.now(UTC)
 
         access_token_jti = str(uuid.uuid4())
-        refresh_token_jti = str(uuid.uuid4())
+        refresh_token_jti = refresh_jti or str(uuid.uuid4())
 
         access_token_exp = iat + timedelta(minutes=self.settings.access_token_expire_minutes)
         refresh_token_exp = iat + timedelta(minutes=self.settings.refresh_token_expire_minutes)
@@ -37,9 +61,11 @@ class AuthRepository(IAuthRepository):
         access_token = jwt.encode(
             {
                 **data,
+                **(access_claims or {}),
                 "jti": access_token_jti,
                 "type": JwtTokenType.ACCESS,
-                "iat": iat,
+                # Sub-second precision, to compare with revocation epochs
+                "iat": iat.timestamp(),
                 "exp": access_token_exp,
             },
             self.settings.secret_key,
@@ -51,7 +77,7 @@ class AuthRepository(IAuthRepository):
                 **data,
                 "jti": refresh_token_jti,
                 "type": JwtTokenType.REFRESH,
-                "iat": iat,
+                "iat": iat.timestamp(),
                 "exp": refresh_token_exp,
             },
             self.settings.secret_key,
@@ -0,0 +1,205 @@
+import threading
+from collections.abc import Sequence
+from typing import cast
+from uuid import UUID
+
+import orjson
+from redis.client import Redis
+
+from app.domain.models.application import ApplicationCounts
+from app.domain.models.job import Job, JobUpdate
+from app.domain.pagination import Cursor, DistanceCursor
+from app.domain.repositories.interfaces.job import IJobRepository
+
+
+class JobCacheStats:
+    """Process-wide hit/miss counters of the job cache."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def record(self, hit: bool) -> None:
+        """Count one cache lookup."""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict[str, float]:
+        """Snapshot of the counters and the hit ratio."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+job_cache_stats = JobCacheStats()
+
+
+def application_counts_version_key(job_id: UUID) -> str:
+    """Version of a job's cached application counts, bumped by every application write."""
+    return f"jobs:{job_id}:applications:version"
+
+
+class CachedJobRepository(IJobRepository):
+    """
+    Read-through Redis cache in front of a job repository.
+
+    Job details, the first `pages` offset pages of the listing and the application counts
+    of each job are cached as orjson payloads. Keys embed a version counter (one per job,
+    one per job's applications, one for the listing) that every write increments, so a
+    payload read from the database before a write can only ever be stored under a version
+    nobody reads any more. Application counts are versioned by `ApplicationRepository`,
+    which increments them whenever it writes an application.
+    """
+
+    LIST_VERSION_KEY = "jobs:list:version"
+
+    def __init__(
+        self,
+        repository: IJobRepository,
+        cache: Redis,
+        ttl_seconds: int,
+        pages: int,
+        stats: JobCacheStats = job_cache_stats,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.pages = pages
+        self.stats = stats
+
+    @staticmethod
+    def _job_version_key(job_id: UUID) -> str:
+        return f"jobs:{job_id}:version"
+
+    def _get(self, key: str) -> str | None:
+        # The client decodes responses, so values come back as str
+        return cast(str | None, self.cache.get(key))
+
+    @staticmethod
+    def _dumps(jobs: Sequence[Job]) -> bytes:
+        return orjson.dumps([job.model_dump(mode="json") for job in jobs])
+
+    @staticmethod
+    def _loads(payload: str) -> list[Job]:
+        return [Job.model_validate(data) for data in orjson.loads(payload)]
+
+    def _invalidate(self, job_id: UUID | None = None) -> None:
+        pipe = self.cache.pipeline(transaction=False)
+        pipe.incr(self.LIST_VERSION_KEY)
+        if job_id is not None:
+            pipe.incr(self._job_version_key(job_id))
+        pipe.execute()
+
+    def create(self, job: Job) -> Job:
+        """Create a new job entry in the database."""
+        created = self.repository.create(job)
+        self._invalidate()
+        return created
+
+    def get_by_id(self, job_id: UUID) -> Job | None:
+        """Retrieve a job entry by ID, from the cache when possible."""
+        version = self._get(self._job_version_key(job_id)) or "0"
+        key = f"jobs:{job_id}:v{version}"
+        cached = self._get(key)
+        self.stats.record(hit=cached is not None)
+        if cached is not None:
+            jobs = self._loads(cached)
+            return jobs[0] if jobs else None
+
+        job = self.repository.get_by_id(job_id)
+        self.cache.set(key, self._dumps([job] if job else []), ex=self.ttl_seconds)
+        return job
+
+    def get_all(
+        self, offset: int = 0, limit: int = 100, cursor: Cursor | None = None
+    ) -> Sequence[Job]:
+        """Retrieve all job entries, serving the first pages from the cache."""
+        if cursor is not None or offset >= self.pages * limit:
+            return self.repository.get_all(offset=offset, limit=limit, cursor=cursor)
+
+        version = self._get(self.LIST_VERSION_KEY) or "0"
+        key = f"jobs:list:v{version}:{offset}:{limit}"
+        cached = self._get(key)
+        self.stats.record(hit=cached is not None)
+        if cached is not None:
+            return self._loads(cached)
+
+        jobs = self.repository.get_all(offset=offset, limit=limit)
+        self.cache.set(key, self._dumps(jobs), ex=self.ttl_seconds)
+        return jobs
+
+    def search(
+        self, query: str, location: str | None = None, offset: int = 0, limit: int = 100
+    ) -> Sequence[Job]:
+        """Search jobs by keyword, best matches first."""
+        return self.repository.search(query, location=location, offset=offset, limit=limit)
+
+    def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100,
+        cursor: DistanceCursor | None = None,
+    ) -> Sequence[tuple[Job, float]]:
+        """Retrieve jobs near a coordinate, nearest first, with squared distances in km²."""
+        return self.repository.get_nearby(
+            latitude, longitude, radius_km, limit=limit, cursor=cursor
+        )
+
+    def update(self, job_id: UUID, job: JobUpdate) -> Job | None:
+        """Update an existing job entry."""
+        updated = self.repository.update(job_id, job)
+        self._invalidate(job_id)
+        return updated
+
+    def delete(self, job_id: UUID) -> bool:
+        """Delete a job entry by ID."""
+        deleted = self.repository.delete(job_id)
+        self._invalidate(job_id)
+        return deleted
+
+    def get_total_applications(self, job_id: UUID) -> int:
+        """Get the total number of applications for a job."""
+        return self.repository.get_total_applications(job_id)
+
+    def get_application_counts(self, job_ids: Sequence[UUID]) -> dict[UUID, ApplicationCounts]:
+        """
+        Get the number of applications per status of each job, from the cache when possible.
+
+        One MGET reads the versions and another the cached counts; the jobs that missed are
+        counted together with a single query and cached.
+        """
+        if not job_ids:
+            return {}
+        versions = cast(
+            list[str | None],
+            self.cache.mget([application_counts_version_key(job_id) for job_id in job_ids]),
+        )
+        keys = {
+            job_id: f"jobs:{job_id}:applications:v{version or '0'}"
+            for job_id, version in zip(job_ids, versions, strict=True)
+        }
+        counts: dict[UUID, ApplicationCounts] = {}
+        for job_id, cached in zip(keys, self.cache.mget(list(keys.values())), strict=True):
+            self.stats.record(hit=cached is not None)
+            if cached is not None:
+                counts[job_id] = ApplicationCounts.model_validate(orjson.loads(cached))
+
+        missing = [job_id for job_id in keys if job_id not in counts]
+        if missing:
+            loaded = self.repository.get_application_counts(missing)
+            pipe = self.cache.pipeline(transaction=False)
+            for job_id, job_counts in loaded.items():
+                pipe.set(keys[job_id], orjson.dumps(job_counts.model_dump()), ex=self.ttl_seconds)
+            pipe.execute()
+            counts.update(loaded)
+        return {job_id: counts[job_id] for job_id in job_ids}
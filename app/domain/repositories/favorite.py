@@ -1,9 +1,12 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import joinedload
+from sqlmodel import Session, col, desc, select
 
 from app.domain.models.favorite import Favorite
+from app.domain.pagination import Cursor
 from app.domain.repositories.interfaces.favorite import IFavoriteRepository
 
 
@@ -15,21 +18,63 @@ class FavoriteRepository(IFavoriteRepository):
         self.session = session
 
     def create(self, favorite: Favorite) -> Favorite:
-        """Create a new favorite entry in the database."""
-        self.session.add(favorite)
+        """
+        Create a favorite, or return the existing one if the account already favorited the job.
+
+        The row is written with `INSERT ... ON CONFLICT DO NOTHING` on the
+        `(account_id, job_id)` unique constraint, so concurrent or repeated requests never
+        duplicate it and never fail. Every column is populated client-side, so a new row is
+        not read back; only a conflicting request loads the existing one.
+        """
+        dialect = postgresql if self.session.get_bind().dialect.name == "postgresql" else sqlite
+        statement = (
+            dialect.insert(Favorite)
+            .values(favorite.model_dump())
+            .on_conflict_do_nothing(index_elements=["account_id", "job_id"])
+        )
+        inserted = self.session.exec(statement).rowcount
         self.session.commit()
-        self.session.refresh(favorite)
-        return favorite
+        if inserted:
+            return favorite
+        existing = select(Favorite).where(
+            Favorite.account_id == favorite.account_id, Favorite.job_id == favorite.job_id
+        )
+        return self.session.exec(existing).one()
 
     def get_by_id(self, favorite_id: UUID) -> Favorite | None:
         """Retrieve a favorite entry by ID."""
         return self.session.get(Favorite, favorite_id)
 
-    def get_by_account_id(self, account_id: UUID) -> Sequence[Favorite]:
-        """Retrieve favorite entries by Account ID."""
+    def get_by_account_id(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: Cursor | None = None,
+        include_job: bool = False,
+    ) -> Sequence[Favorite]:
+        """
+        Retrieve favorite entries by Account ID, newest first.
+
+        With `include_job`, each favorite's job is loaded by the same query through a JOIN.
+        """
         statement = select(Favorite).where(Favorite.account_id == account_id)
+        if include_job:
+            job = joinedload(Favorite.job, innerjoin=True)  # type: ignore[arg-type]
+            statement = statement.options(job)
+        if cursor:
+            statement = statement.where(cursor.after(col(Favorite.created_at), col(Favorite.id)))
+        statement = statement.order_by(desc(Favorite.created_at), desc(Favorite.id)).limit(limit)
         return self.session.exec(statement).all()
 
+    def get_favorited_job_ids(self, account_id: UUID, job_ids: Sequence[UUID]) -> set[UUID]:
+        """Return which of `job_ids` the account has favorited, from the unique index alone."""
+        if not job_ids:
+            return set()
+        statement = select(Favorite.job_id).where(
+            Favorite.account_id == account_id, col(Favorite.job_id).in_(job_ids)
+        )
+        return set(self.session.exec(statement).all())
+
     def get_all(self, offset: int = 0, limit: int = 100) -> Sequence[Favorite]:
         """Retrieve all favorite entries."""
         return self.session.exec(select(Favorite).offset(offset).limit(limit)).all()
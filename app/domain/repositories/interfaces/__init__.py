@@ -3,6 +3,8 @@ from app.domain.repositories.interfaces.application import IApplicationRepositor
 from app.domain.repositories.interfaces.auth import IAuthRepository
 from app.domain.repositories.interfaces.favorite import IFavoriteRepository
 from app.domain.repositories.interfaces.job import IJobRepository
+from app.domain.repositories.interfaces.principal import IPrincipalRepository
+from app.domain.repositories.interfaces.refresh import IRefreshTokenRepository
 from app.domain.repositories.interfaces.session import ISessionRepository
 from app.domain.repositories.interfaces.user import IUserRepository
 
@@ -14,4 +16,6 @@ __all__ = [
     "ISessionRepository",
     "IFavoriteRepository",
     "IApplicationRepository",
+    "IPrincipalRepository",
+    "IRefreshTokenRepository",
 ]
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from datetime import datetime
 from uuid import UUID
 
-from app.domain.models.application import Application, ApplicationUpdate
+from app.domain.models.application import Application, ApplicationStatus, ApplicationUpdate
+from app.domain.pagination import Cursor
 
 
 class IApplicationRepository(ABC):
@@ -15,12 +17,25 @@ class IApplicationRepository(ABC):
         """Retrieve an application by ID."""
 
     @abstractmethod
-    def get_by_job_id(self, job_id: UUID, offset: int, limit: int) -> Sequence[Application]:
-        """List applications for a given job."""
+    def get_by_job_id(
+        self, job_id: UUID, offset: int, limit: int, cursor: Cursor | None = None
+    ) -> Sequence[Application]:
+        """List applications for a given job, newest first, starting after `cursor` if given."""
 
     @abstractmethod
-    def get_by_account_id(self, account_id: UUID, offset: int, limit: int) -> Sequence[Application]:
-        """List applications submitted by an account."""
+    def get_by_account_id(
+        self,
+        account_id: UUID,
+        offset: int,
+        limit: int,
+        cursor: Cursor | None = None,
+        status: ApplicationStatus | None = None,
+        include_job: bool = False,
+    ) -> Sequence[Application]:
+        """
+        List applications submitted by an account, newest first, after `cursor` if given,
+        optionally only those in `status` and with their job loaded in the same query.
+        """
 
     @abstractmethod
     def get_by_job_and_account(self, job_id: UUID, account_id: UUID) -> Application | None:
@@ -30,6 +45,17 @@ class IApplicationRepository(ABC):
     def update(self, application_id: UUID, application: ApplicationUpdate) -> Application | None:
         """Update an existing application entry."""
 
+    @abstractmethod
+    def update_statuses(
+        self, job_id: UUID, statuses: Mapping[UUID, ApplicationStatus]
+    ) -> dict[UUID, datetime]:
+        """
+        Set the status of several applications of a job in a single UPDATE.
+
+        Returns the `updated_at` of every application that was updated; ids that do not
+        belong to the job are left out.
+        """
+
     @abstractmethod
     def delete(self, application_id: UUID) -> bool:
         """Delete an application by ID."""
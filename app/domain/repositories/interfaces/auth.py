@@ -5,6 +5,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from app.domain.models.account import AccountType
+
 
 class JwtTokenType(str, enum.Enum):
     """Token type enum."""
@@ -21,9 +23,12 @@ class JwtTokenPayload(BaseModel):
     sub: UUID
     sid: UUID
     type: JwtTokenType
-    iat: datetime | int  # JWT returns int timestamps
+    iat: datetime | int | float  # JWT returns numeric timestamps
     exp: datetime | int  # JWT returns int timestamps
     jti: str
+    # Optional access token claims: the user's active accounts and their claims version
+    acc: dict[UUID, AccountType] | None = None
+    ver: int | None = None
 
     @field_validator("sub", "sid", mode="before")
     @classmethod
@@ -45,9 +50,14 @@ class JwtTokenPayload(BaseModel):
     @property
     def iat_timestamp(self) -> int:
         """Get issued at as Unix timestamp."""
+        return int(self.issued_at)
+
+    @property
+    def issued_at(self) -> float:
+        """Get issued at as a Unix timestamp with sub-second precision."""
         if isinstance(self.iat, datetime):
-            return int(self.iat.timestamp())
-        return self.iat
+            return self.iat.timestamp()
+        return float(self.iat)
 
 
 class IAuthRepository(ABC):
@@ -57,6 +67,15 @@ class IAuthRepository(ABC):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password."""
 
+    @abstractmethod
+    def verify_and_update_password(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verify a password and, if its hash was made with other parameters than the current
+        ones, return a new hash of it.
+        """
+
     @abstractmethod
     def hash_password(self, plain_password: str) -> str:
         """Hash a plain text password."""
@@ -66,5 +85,12 @@ class IAuthRepository(ABC):
         """Decode a token and return raw payload dictionary."""
 
     @abstractmethod
-    def create_token(self, data: dict) -> tuple[str, str, datetime]:
-        """Create access and refresh tokens for a user. Returns a tuple of (access_token, refresh_token, refresh_token_exp)."""
+    def create_token(
+        self, data: dict, access_claims: dict | None = None, refresh_jti: str | None = None
+    ) -> tuple[str, str, datetime]:
+        """
+        Create access and refresh tokens for a user. Returns a tuple of (access_token, refresh_token, refresh_token_exp).
+
+        `access_claims` are added to the access token only. `refresh_jti` sets the refresh
+        token's jti instead of a random one.
+        """
@@ -3,20 +3,34 @@ from collections.abc import Sequence
 from uuid import UUID
 
 from app.domain.models.favorite import Favorite
+from app.domain.pagination import Cursor
 
 
 class IFavoriteRepository(ABC):
     @abstractmethod
     def create(self, favorite: Favorite) -> Favorite:
-        """Create a new favorite entry in the database."""
+        """Create a favorite, or return the existing one for the same account and job."""
 
     @abstractmethod
     def get_by_id(self, favorite_id: UUID) -> Favorite | None:
         """Retrieve a favorite entry by ID."""
 
     @abstractmethod
-    def get_by_account_id(self, account_id: UUID) -> Sequence[Favorite]:
-        """Retrieve favorite entries by Account ID."""
+    def get_by_account_id(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: Cursor | None = None,
+        include_job: bool = False,
+    ) -> Sequence[Favorite]:
+        """
+        Retrieve favorite entries by Account ID, newest first, starting after `cursor`,
+        optionally with their job loaded in the same query.
+        """
+
+    @abstractmethod
+    def get_favorited_job_ids(self, account_id: UUID, job_ids: Sequence[UUID]) -> set[UUID]:
+        """Return which of `job_ids` the account has favorited."""
 
     @abstractmethod
     def get_all(self, offset: int, limit: int) -> Sequence[Favorite]:
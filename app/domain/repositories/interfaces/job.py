@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from uuid import UUID
 
+from app.domain.models.application import ApplicationCounts
 from app.domain.models.job import Job, JobUpdate
+from app.domain.pagination import Cursor, DistanceCursor
 
 
 class IJobRepository(ABC):
@@ -15,8 +17,25 @@ class IJobRepository(ABC):
         """Retrieve a job entry by ID."""
 
     @abstractmethod
-    def get_all(self, offset: int, limit: int) -> Sequence[Job]:
-        """Retrieve all job entries."""
+    def get_all(self, offset: int, limit: int, cursor: Cursor | None = None) -> Sequence[Job]:
+        """Retrieve all job entries, newest first, starting after `cursor` if given."""
+
+    @abstractmethod
+    def search(
+        self, query: str, location: str | None = None, offset: int = 0, limit: int = 100
+    ) -> Sequence[Job]:
+        """Search jobs by keyword, best matches first."""
+
+    @abstractmethod
+    def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100,
+        cursor: DistanceCursor | None = None,
+    ) -> Sequence[tuple[Job, float]]:
+        """Retrieve jobs near a coordinate, nearest first, with squared distances in km²."""
 
     @abstractmethod
     def update(self, job_id: UUID, job: JobUpdate) -> Job | None:
@@ -29,3 +48,7 @@ class IJobRepository(ABC):
     @abstractmethod
     def get_total_applications(self, job_id: UUID) -> int:
         """Get the total number of applications for a job."""
+
+    @abstractmethod
+    def get_application_counts(self, job_ids: Sequence[UUID]) -> dict[UUID, ApplicationCounts]:
+        """Get the number of applications per status of each job."""
@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.models.account import Account
+from app.domain.models.session import UserSession
+from app.domain.models.user import User
+from app.domain.repositories.interfaces.auth import JwtTokenPayload
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Validated session, user and account behind an authenticated request."""
+
+    session: UserSession
+    user: User
+    account: Account
+
+
+@dataclass(frozen=True)
+class PrincipalLookup:
+    """Result of a principal cache lookup: token revocation status and cached principal."""
+
+    revoked: bool
+    principal: Principal | None
+
+
+@dataclass(frozen=True)
+class VersionLookup:
+    """Result of a claims version lookup: token revocation status and the user's version."""
+
+    revoked: bool
+    version: int
+
+
+class IPrincipalRepository(ABC):
+    """Authenticated principal cache interface."""
+
+    @abstractmethod
+    def lookup(
+        self, token: JwtTokenPayload | None, session_id: UUID, account_id: UUID
+    ) -> PrincipalLookup:
+        """
+        Check whether the token is revoked and fetch the cached principal in one round trip.
+
+        Pass `token=None` to skip the revocation check when it was already answered locally.
+        """
+
+    @abstractmethod
+    def lookup_version(self, token: JwtTokenPayload | None, user_id: UUID) -> VersionLookup:
+        """
+        Check whether the token is revoked and fetch the user's claims version in one round
+        trip.
+
+        Pass `token=None` to skip the revocation check when it was already answered locally.
+        """
+
+    @abstractmethod
+    def get_version(self, user_id: UUID) -> int:
+        """Get the user's claims version, to embed in new access tokens."""
+
+    @abstractmethod
+    def store(self, principal: Principal) -> None:
+        """Cache a validated principal."""
+
+    @abstractmethod
+    def invalidate_session(self, session_id: UUID) -> None:
+        """Drop every cached principal of a session."""
+
+    @abstractmethod
+    def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Drop every cached principal of a user, across all of their sessions.
+
+        Also moves the user's claims version on, so access tokens issued before the change
+        stop being authorized from their embedded claims alone.
+        """
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from app.domain.repositories.interfaces.auth import JwtTokenPayload
+
+
+class RotationResult(Enum):
+    """Outcome of a refresh token rotation."""
+
+    ROTATED = 1
+    REVOKED = 0
+    REUSED = -1
+
+
+class IRefreshTokenRepository(ABC):
+    """Refresh token rotation state interface."""
+
+    @abstractmethod
+    def rotate(
+        self,
+        token: JwtTokenPayload,
+        new_jti: str,
+        new_expires_at: datetime,
+        revocation_ttl_seconds: int | None = None,
+    ) -> RotationResult:
+        """
+        Atomically spend a refresh token and record its successor.
+
+        A token that was already spent revokes its whole session, epoch included, for
+        `revocation_ttl_seconds`.
+        """
+
+    @abstractmethod
+    def get_pending_expiry(self, session_id: UUID) -> datetime | None:
+        """Get the session expiry of the last rotation not yet written to the database."""
+
+    @abstractmethod
+    def get_pending_expiries(self) -> dict[UUID, datetime]:
+        """Get every session expiry not yet written to the database."""
+
+    @abstractmethod
+    def clear_pending_expiries(self, expiries: dict[UUID, datetime]) -> None:
+        """Forget the given expiries once written, unless a later rotation replaced them."""
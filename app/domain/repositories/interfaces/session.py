@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
+from app.domain.models.account import Account
 from app.domain.models.session import UserSession
+from app.domain.models.user import User
 
 
 class ISessionRepository(ABC):
@@ -14,6 +17,12 @@ class ISessionRepository(ABC):
     def get_by_id(self, session_id: UUID) -> UserSession | None:
         """Get a session by its ID."""
 
+    @abstractmethod
+    def get_principal(
+        self, session_id: UUID, account_id: UUID
+    ) -> tuple[UserSession, User, Account | None] | None:
+        """Get a session with its user and the requested account in a single query."""
+
     @abstractmethod
     def deactivate(self, session_id: UUID) -> UserSession | None:
         """Deactivate an existing session and return the updated session."""
@@ -27,5 +36,16 @@ class ISessionRepository(ABC):
         """Retrieve all sessions by user ID."""
 
     @abstractmethod
-    def deactivate_expired_sessions(self) -> int:
-        """Deactivate all expired sessions and return the count of deactivated sessions."""
+    def deactivate_expired_sessions(self, batch_size: int | None = None) -> int:
+        """
+        Deactivate expired sessions, at most `batch_size` of them when given, and return
+        the count of deactivated sessions.
+        """
+
+    @abstractmethod
+    def deactivate_all_by_user_id(self, user_id: UUID) -> int:
+        """Deactivate every active session of a user and return how many were deactivated."""
+
+    @abstractmethod
+    def update_expiries(self, expiries: dict[UUID, datetime]) -> None:
+        """Set the expiry of many sessions at once."""
@@ -1,9 +1,13 @@
+import math
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlmodel import Session, desc, select
+from sqlmodel import Session, and_, case, col, desc, func, or_, select
 
-from app.domain.models.job import Job, JobUpdate
+from app.domain.geo import GEOHASH_PRECISION, KM_PER_DEGREE, covering_cells, encode_geohash
+from app.domain.models.application import Application, ApplicationCounts
+from app.domain.models.job import Job, JobUpdate, job_search_document, job_search_query
+from app.domain.pagination import Cursor, DistanceCursor
 from app.domain.repositories.interfaces.job import IJobRepository
 
 
@@ -11,8 +15,17 @@ class JobRepository(IJobRepository):
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def _index_location(job: Job) -> None:
+        """Keep the geohash in sync with the job's coordinates."""
+        if job.latitude is None or job.longitude is None:
+            job.geohash = None
+        else:
+            job.geohash = encode_geohash(job.latitude, job.longitude)
+
     def create(self, job: Job) -> Job:
         """Create a new job entry in the database."""
+        self._index_location(job)
         self.session.add(job)
         self.session.commit()
         self.session.refresh(job)
@@ -22,13 +35,120 @@ class JobRepository(IJobRepository):
         """Retrieve a job entry by ID."""
         return self.session.get(Job, job_id)
 
-    def get_all(self, offset: int = 0, limit: int = 100) -> Sequence[Job]:
+    def get_all(
+        self, offset: int = 0, limit: int = 100, cursor: Cursor | None = None
+    ) -> Sequence[Job]:
         """Retrieve all job entries ordered by creation date (newest first)."""
-        return list(
-            self.session.exec(
-                select(Job).order_by(desc(Job.created_at)).offset(offset).limit(limit)
-            ).all()
+        statement = select(Job)
+        if cursor:
+            statement = statement.where(cursor.after(col(Job.created_at), col(Job.id)))
+        statement = (
+            statement.order_by(desc(Job.created_at), desc(Job.id)).offset(offset).limit(limit)
+        )
+        return list(self.session.exec(statement).all())
+
+    def search(
+        self, query: str, location: str | None = None, offset: int = 0, limit: int = 100
+    ) -> Sequence[Job]:
+        """
+        Search jobs by keyword, best matches first.
+
+        On Postgres this is a ranked full-text query served by the `ix_job_search_document`
+        GIN index. Other databases (the SQLite test database) fall back to matching every
+        keyword with LIKE and ranking the candidates in process.
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            return self._search_full_text(query, location, offset, limit)
+        return self._search_keywords(query, location, offset, limit)
+
+    def _search_full_text(
+        self, query: str, location: str | None, offset: int, limit: int
+    ) -> Sequence[Job]:
+        document = job_search_document(col(Job.title), col(Job.description))
+        ts_query = job_search_query(query)
+        statement = select(Job).where(document.op("@@")(ts_query))
+        if location:
+            statement = statement.where(col(Job.location).icontains(location, autoescape=True))
+        statement = (
+            statement.order_by(desc(func.ts_rank(document, ts_query)), desc(Job.created_at))
+            .offset(offset)
+            .limit(limit)
         )
+        return list(self.session.exec(statement).all())
+
+    def _search_keywords(
+        self, query: str, location: str | None, offset: int, limit: int
+    ) -> Sequence[Job]:
+        terms = query.lower().split()
+        if not terms:
+            return []
+        statement = select(Job).where(
+            and_(
+                *(
+                    or_(
+                        col(Job.title).icontains(term, autoescape=True),
+                        col(Job.description).icontains(term, autoescape=True),
+                    )
+                    for term in terms
+                )
+            )
+        )
+        if location:
+            statement = statement.where(col(Job.location).icontains(location, autoescape=True))
+
+        def rank(job: Job) -> float:
+            # Mirror ts_rank's default weights for the A (title) and B (description) labels
+            title, description = job.title.lower(), job.description.lower()
+            return sum(title.count(term) + 0.4 * description.count(term) for term in terms)
+
+        candidates = self.session.exec(statement).all()
+        ranked = sorted(candidates, key=lambda job: (rank(job), job.created_at), reverse=True)
+        return ranked[offset : offset + limit]
+
+    def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100,
+        cursor: DistanceCursor | None = None,
+    ) -> Sequence[tuple[Job, float]]:
+        """
+        Retrieve jobs within `radius_km` of a coordinate, nearest first.
+
+        Each job comes with its squared distance in km², which is also the keyset ordering
+        key. Candidates come from B-tree range scans over the geohash cells covering the
+        search circle; distance is the equirectangular approximation, which is accurate to
+        well under 1% at the radii this is used with and needs no trigonometry in SQL. The
+        longitude difference wraps around the antimeridian, like the covering cells do.
+        """
+        cells = covering_cells(latitude, longitude, radius_km)
+        geohash = col(Job.geohash)
+        in_cells = or_(
+            *(
+                geohash.between(
+                    cell + "0" * (GEOHASH_PRECISION - len(cell)),
+                    cell + "z" * (GEOHASH_PRECISION - len(cell)),
+                )
+                for cell in cells
+            )
+        )
+        dy = (col(Job.latitude) - latitude) * KM_PER_DEGREE
+        lon_delta = func.abs(col(Job.longitude) - longitude)
+        wrapped_lon_delta = case((lon_delta > 180, 360 - lon_delta), else_=lon_delta)
+        dx = wrapped_lon_delta * (KM_PER_DEGREE * math.cos(math.radians(latitude)))
+        distance_sq = (dx * dx + dy * dy).label("distance_sq")
+
+        statement = select(Job, distance_sq).where(in_cells, distance_sq <= radius_km**2)
+        if cursor:
+            statement = statement.where(cursor.after(distance_sq, col(Job.id)))
+        statement = statement.order_by(distance_sq, col(Job.id)).limit(limit)
+        # Jobs without coordinates have no geohash, so the distance is never NULL here
+        return [
+            (job, distance)
+            for job, distance in self.session.exec(statement).all()
+            if distance is not None
+        ]
 
     def update(self, job_id: UUID, job: JobUpdate) -> Job | None:
         """Update an existing job entry."""
@@ -37,6 +157,7 @@ class JobRepository(IJobRepository):
             return None
         job_data = job.model_dump(exclude_unset=True)
         db_job.sqlmodel_update(job_data)
+        self._index_location(db_job)
         self.session.add(db_job)
         self.session.commit()
         self.session.refresh(db_job)
@@ -53,7 +174,24 @@ class JobRepository(IJobRepository):
 
     def get_total_applications(self, job_id: UUID) -> int:
         """Get the total number of applications for a job."""
-        job = self.get_by_id(job_id)
-        if not job:
-            return 0
-        return len(job.applications)
+        statement = select(func.count()).where(Application.job_id == job_id)
+        return self.session.exec(statement).one()
+
+    def get_application_counts(self, job_ids: Sequence[UUID]) -> dict[UUID, ApplicationCounts]:
+        """
+        Get the number of applications per status of each job.
+
+        A whole page of jobs is counted with a single GROUP BY, served by the index on
+        `application.job_id`; jobs without applications get all-zero counts.
+        """
+        counts = {job_id: ApplicationCounts() for job_id in job_ids}
+        if not counts:
+            return counts
+        statement = (
+            select(col(Application.job_id), col(Application.status), func.count())
+            .where(col(Application.job_id).in_(counts))
+            .group_by(col(Application.job_id), col(Application.status))
+        )
+        for job_id, application_status, count in self.session.exec(statement):
+            setattr(counts[job_id], application_status.value.lower(), count)
+        return counts
@@ -0,0 +1,129 @@
+import time
+from typing import cast
+from uuid import UUID
+
+import orjson
+from redis.client import Redis
+
+from app.config.revocation import is_revoked_by, revocation_keys
+from app.domain.models.account import Account
+from app.domain.models.session import UserSession
+from app.domain.models.user import User
+from app.domain.repositories.interfaces.auth import JwtTokenPayload
+from app.domain.repositories.interfaces.principal import (
+    IPrincipalRepository,
+    Principal,
+    PrincipalLookup,
+    VersionLookup,
+)
+
+
+class PrincipalRepository(IPrincipalRepository):
+    """
+    Redis-backed authenticated principal cache.
+
+    Principals live in one hash per session (`principal:{sid}`, field = account ID) so a
+    session can be dropped with a single DEL. A per-user set of session IDs lets account
+    and user changes invalidate every session of the user. The password hash is never
+    written to the cache.
+
+    Each user also has a claims version (`principal:version:{user_id}`, 0 when unset) that
+    access tokens embed next to the user's accounts. Invalidating the user sets it to the
+    current time in nanoseconds, so it never returns to an earlier value. The key lives
+    for `version_ttl_seconds`, which must be at least the access token lifetime: once it
+    expires, every token that embedded an earlier version has expired too.
+    """
+
+    def __init__(self, cache: Redis, ttl_seconds: int, version_ttl_seconds: int | None = None):
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+        self.version_ttl_seconds = version_ttl_seconds
+
+    @staticmethod
+    def _session_key(session_id: UUID | str) -> str:
+        return f"principal:{session_id}"
+
+    @staticmethod
+    def _user_key(user_id: UUID) -> str:
+        return f"principal:user:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: UUID) -> str:
+        return f"principal:version:{user_id}"
+
+    def lookup(
+        self, token: JwtTokenPayload | None, session_id: UUID, account_id: UUID
+    ) -> PrincipalLookup:
+        """Check whether the token is revoked and fetch the cached principal in one round trip."""
+        if token is None:
+            revoked = False
+            cached = self.cache.hget(self._session_key(session_id), str(account_id))
+        else:
+            pipe = self.cache.pipeline(transaction=False)
+            pipe.mget(revocation_keys(token.jti, token.sid, token.sub))
+            pipe.hget(self._session_key(session_id), str(account_id))
+            values, cached = pipe.execute()
+            revoked = is_revoked_by(values, token.issued_at)
+
+        if revoked:
+            return PrincipalLookup(revoked=True, principal=None)
+        if not cached:
+            return PrincipalLookup(revoked=False, principal=None)
+
+        data = orjson.loads(cached)
+        principal = Principal(
+            session=UserSession.model_validate(data["session"]),
+            user=User.model_validate({**data["user"], "hashed_password": ""}),
+            account=Account.model_validate(data["account"]),
+        )
+        return PrincipalLookup(revoked=False, principal=principal)
+
+    def lookup_version(self, token: JwtTokenPayload | None, user_id: UUID) -> VersionLookup:
+        """Check whether the token is revoked and fetch the user's claims version in one MGET."""
+        if token is None:
+            return VersionLookup(revoked=False, version=self.get_version(user_id))
+
+        *values, version = self.cache.mget(
+            [*revocation_keys(token.jti, token.sid, token.sub), self._version_key(user_id)]
+        )
+        return VersionLookup(
+            revoked=is_revoked_by(values, token.issued_at), version=int(version or 0)
+        )
+
+    def get_version(self, user_id: UUID) -> int:
+        """Get the user's claims version, to embed in new access tokens."""
+        return int(self.cache.get(self._version_key(user_id)) or 0)
+
+    def store(self, principal: Principal) -> None:
+        """Cache a validated principal."""
+        payload = orjson.dumps(
+            {
+                "session": principal.session.model_dump(mode="json"),
+                "user": principal.user.model_dump(mode="json", exclude={"hashed_password"}),
+                "account": principal.account.model_dump(mode="json"),
+            }
+        )
+        session_key = self._session_key(principal.session.id)
+        user_key = self._user_key(principal.user.id)
+
+        pipe = self.cache.pipeline(transaction=False)
+        pipe.hset(session_key, str(principal.account.id), payload)
+        pipe.expire(session_key, self.ttl_seconds)
+        pipe.sadd(user_key, str(principal.session.id))
+        pipe.expire(user_key, self.ttl_seconds)
+        pipe.execute()
+
+    def invalidate_session(self, session_id: UUID) -> None:
+        """Drop every cached principal of a session."""
+        self.cache.delete(self._session_key(session_id))
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every cached principal of a user, across all of their sessions."""
+        user_key = self._user_key(user_id)
+        # The client decodes responses, so the members are the session ids as strings
+        session_ids = cast(set[str], self.cache.smembers(user_key))
+        keys = [self._session_key(session_id) for session_id in session_ids]
+        pipe = self.cache.pipeline(transaction=False)
+        pipe.set(self._version_key(user_id), time.time_ns(), ex=self.version_ttl_seconds)
+        pipe.delete(user_key, *keys)
+        pipe.execute()
@@ -0,0 +1,131 @@
+import math
+import time
+from datetime import UTC, datetime
+from typing import cast
+from uuid import UUID
+
+from redis.client import Redis
+
+from app.config.revocation import BLACKLIST_PREFIX, EPOCH_CHANNEL, epoch_keys
+from app.domain.repositories.interfaces.auth import JwtTokenPayload
+from app.domain.repositories.interfaces.refresh import IRefreshTokenRepository, RotationResult
+
+PENDING_EXPIRIES_KEY = "refresh:expiries"
+
+# KEYS: current jti, session epoch, user epoch, blacklist entry, pending expiries
+# ARGV: jti, iat, new jti, new expiry, refresh ttl, session id, now, epoch ttl,
+#       epoch expires at, epoch channel
+ROTATE_SCRIPT = """
+local iat = tonumber(ARGV[2])
+local session_epoch = tonumber(redis.call('GET', KEYS[2]) or '0')
+local user_epoch = tonumber(redis.call('GET', KEYS[3]) or '0')
+if session_epoch > iat or user_epoch > iat then
+    return 0
+end
+
+local current = redis.call('GET', KEYS[1])
+if (current and current ~= ARGV[1]) or redis.call('EXISTS', KEYS[4]) == 1 then
+    redis.call('SET', KEYS[1], '', 'EX', ARGV[5])
+    if tonumber(ARGV[8]) > 0 then
+        redis.call('SET', KEYS[2], ARGV[7], 'EX', ARGV[8])
+    else
+        redis.call('SET', KEYS[2], ARGV[7])
+    end
+    redis.call('PUBLISH', ARGV[10], KEYS[2] .. ':' .. ARGV[7] .. ':' .. ARGV[9])
+    return -1
+end
+
+redis.call('SET', KEYS[1], ARGV[3], 'EX', ARGV[5])
+redis.call('HSET', KEYS[5], ARGV[6], ARGV[4])
+return 1
+"""
+
+# KEYS: pending expiries; ARGV: session id and expiry pairs
+CLEAR_SCRIPT = """
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return 0
+"""
+
+
+class RefreshTokenRepository(IRefreshTokenRepository):
+    """
+    Redis-backed refresh token rotation.
+
+    Each session keeps the jti of its only valid refresh token (`refresh:{sid}`), set on
+    the first rotation and living as long as that token. A Lua script checks the session
+    and user revocation epochs, compares the jti and records the successor in one atomic
+    step, so two concurrent refreshes with the same token cannot both succeed. Presenting
+    a spent token is taken as a stolen token: the session is revoked, its epoch published
+    like any other revocation, and its current token replaced by a tombstone.
+
+    The new session expiry is only recorded in the `refresh:expiries` hash; the session
+    reaper writes them to the database in batches.
+    """
+
+    def __init__(self, cache: Redis):
+        self.cache = cache
+        self._rotate = cache.register_script(ROTATE_SCRIPT)
+        self._clear = cache.register_script(CLEAR_SCRIPT)
+
+    @staticmethod
+    def _current_key(session_id: UUID) -> str:
+        return f"refresh:{session_id}"
+
+    def rotate(
+        self,
+        token: JwtTokenPayload,
+        new_jti: str,
+        new_expires_at: datetime,
+        revocation_ttl_seconds: int | None = None,
+    ) -> RotationResult:
+        """Atomically spend a refresh token and record its successor."""
+        now = time.time()
+        epoch_ttl = revocation_ttl_seconds or 0
+        expires_at = int(new_expires_at.timestamp())
+        result = self._rotate(
+            keys=[
+                self._current_key(token.sid),
+                *epoch_keys(token.sid, token.sub),
+                f"{BLACKLIST_PREFIX}{token.jti}",
+                PENDING_EXPIRIES_KEY,
+            ],
+            args=[
+                token.jti,
+                token.issued_at,
+                new_jti,
+                expires_at,
+                max(1, expires_at - int(now)),
+                str(token.sid),
+                now,
+                epoch_ttl,
+                now + epoch_ttl if epoch_ttl else math.inf,
+                EPOCH_CHANNEL,
+            ],
+        )
+        return RotationResult(int(result))
+
+    def get_pending_expiry(self, session_id: UUID) -> datetime | None:
+        """Get the session expiry of the last rotation not yet written to the database."""
+        expires_at = self.cache.hget(PENDING_EXPIRIES_KEY, str(session_id))
+        return datetime.fromtimestamp(int(expires_at), UTC) if expires_at else None
+
+    def get_pending_expiries(self) -> dict[UUID, datetime]:
+        """Get every session expiry not yet written to the database."""
+        pending = cast(dict[str, str], self.cache.hgetall(PENDING_EXPIRIES_KEY))
+        return {
+            UUID(session_id): datetime.fromtimestamp(int(expires_at), UTC)
+            for session_id, expires_at in pending.items()
+        }
+
+    def clear_pending_expiries(self, expiries: dict[UUID, datetime]) -> None:
+        """Forget the given expiries once written, unless a later rotation replaced them."""
+        if not expiries:
+            return
+        args: list[str | int] = []
+        for session_id, expires_at in expiries.items():
+            args += [str(session_id), int(expires_at.timestamp())]
+        self._clear(keys=[PENDING_EXPIRIES_KEY], args=args)
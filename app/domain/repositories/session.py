@@ -2,9 +2,12 @@ from collections.abc import Sequence
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlmodel import Session, desc, select
+from sqlalchemy import bindparam, update
+from sqlmodel import Session, col, desc, select
 
+from app.domain.models.account import Account
 from app.domain.models.session import UserSession
+from app.domain.models.user import User
 from app.domain.repositories.interfaces.session import ISessionRepository
 
 
@@ -13,16 +16,32 @@ class SessionRepository(ISessionRepository):
         self.session = session
 
     def create(self, session: UserSession) -> UserSession:
-        """Create a new session in the database."""
+        """
+        Create a new session in the database.
+
+        Every column is populated client-side, so the row is not read back after the INSERT.
+        """
         self.session.add(session)
         self.session.commit()
-        self.session.refresh(session)
         return session
 
     def get_by_id(self, session_id: UUID) -> UserSession | None:
         """Get a session by its ID."""
         return self.session.get(UserSession, session_id)
 
+    def get_principal(
+        self, session_id: UUID, account_id: UUID
+    ) -> tuple[UserSession, User, Account | None] | None:
+        """Get a session with its user and the requested account in a single query."""
+        statement = (
+            select(UserSession, User, Account)
+            .join(User, User.id == UserSession.user_id)  # type: ignore[arg-type]
+            .outerjoin(Account, Account.id == account_id)  # type: ignore[arg-type]
+            .where(UserSession.id == session_id)
+        )
+        row = self.session.exec(statement).first()
+        return tuple(row) if row else None  # type: ignore[return-value]
+
     def deactivate(self, session_id: UUID) -> UserSession | None:
         """Deactivate an existing session."""
         session = self.session.get(UserSession, session_id)
@@ -50,19 +69,59 @@ class SessionRepository(ISessionRepository):
         )
         return self.session.exec(statement).all()
 
-    def deactivate_expired_sessions(self) -> int:
-        """Deactivate all expired sessions and return the count of deactivated sessions."""
-        now = datetime.now(UTC)
+    def deactivate_expired_sessions(self, batch_size: int | None = None) -> int:
+        """
+        Deactivate expired sessions in a single UPDATE and return how many were deactivated.
+
+        With `batch_size`, at most that many sessions are deactivated so a large backlog can
+        be worked off in short transactions. Rows locked by a concurrent reaper are skipped.
+        """
+        expired = select(UserSession.id).where(
+            UserSession.is_active, col(UserSession.expires_at) <= datetime.now(UTC)
+        )
+        if batch_size is not None:
+            expired = expired.limit(batch_size)
         statement = (
-            select(UserSession).where(UserSession.is_active).where(UserSession.expires_at <= now)
+            update(UserSession)
+            .where(col(UserSession.id).in_(expired.with_for_update(skip_locked=True)))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
         )
-        expired_sessions = list(self.session.exec(statement).all())
+        count = self.session.exec(statement).rowcount
 
-        for session in expired_sessions:
-            session.is_active = False
-            self.session.add(session)
+        if count:
+            self.session.commit()
+        return count
+
+    def deactivate_all_by_user_id(self, user_id: UUID) -> int:
+        """Deactivate every active session of a user in a single UPDATE and return the count."""
+        statement = (
+            update(UserSession)
+            .where(col(UserSession.user_id) == user_id, col(UserSession.is_active))
+            .values(is_active=False)
+        )
+        count = self.session.exec(statement).rowcount
 
-        if expired_sessions:
+        if count:
             self.session.commit()
+        return count
 
-        return len(expired_sessions)
+    def update_expiries(self, expiries: dict[UUID, datetime]) -> None:
+        """Set the expiry of many sessions with one batched UPDATE in a single transaction."""
+        if not expiries:
+            return
+        statement = (
+            update(UserSession)
+            .where(col(UserSession.id) == bindparam("session_id"))
+            .values(expires_at=bindparam("expires_at"))
+        )
+        # Run on the connection, as a plain executemany: the ORM session would take a list of
+        # parameters with a WHERE clause for a bulk UPDATE by primary key instead
+        self.session.connection().execute(
+            statement,
+            [
+                {"session_id": session_id, "expires_at": expires_at}
+                for session_id, expires_at in expiries.items()
+            ],
+        )
+        self.session.commit()
@@ -1,8 +1,11 @@
+import uuid
+from datetime import datetime
 from typing import Annotated
 
 from pydantic import BaseModel, StringConstraints
 
 from app.domain.models.account import AccountType
+from app.dto.serializer import ResponseSerializer
 
 
 class CreateAccountDto(BaseModel):
@@ -12,3 +15,16 @@ class CreateAccountDto(BaseModel):
 
 class UpdateAccountDto(BaseModel):
     name: Annotated[str, StringConstraints(min_length=3, strip_whitespace=True)] | None = None
+
+
+class AccountResponseDto(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    name: str
+    account_type: AccountType
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+account_serializer = ResponseSerializer(AccountResponseDto)
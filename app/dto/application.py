@@ -1,8 +1,15 @@
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
-from pydantic import BaseModel, StringConstraints
+from fastapi import HTTPException, status
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator
 
-from app.domain.models.application import ApplicationStatus
+from app.domain.models.application import Application, ApplicationBatchResult, ApplicationStatus
+from app.dto.job import JobSummaryResponseDto, job_summary_serializer
+from app.dto.serializer import ResponseSerializer
+
+MAX_BATCH_UPDATE_SIZE = 500
 
 
 class CreateApplicationDto(BaseModel):
@@ -12,3 +19,58 @@ class CreateApplicationDto(BaseModel):
 class UpdateApplicationStatusDto(BaseModel):
     status: ApplicationStatus
     message: Annotated[str, StringConstraints(min_length=10, max_length=500)] | None = None
+
+
+class ApplicationStatusChangeDto(BaseModel):
+    application_id: UUID
+    status: ApplicationStatus
+
+    @field_validator("status", mode="after")
+    @classmethod
+    def validate_employer_decision(cls, value: ApplicationStatus) -> ApplicationStatus:
+        if value not in (ApplicationStatus.ACCEPTED, ApplicationStatus.REJECTED):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Applications can only be accepted or rejected in a batch",
+            )
+        return value
+
+
+class BatchUpdateApplicationsDto(BaseModel):
+    updates: Annotated[
+        list[ApplicationStatusChangeDto], Field(min_length=1, max_length=MAX_BATCH_UPDATE_SIZE)
+    ]
+
+    @model_validator(mode="after")
+    def validate_unique_applications(self):
+        if len({update.application_id for update in self.updates}) != len(self.updates):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Each application can only appear once in a batch",
+            )
+        return self
+
+
+class ApplicationResponseDto(BaseModel):
+    id: UUID
+    job_id: UUID
+    account_id: UUID
+    status: ApplicationStatus
+    message: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class ApplicationWithJobResponseDto(ApplicationResponseDto):
+    job: JobSummaryResponseDto | None = None
+
+
+application_serializer = ResponseSerializer(ApplicationResponseDto)
+application_batch_result_serializer = ResponseSerializer(ApplicationBatchResult)
+
+
+def application_with_job(application: Application) -> dict:
+    """Serialize an application with a summary of its (already loaded) job embedded."""
+    return application_serializer.to_dict(application) | {
+        "job": job_summary_serializer.to_dict(application.job)
+    }
@@ -1,7 +1,44 @@
 import uuid
+from datetime import datetime
 
 from pydantic import BaseModel
 
+from app.domain.models.favorite import Favorite
+from app.dto.job import JobSummaryResponseDto, job_summary_serializer
+from app.dto.serializer import ResponseSerializer
+
+MAX_FAVORITE_LOOKUP_SIZE = 100
+
 
 class CreateFavoriteDto(BaseModel):
     job_id: uuid.UUID
+
+
+class FavoriteResponseDto(BaseModel):
+    id: uuid.UUID
+    account_id: uuid.UUID
+    job_id: uuid.UUID
+    created_at: datetime
+
+
+class FavoriteWithJobResponseDto(FavoriteResponseDto):
+    job: JobSummaryResponseDto | None = None
+
+
+class FavoriteLookupResponseDto(BaseModel):
+    bitmap: str
+
+
+favorite_serializer = ResponseSerializer(FavoriteResponseDto)
+
+
+def favorite_with_job(favorite: Favorite) -> dict:
+    """Serialize a favorite with a summary of its (already loaded) job embedded."""
+    return favorite_serializer.to_dict(favorite) | {
+        "job": job_summary_serializer.to_dict(favorite.job)
+    }
+
+
+def favorite_bitmap(favorited: list[bool]) -> dict[str, str]:
+    """Encode lookup results as a string of `1` (favorited) and `0` characters."""
+    return {"bitmap": "".join("1" if flag else "0" for flag in favorited)}
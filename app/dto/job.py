@@ -1,8 +1,16 @@
-from datetime import date
+import uuid
+from datetime import date, datetime
 from fastapi import HTTPException, status
 from typing import Annotated
 
-from pydantic import BaseModel, StringConstraints, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator, model_validator
+
+from app.domain.models.application import ApplicationCounts
+from app.domain.models.job import Job
+from app.dto.serializer import ResponseSerializer
+
+Latitude = Annotated[float, Field(ge=-90, le=90)]
+Longitude = Annotated[float, Field(ge=-180, le=180)]
 
 
 class CreateJobDto(BaseModel):
@@ -10,6 +18,8 @@ class CreateJobDto(BaseModel):
     description: Annotated[str, StringConstraints(min_length=10)]
     budget: float
     location: Annotated[str, StringConstraints(min_length=1)]
+    latitude: Latitude | None = None
+    longitude: Longitude | None = None
     start_date: date
     end_date: date
 
@@ -43,12 +53,25 @@ class CreateJobDto(BaseModel):
             )
         return value
 
+    @model_validator(mode="after")
+    def validate_coordinates_together(self):
+        if ("latitude" in self.model_fields_set) != ("longitude" in self.model_fields_set) or (
+            (self.latitude is None) != (self.longitude is None)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Latitude and longitude must be provided together",
+            )
+        return self
+
 
 class UpdateJobDto(BaseModel):
     title: Annotated[str, StringConstraints(min_length=5)] | None = None
     description: Annotated[str, StringConstraints(min_length=10)] | None = None
     budget: float | None = None
     location: Annotated[str, StringConstraints(min_length=1)] | None = None
+    latitude: Latitude | None = None
+    longitude: Longitude | None = None
     start_date: date | None = None
     end_date: date | None = None
 
@@ -82,3 +105,59 @@ class UpdateJobDto(BaseModel):
                     detail="End date must be on or after start date",
                 )
         return value
+
+    @model_validator(mode="after")
+    def validate_coordinates_together(self):
+        if ("latitude" in self.model_fields_set) != ("longitude" in self.model_fields_set) or (
+            (self.latitude is None) != (self.longitude is None)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Latitude and longitude must be provided together",
+            )
+        return self
+
+
+class JobResponseDto(BaseModel):
+    id: uuid.UUID
+    account_id: uuid.UUID
+    title: str
+    description: str
+    budget: float
+    location: str
+    latitude: float | None
+    longitude: float | None
+    start_date: date
+    end_date: date
+    created_at: datetime
+    updated_at: datetime
+
+
+class NearbyJobResponseDto(JobResponseDto):
+    distance_km: float
+
+
+class JobWithApplicationCountsResponseDto(JobResponseDto):
+    application_counts: ApplicationCounts
+
+
+class JobSummaryResponseDto(BaseModel):
+    id: uuid.UUID
+    account_id: uuid.UUID
+    title: str
+    budget: float
+    location: str
+    start_date: date
+    end_date: date
+
+
+job_serializer = ResponseSerializer(JobResponseDto)
+job_summary_serializer = ResponseSerializer(JobSummaryResponseDto)
+application_counts_serializer = ResponseSerializer(ApplicationCounts)
+
+
+def job_with_application_counts(job: Job, counts: ApplicationCounts) -> dict:
+    """Serialize a job with its application counts embedded."""
+    return job_serializer.to_dict(job) | {
+        "application_counts": application_counts_serializer.to_dict(counts)
+    }
@@ -0,0 +1,65 @@
+from collections.abc import Callable, Iterable, Mapping
+from operator import attrgetter
+from typing import Any
+
+import orjson
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def json_response(
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """Wrap already JSON-ready content in a response, encoded by orjson in one pass."""
+    return Response(
+        content=orjson.dumps(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
+class ResponseSerializer:
+    """
+    Serializes ORM rows with the fields of a response model.
+
+    The attribute getter is built once per model and rows go straight to orjson, skipping
+    FastAPI's `jsonable_encoder` pass. Declare the model as the route's `response_model`
+    so it still documents the schema.
+    """
+
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+        self.fields = tuple(model.model_fields)
+        if len(self.fields) == 1:
+            # attrgetter with a single name returns the bare value, not a 1-tuple
+            field = self.fields[0]
+            self._get: Callable[[Any], tuple[Any, ...]] = lambda row: (getattr(row, field),)
+        else:
+            self._get = attrgetter(*self.fields)
+
+    def to_dict(self, row: Any) -> dict[str, Any]:
+        """Pick the response fields of a row."""
+        return dict(zip(self.fields, self._get(row), strict=True))
+
+    def response(
+        self,
+        row: Any,
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """JSON response with one row."""
+        return json_response(self.to_dict(row), status_code=status_code, headers=headers)
+
+    def list_response(
+        self,
+        rows: Iterable[Any],
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """JSON response with a list of rows."""
+        return json_response(
+            [self.to_dict(row) for row in rows], status_code=status_code, headers=headers
+        )
@@ -1,19 +1,40 @@
-from datetime import datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse, RedirectResponse
 
+from app.config.metrics import MetricsMiddleware, mark_worker_stopped
+from app.config.query_stats import SERVER_TIMING_HEADER, QueryStatsMiddleware
+from app.config.reaper import session_reaper
+from app.config.revocation import revocation_list
 from app.config.settings import get_settings
+from app.domain.pagination import NEXT_CURSOR_HEADER
 from app.routers import routers
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """Run this worker's background tasks while it serves."""
+    if settings.token_blacklist_local:
+        revocation_list.start()
+    if settings.session_reaper_enabled:
+        session_reaper.start()
+    yield
+    session_reaper.stop()
+    revocation_list.stop()
+    mark_worker_stopped()
+
+
 app = FastAPI(
     title="HoverHub API",
     description="API for HoverHub - Drone Job Platform",
     version="1.0.0",
     default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -22,7 +43,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["Content-Type", "Authorization"],
+    expose_headers=[NEXT_CURSOR_HEADER, SERVER_TIMING_HEADER],
 )
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 for router in routers:
     app.include_router(router)
@@ -34,12 +58,6 @@ async def root():
     return RedirectResponse(url="/docs")
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now()}
-
-
 if __name__ == "__main__":
     import uvicorn
 
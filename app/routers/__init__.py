@@ -2,14 +2,20 @@ from app.routers.account import router as account_router
 from app.routers.applications import router as applications_router
 from app.routers.auth import router as auth_router
 from app.routers.favorites import router as favorites_router
+from app.routers.health import router as health_router
+from app.routers.internal import router as internal_router
 from app.routers.jobs import router as jobs_router
+from app.routers.metrics import router as metrics_router
 from app.routers.users import router as users_router
 
 routers = [
+    health_router,
     auth_router,
     users_router,
     account_router,
     jobs_router,
     applications_router,
     favorites_router,
+    internal_router,
+    metrics_router,
 ]
@@ -1,18 +1,24 @@
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, status
 
-from app.config.dependencies import AccountServiceDep, AuthenticatedUserDep
-from app.dto.account import CreateAccountDto, UpdateAccountDto
+from app.config.dependencies import AccountServiceDep, AuthenticatedUserDep, DbRunnerDep
+from app.dto.account import (
+    AccountResponseDto,
+    CreateAccountDto,
+    UpdateAccountDto,
+    account_serializer,
+)
 
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=AccountResponseDto)
 async def create_account(
     authenticated_user: AuthenticatedUserDep,
     dto: CreateAccountDto,
     account_service: AccountServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Create a new account for the authenticated user.
@@ -21,26 +27,20 @@ async def create_account(
         authenticated_user: Current authenticated user (injected from JWT)
         dto: Account creation data
         account_service: Injected account service
+        db: Injected database runner
 
     Returns:
         The created account information
     """
-    account = account_service.create_account(authenticated_user.id, dto)
-    return {
-        "id": account.id,
-        "user_id": account.user_id,
-        "name": account.name,
-        "account_type": account.account_type.value,
-        "is_active": account.is_active,
-        "created_at": account.created_at,
-        "updated_at": account.updated_at,
-    }
-
-
-@router.get("/", status_code=status.HTTP_200_OK)
+    account = await db.run(account_service.create_account, authenticated_user.id, dto)
+    return account_serializer.response(account, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/", status_code=status.HTTP_200_OK, response_model=list[AccountResponseDto])
 async def get_user_accounts(
     authenticated_user: AuthenticatedUserDep,
     account_service: AccountServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Get all accounts for the authenticated user.
@@ -48,30 +48,21 @@ async def get_user_accounts(
     Args:
         authenticated_user: Current authenticated user (injected from JWT)
         account_service: Injected account service
+        db: Injected database runner
 
     Returns:
         List of user accounts
     """
-    accounts = account_service.get_user_accounts(authenticated_user.id)
-    return [
-        {
-            "id": account.id,
-            "user_id": account.user_id,
-            "name": account.name,
-            "account_type": account.account_type.value,
-            "is_active": account.is_active,
-            "created_at": account.created_at,
-            "updated_at": account.updated_at,
-        }
-        for account in accounts
-    ]
-
-
-@router.get("/{account_id}", status_code=status.HTTP_200_OK)
+    accounts = await db.run(account_service.get_user_accounts, authenticated_user.id)
+    return account_serializer.list_response(accounts)
+
+
+@router.get("/{account_id}", status_code=status.HTTP_200_OK, response_model=AccountResponseDto)
 async def get_account(
     authenticated_user: AuthenticatedUserDep,
     account_service: AccountServiceDep,
     account_id: UUID,
+    db: DbRunnerDep,
 ):
     """
     Get a specific account by ID.
@@ -79,40 +70,26 @@ async def get_account(
     Args:
         authenticated_user: Current authenticated user (injected from JWT)
         account_service: Injected account service
+        db: Injected database runner
         account_id: The ID of the account to retrieve
 
     Returns:
         Account information
     """
-    account = account_service.get_account_by_id(authenticated_user.id, account_id)
-    return {
-        "id": account.id,
-        "user_id": account.user_id,
-        "name": account.name,
-        "account_type": account.account_type.value,
-        "is_active": account.is_active,
-        "created_at": account.created_at,
-        "updated_at": account.updated_at,
-    }
-
-
-@router.put("/{account_id}", status_code=status.HTTP_200_OK)
+    account = await db.run(account_service.get_account_by_id, authenticated_user.id, account_id)
+    return account_serializer.response(account)
+
+
+@router.put("/{account_id}", status_code=status.HTTP_200_OK, response_model=AccountResponseDto)
 async def update_account(
     authenticated_user: AuthenticatedUserDep,
     account_service: AccountServiceDep,
     account_id: UUID,
     dto: UpdateAccountDto,
+    db: DbRunnerDep,
 ):
     """
     Update a specific account by ID.
     """
-    account = account_service.update_account(authenticated_user.id, account_id, dto)
-    return {
-        "id": account.id,
-        "user_id": account.user_id,
-        "name": account.name,
-        "account_type": account.account_type.value,
-        "is_active": account.is_active,
-        "created_at": account.created_at,
-        "updated_at": account.updated_at,
-    }
+    account = await db.run(account_service.update_account, authenticated_user.id, account_id, dto)
+    return account_serializer.response(account)
@@ -1,45 +1,77 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
 from app.config.dependencies import (
     ApplicationServiceDep,
     AuthenticatedAccountDep,
+    DbRunnerDep,
 )
+from app.domain.models.application import ApplicationStatus
+from app.domain.pagination import NEXT_CURSOR_HEADER
+from app.dto.application import (
+    ApplicationResponseDto,
+    ApplicationWithJobResponseDto,
+    application_serializer,
+    application_with_job,
+)
+from app.dto.serializer import json_response
 
 router = APIRouter(prefix="/applications", tags=["Applications"])
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, response_model=list[ApplicationWithJobResponseDto])
 async def list_applications_for_account(
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Maximum number of items to return")
+    ] = 100,
+    cursor: Annotated[
+        str | None, Query(description=f"Cursor from the {NEXT_CURSOR_HEADER} header")
+    ] = None,
+    application_status: Annotated[
+        ApplicationStatus | None,
+        Query(alias="status", description="Only list applications in this status"),
+    ] = None,
+    include_job: Annotated[
+        bool, Query(description="Embed a summary of each application's job")
+    ] = False,
 ):
     """
-    List all applications submitted by the authenticated DRONER account.
+    List the applications submitted by the authenticated DRONER account, newest first.
 
-    Only DRONER accounts can access this endpoint.
+    Only DRONER accounts can access this endpoint. When more results are available the
+    response carries an `X-Next-Cursor` header to pass back as `cursor`. With
+    `include_job=true` every item carries a `job` summary, loaded in the same query, so the
+    client needs no `GET /jobs/{job_id}` per application.
     """
-    applications = application_service.list_applications_for_account(authenticated_account.id)
-    return [
-        {
-            "id": app.id,
-            "job_id": app.job_id,
-            "account_id": app.account_id,
-            "status": app.status,
-            "message": app.message,
-            "created_at": app.created_at,
-            "updated_at": app.updated_at,
-        }
-        for app in applications
-    ]
-
-
-@router.get("/{application_id}", status_code=status.HTTP_200_OK)
+    page = await db.run(
+        application_service.list_applications_for_account,
+        authenticated_account.id,
+        limit=limit,
+        cursor=cursor,
+        application_status=application_status,
+        include_job=include_job,
+    )
+    if include_job:
+        return json_response(
+            [application_with_job(application) for application in page.items],
+            headers=page.headers(),
+        )
+    return application_serializer.list_response(page.items, headers=page.headers())
+
+
+@router.get(
+    "/{application_id}", status_code=status.HTTP_200_OK, response_model=ApplicationResponseDto
+)
 async def get_application(
     application_id: UUID,
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Get a specific application by ID.
@@ -48,82 +80,73 @@ async def get_application(
     - The DRONER account that submitted the application
     - The EMPLOYER account that owns the job
     """
-    application = application_service.get_application(authenticated_account.id, application_id)
-    return {
-        "id": application.id,
-        "job_id": application.job_id,
-        "account_id": application.account_id,
-        "status": application.status,
-        "message": application.message,
-        "created_at": application.created_at,
-        "updated_at": application.updated_at,
-    }
-
-
-@router.post("/{application_id}/withdraw", status_code=status.HTTP_200_OK)
+    application = await db.run(
+        application_service.get_application, authenticated_account.id, application_id
+    )
+    return application_serializer.response(application)
+
+
+@router.post(
+    "/{application_id}/withdraw",
+    status_code=status.HTTP_200_OK,
+    response_model=ApplicationResponseDto,
+)
 async def withdraw_application(
     application_id: UUID,
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Withdraw an application (set status to WITHDRAWN).
 
     Only the DRONER account that submitted the application can withdraw it.
     """
-    application = application_service.withdraw_application(authenticated_account.id, application_id)
-    return {
-        "id": application.id,
-        "job_id": application.job_id,
-        "account_id": application.account_id,
-        "status": application.status,
-        "message": application.message,
-        "created_at": application.created_at,
-        "updated_at": application.updated_at,
-    }
-
-
-@router.post("/{application_id}/accept", status_code=status.HTTP_200_OK)
+    application = await db.run(
+        application_service.withdraw_application, authenticated_account.id, application_id
+    )
+    return application_serializer.response(application)
+
+
+@router.post(
+    "/{application_id}/accept",
+    status_code=status.HTTP_200_OK,
+    response_model=ApplicationResponseDto,
+)
 async def accept_application(
     application_id: UUID,
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Accept an application (set status to ACCEPTED).
 
     Only the EMPLOYER account that owns the job can accept applications.
     """
-    application = application_service.accept_application(authenticated_account.id, application_id)
-    return {
-        "id": application.id,
-        "job_id": application.job_id,
-        "account_id": application.account_id,
-        "status": application.status,
-        "message": application.message,
-        "created_at": application.created_at,
-        "updated_at": application.updated_at,
-    }
-
-
-@router.post("/{application_id}/reject", status_code=status.HTTP_200_OK)
+    application = await db.run(
+        application_service.accept_application, authenticated_account.id, application_id
+    )
+    return application_serializer.response(application)
+
+
+@router.post(
+    "/{application_id}/reject",
+    status_code=status.HTTP_200_OK,
+    response_model=ApplicationResponseDto,
+)
 async def reject_application(
     application_id: UUID,
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Reject an application (set status to REJECTED).
 
     Only the EMPLOYER account that owns the job can reject applications.
     """
-    application = application_service.reject_application(authenticated_account.id, application_id)
-    return {
-        "id": application.id,
-        "job_id": application.job_id,
-        "account_id": application.account_id,
-        "status": application.status,
-        "message": application.message,
-        "created_at": application.created_at,
-        "updated_at": application.updated_at,
-    }
+    application = await db.run(
+        application_service.reject_application, authenticated_account.id, application_id
+    )
+    return application_serializer.response(application)
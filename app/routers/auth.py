@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Request, status
+from fastapi import APIRouter, status
 from pydantic import BaseModel
 
-from app.config.dependencies import AuthServiceDep, AuthTokenDep
+from app.config.dependencies import AuthServiceDep, AuthTokenDep, ClientIpDep, DbRunnerDep
 from app.dto.auth import SigninDTO, SignupDTO
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -11,55 +11,23 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
-def get_client_ip(request: Request) -> str:
-    """
-    Get the real client IP address from the request.
-
-    Checks proxy headers (X-Forwarded-For, X-Real-IP) first, then falls back
-    to request.client.host. This ensures we get the actual client IP even when
-    behind a proxy or load balancer.
-
-    Args:
-        request: FastAPI Request object
-
-    Returns:
-        Client IP address as a string, or "unknown" if unavailable
-    """
-    # Check X-Forwarded-For header (most common proxy header)
-    # Format: "client_ip, proxy1_ip, proxy2_ip"
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        # Take the first IP (the original client)
-        client_ip = forwarded_for.split(",")[0].strip()
-        if client_ip:
-            return client_ip
-
-    # Check X-Real-IP header (alternative proxy header)
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip.strip()
-
-    # Fall back to request.client.host (direct connection or no proxy headers)
-    if request.client:
-        return request.client.host
-
-    return "unknown"
-
-
 @router.post("/signup", status_code=status.HTTP_201_CREATED)
-async def signup(request: Request, dto: SignupDTO, auth_service: AuthServiceDep):
+async def signup(
+    dto: SignupDTO, client_ip: ClientIpDep, auth_service: AuthServiceDep, db: DbRunnerDep
+):
     """
     Register a new user account.
 
     Args:
         dto: Signup data containing email and password
+        client_ip: Injected client IP address
         auth_service: Injected authentication service
+        db: Injected database runner
 
     Returns:
         User information and success message
     """
-    client_ip = get_client_ip(request)
-    user, at, rt = auth_service.signup(client_ip, dto)
+    user, at, rt = await db.run(auth_service.signup, client_ip, dto)
 
     return {
         "user": {
@@ -74,7 +42,9 @@ async def signup(request: Request, dto: SignupDTO, auth_service: AuthServiceDep)
 
 
 @router.post("/signin")
-async def signin(request: Request, dto: SigninDTO, auth_service: AuthServiceDep):
+async def signin(
+    dto: SigninDTO, client_ip: ClientIpDep, auth_service: AuthServiceDep, db: DbRunnerDep
+):
     """
     Sign in with email and password (JSON format).
 
@@ -83,13 +53,14 @@ async def signin(request: Request, dto: SigninDTO, auth_service: AuthServiceDep)
 
     Args:
         dto: Signin credentials (email, password, and host)
+        client_ip: Injected client IP address
         auth_service: Injected authentication service
+        db: Injected database runner
 
     Returns:
         Access token, refresh token, and token type
     """
-    client_ip = get_client_ip(request)
-    at, rt = auth_service.signin(client_ip, dto)
+    at, rt = await db.run(auth_service.signin, client_ip, dto)
     return {
         "access_token": at,
         "refresh_token": rt,
@@ -98,7 +69,9 @@ async def signin(request: Request, dto: SigninDTO, auth_service: AuthServiceDep)
 
 
 @router.post("/refresh")
-async def refresh_token(request: RefreshTokenRequest, auth_service: AuthServiceDep):
+async def refresh_token(
+    request: RefreshTokenRequest, auth_service: AuthServiceDep, db: DbRunnerDep
+):
     """
     Refresh access token using a valid refresh token.
 
@@ -107,11 +80,12 @@ async def refresh_token(request: RefreshTokenRequest, auth_service: AuthServiceD
     Args:
         request: Request containing the refresh token
         auth_service: Injected authentication service
+        db: Injected database runner
 
     Returns:
         New access token, new refresh token, and token type
     """
-    at, rt = auth_service.refresh_token(request.refresh_token)
+    at, rt = await db.run(auth_service.refresh_token, request.refresh_token)
     return {
         "access_token": at,
         "refresh_token": rt,
@@ -123,20 +97,46 @@ async def refresh_token(request: RefreshTokenRequest, auth_service: AuthServiceD
 async def signout(
     token: AuthTokenDep,
     auth_service: AuthServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Sign out and revoke the current session.
 
-    This will deactivate the session and blacklist the current token.
-    All tokens associated with this session will be invalidated.
+    This will deactivate the session and revoke every token issued for it.
 
     Requires a valid JWT token in the Authorization header.
 
     Args:
         token: JWT token from Authorization header
         auth_service: Injected authentication service
+        db: Injected database runner
 
     Returns:
         Success message
     """
-    auth_service.signout(token)
+    await db.run(auth_service.signout, token)
+
+
+@router.post("/signout-all", status_code=status.HTTP_200_OK)
+async def signout_all(
+    token: AuthTokenDep,
+    auth_service: AuthServiceDep,
+    db: DbRunnerDep,
+):
+    """
+    Sign out of every device and revoke all sessions of the user.
+
+    Every access and refresh token issued to the user until now stops working.
+
+    Requires a valid JWT token in the Authorization header.
+
+    Args:
+        token: JWT token from Authorization header
+        auth_service: Injected authentication service
+        db: Injected database runner
+
+    Returns:
+        Number of sessions that were active
+    """
+    revoked = await db.run(auth_service.signout_all, token)
+    return {"revoked_sessions": revoked}
@@ -1,64 +1,123 @@
+from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
-from app.config.dependencies import AuthenticatedAccountDep, FavoriteServiceDep
-from app.dto.favorite import CreateFavoriteDto
+from app.config.dependencies import AuthenticatedAccountDep, DbRunnerDep, FavoriteServiceDep
+from app.domain.pagination import NEXT_CURSOR_HEADER
+from app.dto.favorite import (
+    MAX_FAVORITE_LOOKUP_SIZE,
+    CreateFavoriteDto,
+    FavoriteLookupResponseDto,
+    FavoriteResponseDto,
+    FavoriteWithJobResponseDto,
+    favorite_bitmap,
+    favorite_serializer,
+    favorite_with_job,
+)
+from app.dto.serializer import json_response
 
 router = APIRouter(prefix="/jobs/favorites", tags=["Favorites"])
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=FavoriteResponseDto)
 async def create_favorite(
     authenticated_account: AuthenticatedAccountDep,
     dto: CreateFavoriteDto,
     favorite_service: FavoriteServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Create a new favorite entry.
 
+    Favoriting a job the account already favorited is idempotent and returns the existing
+    entry.
+
     Args:
         authenticated_account: The authenticated account from authentication
         dto: The favorite data to create
         favorite_service: Injected favorite service
+        db: Injected database runner
 
     Returns:
         The created favorite information
     """
-    favorite = favorite_service.create_favorite(authenticated_account.id, dto)
-    return {
-        "id": favorite.id,
-        "account_id": favorite.account_id,
-        "job_id": favorite.job_id,
-        "created_at": favorite.created_at,
-    }
+    favorite = await db.run(favorite_service.create_favorite, authenticated_account.id, dto)
+    return favorite_serializer.response(favorite, status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
+@router.get("/", status_code=status.HTTP_200_OK, response_model=list[FavoriteWithJobResponseDto])
 async def get_favorites(
     authenticated_account: AuthenticatedAccountDep,
     favorite_service: FavoriteServiceDep,
+    db: DbRunnerDep,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Maximum number of items to return")
+    ] = 100,
+    cursor: Annotated[
+        str | None, Query(description=f"Cursor from the {NEXT_CURSOR_HEADER} header")
+    ] = None,
+    include_job: Annotated[
+        bool, Query(description="Embed a summary of each favorite's job")
+    ] = False,
 ):
     """
-    Get all favorite entries for a specific account.
+    Get the favorite entries of the authenticated account, newest first.
 
     Args:
         authenticated_account: The authenticated account from authentication
         favorite_service: Injected favorite service
+        db: Injected database runner
+        limit: The maximum number of items to return (min: 1, max: 100)
+        cursor: The opaque cursor from a previous page's `X-Next-Cursor` header
+        include_job: Embed a `job` summary in every item, loaded in the same query
 
     Returns:
         List of favorite information
     """
-    favorites = favorite_service.get_favorites_by_account_id(authenticated_account.id)
-    return [
-        {
-            "id": favorite.id,
-            "account_id": favorite.account_id,
-            "job_id": favorite.job_id,
-            "created_at": favorite.created_at,
-        }
-        for favorite in favorites
-    ]
+    page = await db.run(
+        favorite_service.get_favorites_by_account_id,
+        authenticated_account.id,
+        limit=limit,
+        cursor=cursor,
+        include_job=include_job,
+    )
+    if include_job:
+        return json_response(
+            [favorite_with_job(favorite) for favorite in page.items], headers=page.headers()
+        )
+    return favorite_serializer.list_response(page.items, headers=page.headers())
+
+
+@router.get("/lookup", status_code=status.HTTP_200_OK, response_model=FavoriteLookupResponseDto)
+async def lookup_favorites(
+    authenticated_account: AuthenticatedAccountDep,
+    favorite_service: FavoriteServiceDep,
+    db: DbRunnerDep,
+    job_ids: Annotated[
+        list[UUID],
+        Query(
+            min_length=1,
+            max_length=MAX_FAVORITE_LOOKUP_SIZE,
+            description="Jobs to check, e.g. the IDs of a listing page",
+        ),
+    ],
+):
+    """
+    Check which jobs of a page the authenticated account has favorited.
+
+    Args:
+        authenticated_account: The authenticated account from authentication
+        favorite_service: Injected favorite service
+        db: Injected database runner
+        job_ids: The jobs to check (max: 100)
+
+    Returns:
+        A `bitmap` string with one character per job ID, in request order: `1` when the job
+        is favorited, `0` otherwise
+    """
+    favorited = await db.run(favorite_service.get_favorited, authenticated_account.id, job_ids)
+    return json_response(favorite_bitmap(favorited))
 
 
 @router.delete("/{favorite_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -66,6 +125,7 @@ async def delete_favorite(
     authenticated_account: AuthenticatedAccountDep,
     favorite_id: UUID,
     favorite_service: FavoriteServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Delete a favorite entry by ID.
@@ -74,8 +134,9 @@ async def delete_favorite(
         authenticated_account: The authenticated account from authentication
         favorite_id: The ID of the favorite to delete
         favorite_service: Injected favorite service
+        db: Injected database runner
 
     Returns:
         Deletion success status
     """
-    favorite_service.delete_favorite(authenticated_account.id, favorite_id)
+    await db.run(favorite_service.delete_favorite, authenticated_account.id, favorite_id)
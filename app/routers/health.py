@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Response, status
+
+from app.config.dependencies import ReadinessProbeDep
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("", status_code=status.HTTP_200_OK)
+async def health_check():
+    """Health check endpoint."""
+    return {"status": "healthy", "timestamp": datetime.now()}
+
+
+@router.get("/live", status_code=status.HTTP_200_OK)
+async def liveness():
+    """
+    Liveness probe: the process is up and serving requests.
+
+    Never touches dependencies, so a database or cache outage does not get workers
+    restarted.
+    """
+    return {"status": "alive", "timestamp": datetime.now()}
+
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def readiness(probe: ReadinessProbeDep, response: Response):
+    """
+    Readiness probe: the worker can reach the database and the cache.
+
+    Probe results are cached for a few seconds. Responds 503 when a dependency is down so
+    the load balancer stops routing to this worker.
+
+    Args:
+        probe: Injected readiness probe
+        response: The outgoing response, used to set the status code
+
+    Returns:
+        Overall status and each dependency's status and latency
+    """
+    report = await probe.check()
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "ready" if report.ready else "unavailable",
+        "checks": report.checks,
+        "checked_at": report.checked_at,
+    }
@@ -0,0 +1,80 @@
+from fastapi import APIRouter, Depends, status
+
+from app.config.database import async_engine, engine, get_pool_stats
+from app.config.dependencies import (
+    PasswordHasherPoolDep,
+    RevocationListDep,
+    SessionReaperDep,
+    require_internal_token,
+)
+from app.domain.repositories.cached_job import job_cache_stats
+
+# Operational stats, only for callers holding the internal API token
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)],
+)
+
+
+@router.get("/hashing", status_code=status.HTTP_200_OK)
+async def get_hashing_stats(hasher_pool: PasswordHasherPoolDep):
+    """
+    Get utilisation of the password hashing pool for this worker.
+
+    Returns:
+        Worker count, in-flight and queued hashes, and rejected (503) requests
+    """
+    return hasher_pool.stats()
+
+
+@router.get("/db-pool", status_code=status.HTTP_200_OK)
+async def get_db_pool_stats():
+    """
+    Get occupancy and checkout telemetry of the database pools for this worker.
+
+    Returns:
+        Per engine: configured size, checked out/in and overflow connections, checkouts,
+        timeouts and average/maximum time spent waiting for a connection
+    """
+    return {
+        "sync": get_pool_stats(engine),
+        "async": get_pool_stats(async_engine.sync_engine) if async_engine else None,
+    }
+
+
+@router.get("/job-cache", status_code=status.HTTP_200_OK)
+async def get_job_cache_stats():
+    """
+    Get hit/miss counters of the job read-through cache for this worker.
+
+    Returns:
+        Cache hits, misses and the hit ratio of job detail, listing and application count
+        lookups
+    """
+    return job_cache_stats.stats()
+
+
+@router.get("/revocation-list", status_code=status.HTTP_200_OK)
+async def get_revocation_list_stats(revocation_list: RevocationListDep):
+    """
+    Get the state of this worker's copy of the token blacklist.
+
+    Returns:
+        Whether it is in sync, how many revoked tokens it holds, and how many checks it
+        answered locally versus fell back to Redis
+    """
+    return revocation_list.stats()
+
+
+@router.get("/session-reaper", status_code=status.HTTP_200_OK)
+async def get_session_reaper_stats(session_reaper: SessionReaperDep):
+    """
+    Get the runs of the expired session reaper on this worker.
+
+    Returns:
+        Completed and skipped (another worker held the lock) runs, sessions deactivated in
+        total and by the last run, and when and how long the last run took
+    """
+    return session_reaper.stats()
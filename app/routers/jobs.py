@@ -3,18 +3,41 @@ from uuid import UUID
 
 from fastapi import APIRouter, Query, status
 
-from app.config.dependencies import ApplicationServiceDep, AuthenticatedAccountDep, JobServiceDep
-from app.dto.application import CreateApplicationDto
-from app.dto.job import CreateJobDto, UpdateJobDto
+from app.config.dependencies import (
+    ApplicationServiceDep,
+    AuthenticatedAccountDep,
+    DbRunnerDep,
+    JobServiceDep,
+)
+from app.domain.models.application import ApplicationBatchResult
+from app.domain.pagination import NEXT_CURSOR_HEADER
+from app.dto.application import (
+    ApplicationResponseDto,
+    BatchUpdateApplicationsDto,
+    CreateApplicationDto,
+    application_batch_result_serializer,
+    application_serializer,
+)
+from app.dto.job import (
+    CreateJobDto,
+    JobResponseDto,
+    JobWithApplicationCountsResponseDto,
+    NearbyJobResponseDto,
+    UpdateJobDto,
+    job_serializer,
+    job_with_application_counts,
+)
+from app.dto.serializer import json_response
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
+@router.post("/", status_code=status.HTTP_201_CREATED, response_model=JobResponseDto)
 async def create_job(
     authenticated_account: AuthenticatedAccountDep,
     dto: CreateJobDto,
     job_service: JobServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Create a new job.
@@ -23,30 +46,105 @@ async def create_job(
         authenticated_account: The authenticated account from authentication
         dto: The job data to create
         job_service: Injected job service
+        db: Injected database runner
 
     Returns:
         The created job information
     """
-    job = job_service.create_job(authenticated_account.id, dto)
-    return {
-        "id": job.id,
-        "account_id": job.account_id,
-        "title": job.title,
-        "description": job.description,
-        "budget": job.budget,
-        "location": job.location,
-        "start_date": job.start_date,
-        "end_date": job.end_date,
-        "created_at": job.created_at,
-        "updated_at": job.updated_at,
-    }
-
-
-@router.get("/{job_id}", status_code=status.HTTP_200_OK)
+    job = await db.run(job_service.create_job, authenticated_account.id, dto)
+    return job_serializer.response(job, status_code=status.HTTP_201_CREATED)
+
+
+@router.get("/search", status_code=status.HTTP_200_OK, response_model=list[JobResponseDto])
+async def search_jobs(
+    _: AuthenticatedAccountDep,
+    job_service: JobServiceDep,
+    db: DbRunnerDep,
+    q: Annotated[str, Query(min_length=1, max_length=200, description="Search keywords")],
+    location: Annotated[
+        str | None, Query(min_length=1, max_length=200, description="Location filter")
+    ] = None,
+    offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Maximum number of items to return")
+    ] = 20,
+):
+    """
+    Search jobs by keyword in their title and description.
+
+    Results are ranked by relevance (title matches weigh more than description matches),
+    then by creation date (newest first).
+
+    Args:
+        _: The authenticated account from authentication
+        job_service: Injected job service
+        db: Injected database runner
+        q: The search keywords
+        location: Optional location filter (case-insensitive substring match)
+        offset: The number of items to skip before starting to collect the result set (min: 0)
+        limit: The maximum number of items to return (min: 1, max: 100)
+
+    Returns:
+        A list of matching jobs, best matches first
+    """
+    jobs = await db.run(job_service.search, q, location=location, offset=offset, limit=limit)
+    return job_serializer.list_response(jobs)
+
+
+@router.get("/nearby", status_code=status.HTTP_200_OK, response_model=list[NearbyJobResponseDto])
+async def list_nearby_jobs(
+    _: AuthenticatedAccountDep,
+    job_service: JobServiceDep,
+    db: DbRunnerDep,
+    lat: Annotated[float, Query(ge=-90, le=90, description="Latitude of the search center")],
+    lon: Annotated[float, Query(ge=-180, le=180, description="Longitude of the search center")],
+    radius_km: Annotated[
+        float, Query(gt=0, le=200, description="Search radius in kilometers")
+    ] = 25,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Maximum number of items to return")
+    ] = 20,
+    cursor: Annotated[
+        str | None, Query(description=f"Cursor from the {NEXT_CURSOR_HEADER} header")
+    ] = None,
+):
+    """
+    List jobs within a radius of a location, nearest first.
+
+    Only jobs with coordinates are considered. When more results are available the response
+    carries an `X-Next-Cursor` header; pass it back as `cursor` to fetch the next page.
+
+    Args:
+        _: The authenticated account from authentication
+        job_service: Injected job service
+        db: Injected database runner
+        lat: Latitude of the search center
+        lon: Longitude of the search center
+        radius_km: Search radius in kilometers (max: 200)
+        limit: The maximum number of items to return (min: 1, max: 100)
+        cursor: The opaque cursor of the page to fetch
+
+    Returns:
+        A list of jobs with their `distance_km`, nearest first
+    """
+    page = await db.run(job_service.get_nearby, lat, lon, radius_km, limit=limit, cursor=cursor)
+    return json_response(
+        [
+            job_serializer.to_dict(job) | {"distance_km": round(distance_km, 3)}
+            for job, distance_km in page.items
+        ],
+        headers=page.headers(),
+    )
+
+
+@router.get(
+    "/{job_id}", status_code=status.HTTP_200_OK, response_model=JobWithApplicationCountsResponseDto
+)
 async def get_job(
     authenticated_account: AuthenticatedAccountDep,
     job_id: UUID,
     job_service: JobServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Get a job by ID.
@@ -55,73 +153,68 @@ async def get_job(
         authenticated_account: The authenticated account from authentication
         job_id: The ID of the job to retrieve
         job_service: Injected job service
+        db: Injected database runner
 
     Returns:
-        Job information
-    """
-    job = job_service.get_by_id(authenticated_account.id, job_id)
-    return {
-        "id": job.id,
-        "account_id": job.account_id,
-        "title": job.title,
-        "description": job.description,
-        "budget": job.budget,
-        "location": job.location,
-        "start_date": job.start_date,
-        "end_date": job.end_date,
-        "created_at": job.created_at,
-        "updated_at": job.updated_at,
-    }
-
-
-@router.get("/", status_code=status.HTTP_200_OK)
+        Job information with its number of applications per status
+    """
+    job = await db.run(job_service.get_by_id, authenticated_account.id, job_id)
+    counts = await db.run(job_service.get_application_counts, [job.id])
+    return json_response(job_with_application_counts(job, counts[job.id]))
+
+
+@router.get(
+    "/", status_code=status.HTTP_200_OK, response_model=list[JobWithApplicationCountsResponseDto]
+)
 async def list_jobs(
     _: AuthenticatedAccountDep,
     job_service: JobServiceDep,
+    db: DbRunnerDep,
     offset: Annotated[int, Query(ge=0, description="Number of items to skip")] = 0,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Maximum number of items to return")
     ] = 100,
+    cursor: Annotated[
+        str | None, Query(description=f"Cursor from the {NEXT_CURSOR_HEADER} header")
+    ] = None,
 ):
     """
     List all jobs with pagination.
 
-    Results are ordered by creation date (newest first).
+    Results are ordered by creation date (newest first). When more results are available
+    the response carries an `X-Next-Cursor` header; pass it back as `cursor` to fetch the
+    next page. Cursors stay fast on deep pages, unlike `offset`.
 
     Args:
         _: The authenticated account from authentication
         job_service: Injected job service
+        db: Injected database runner
         offset: The number of items to skip before starting to collect the result set (min: 0)
         limit: The maximum number of items to return (min: 1, max: 100)
+        cursor: The opaque cursor of the page to fetch
+
+    Each job carries its number of applications per status, counted for the whole page in a
+    single query.
 
     Returns:
         A list of jobs ordered by creation date (newest first)
     """
 
-    jobs = job_service.get_all(offset=offset, limit=limit)
-    return [
-        {
-            "id": job.id,
-            "account_id": job.account_id,
-            "title": job.title,
-            "description": job.description,
-            "budget": job.budget,
-            "location": job.location,
-            "start_date": job.start_date,
-            "end_date": job.end_date,
-            "created_at": job.created_at,
-            "updated_at": job.updated_at,
-        }
-        for job in jobs
-    ]
-
-
-@router.put("/{job_id}", status_code=status.HTTP_200_OK)
+    page = await db.run(job_service.get_all, offset=offset, limit=limit, cursor=cursor)
+    counts = await db.run(job_service.get_application_counts, [job.id for job in page.items])
+    return json_response(
+        [job_with_application_counts(job, counts[job.id]) for job in page.items],
+        headers=page.headers(),
+    )
+
+
+@router.put("/{job_id}", status_code=status.HTTP_200_OK, response_model=JobResponseDto)
 async def update_job(
     authenticated_account: AuthenticatedAccountDep,
     job_id: UUID,
     dto: UpdateJobDto,
     job_service: JobServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Update a job by ID.
@@ -131,23 +224,13 @@ async def update_job(
         job_id: The ID of the job to update
         dto: The updated job data
         job_service: Injected job service
+        db: Injected database runner
 
     Returns:
         The updated job information
     """
-    job = job_service.update_job(authenticated_account.id, job_id, dto)
-    return {
-        "id": job.id,
-        "account_id": job.account_id,
-        "title": job.title,
-        "description": job.description,
-        "budget": job.budget,
-        "location": job.location,
-        "start_date": job.start_date,
-        "end_date": job.end_date,
-        "created_at": job.created_at,
-        "updated_at": job.updated_at,
-    }
+    job = await db.run(job_service.update_job, authenticated_account.id, job_id, dto)
+    return job_serializer.response(job)
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -155,6 +238,7 @@ async def delete_job(
     authenticated_account: AuthenticatedAccountDep,
     job_id: UUID,
     job_service: JobServiceDep,
+    db: DbRunnerDep,
 ):
     """
     Delete a job by ID.
@@ -163,45 +247,76 @@ async def delete_job(
         authenticated_account: The authenticated account from authentication
         job_id: The ID of the job to delete
         job_service: Injected job service
+        db: Injected database runner
     """
-    job_service.delete_job(authenticated_account.id, job_id)
+    await db.run(job_service.delete_job, authenticated_account.id, job_id)
 
 
-@router.get("/{job_id}/applications", status_code=status.HTTP_200_OK)
+@router.get(
+    "/{job_id}/applications",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ApplicationResponseDto],
+)
 async def list_applications_for_job(
     job_id: UUID,
     authenticated_account: AuthenticatedAccountDep,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
+    limit: Annotated[
+        int, Query(ge=1, le=100, description="Maximum number of items to return")
+    ] = 100,
+    cursor: Annotated[
+        str | None, Query(description=f"Cursor from the {NEXT_CURSOR_HEADER} header")
+    ] = None,
+):
+    page = await db.run(
+        application_service.list_applications_for_job,
+        authenticated_account.id,
+        job_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    return application_serializer.list_response(page.items, headers=page.headers())
+
+
+@router.post(
+    "/{job_id}/applications:batch-update",
+    status_code=status.HTTP_200_OK,
+    response_model=list[ApplicationBatchResult],
+)
+async def batch_update_applications(
+    job_id: UUID,
+    dto: BatchUpdateApplicationsDto,
+    authenticated_account: AuthenticatedAccountDep,
+    application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
-    applications = application_service.list_applications_for_job(authenticated_account.id, job_id)
-    return [
-        {
-            "id": app.id,
-            "job_id": app.job_id,
-            "account_id": app.account_id,
-            "status": app.status,
-            "message": app.message,
-            "created_at": app.created_at,
-            "updated_at": app.updated_at,
-        }
-        for app in applications
-    ]
-
-
-@router.post("/{job_id}/applications", status_code=status.HTTP_201_CREATED)
+    """
+    Accept or reject several applications of a job in one request.
+
+    Only the EMPLOYER account that owns the job can perform this. Ownership is checked once
+    and every transition is applied in a single UPDATE. Each item of the response reports
+    whether the application was `UPDATED` or `NOT_FOUND` (it does not belong to the job).
+    """
+    results = await db.run(
+        application_service.batch_update_applications, authenticated_account.id, job_id, dto
+    )
+    return application_batch_result_serializer.list_response(results)
+
+
+@router.post(
+    "/{job_id}/applications",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ApplicationResponseDto,
+)
 async def apply_to_job(
     authenticated_account: AuthenticatedAccountDep,
     job_id: UUID,
     dto: CreateApplicationDto,
     application_service: ApplicationServiceDep,
+    db: DbRunnerDep,
 ):
-    application = application_service.apply_to_job(authenticated_account.id, job_id, dto)
-    return {
-        "id": application.id,
-        "job_id": application.job_id,
-        "account_id": application.account_id,
-        "status": application.status,
-        "message": application.message,
-        "created_at": application.created_at,
-        "updated_at": application.updated_at,
-    }
+    application = await db.run(
+        application_service.apply_to_job, authenticated_account.id, job_id, dto
+    )
+    return application_serializer.response(application, status_code=status.HTTP_201_CREATED)
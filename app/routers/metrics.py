@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Response, status
+
+from app.config.metrics import METRICS_CONTENT_TYPE, render_metrics
+
+router = APIRouter(tags=["Metrics"], include_in_schema=False)
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK)
+def get_metrics():
+    """
+    Prometheus scrape endpoint.
+
+    Synchronous on purpose: with `PROMETHEUS_MULTIPROC_DIR` set, every worker's sample
+    files are read from disk, so it runs in the thread pool instead of the event loop.
+
+    Returns:
+        Request latency per route, in-flight requests, database pool checkouts, Redis
+        command latency and auth cache outcomes, in the Prometheus text format
+    """
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
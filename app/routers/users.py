@@ -1,6 +1,6 @@
 from fastapi import APIRouter, status
 
-from app.config.dependencies import AuthenticatedUserDep, UserServiceDep
+from app.config.dependencies import AuthenticatedUserDep, DbRunnerDep, UserServiceDep
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -16,11 +16,13 @@ async def get_current_user(authenticated_user: AuthenticatedUserDep):
 
 
 @router.get("/sessions", status_code=status.HTTP_200_OK)
-async def get_user_sessions(authenticated_user: AuthenticatedUserDep, user_service: UserServiceDep):
+async def get_user_sessions(
+    authenticated_user: AuthenticatedUserDep, user_service: UserServiceDep, db: DbRunnerDep
+):
     """
     Get all sessions for the authenticated user.
     """
-    sessions = user_service.get_user_sessions(authenticated_user.id)
+    sessions = await db.run(user_service.get_user_sessions, authenticated_user.id)
 
     return [
         {
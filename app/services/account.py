@@ -5,13 +5,19 @@ from fastapi import HTTPException, status
 
 from app.domain.models.account import Account, AccountType, AccountUpdate
 from app.domain.repositories.interfaces.account import IAccountRepository
+from app.domain.repositories.interfaces.principal import IPrincipalRepository
 from app.dto.account import CreateAccountDto, UpdateAccountDto
 from app.services.interfaces.account import IAccountService
 
 
 class AccountService(IAccountService):
-    def __init__(self, account_repository: IAccountRepository):
+    def __init__(
+        self,
+        account_repository: IAccountRepository,
+        principal_repository: IPrincipalRepository | None = None,
+    ):
         self.account_repository = account_repository
+        self.principal_repository = principal_repository
 
     def get_account_by_id(self, user_id: UUID, account_id: UUID) -> Account:
         account = self.account_repository.get_by_id(account_id)
@@ -53,4 +59,6 @@ class AccountService(IAccountService):
         updated_account = self.account_repository.update(account_id, account_update)
         if not updated_account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+        if self.principal_repository:
+            self.principal_repository.invalidate_user(user_id)
         return updated_account
@@ -4,11 +4,18 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from app.domain.models.account import Account, AccountType
-from app.domain.models.application import Application, ApplicationStatus, ApplicationUpdate
+from app.domain.models.application import (
+    Application,
+    ApplicationBatchOutcome,
+    ApplicationBatchResult,
+    ApplicationStatus,
+    ApplicationUpdate,
+)
+from app.domain.pagination import Page, parse_cursor
 from app.domain.repositories.interfaces.account import IAccountRepository
 from app.domain.repositories.interfaces.application import IApplicationRepository
 from app.domain.repositories.interfaces.job import IJobRepository
-from app.dto.application import CreateApplicationDto
+from app.dto.application import BatchUpdateApplicationsDto, CreateApplicationDto
 from app.services.interfaces.application import IApplicationService
 
 
@@ -56,7 +63,9 @@ class ApplicationService(IApplicationService):
         application = Application(job_id=job.id, account_id=account.id, message=dto.message)
         return self.application_repository.create(application)
 
-    def list_applications_for_job(self, account_id: UUID, job_id: UUID) -> Sequence[Application]:
+    def list_applications_for_job(
+        self, account_id: UUID, job_id: UUID, limit: int = 100, cursor: str | None = None
+    ) -> Page[Application]:
         job = self.job_repository.get_by_id(job_id)
         if not job:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
@@ -76,9 +85,19 @@ class ApplicationService(IApplicationService):
                 detail="You are not authorized to access this job",
             )
 
-        return self.application_repository.get_by_job_id(job.id, offset=0, limit=1000)
+        rows = self.application_repository.get_by_job_id(
+            job.id, offset=0, limit=limit + 1, cursor=parse_cursor(cursor)
+        )
+        return Page.from_rows(rows, limit)
 
-    def list_applications_for_account(self, account_id: UUID) -> Sequence[Application]:
+    def list_applications_for_account(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: str | None = None,
+        application_status: ApplicationStatus | None = None,
+        include_job: bool = False,
+    ) -> Page[Application]:
         account = self.account_repository.get_by_id(account_id)
         if not account:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
@@ -87,7 +106,15 @@ class ApplicationService(IApplicationService):
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You are not authorized to access this resource",
             )
-        return self.application_repository.get_by_account_id(account.id, offset=0, limit=1000)
+        rows = self.application_repository.get_by_account_id(
+            account.id,
+            offset=0,
+            limit=limit + 1,
+            cursor=parse_cursor(cursor),
+            status=application_status,
+            include_job=include_job,
+        )
+        return Page.from_rows(rows, limit)
 
     def get_application(self, account_id: UUID, application_id: UUID) -> Application:
         """Get a single application by ID. Accessible by DRONER owner or job owner."""
@@ -222,3 +249,41 @@ class ApplicationService(IApplicationService):
                 detail="Failed to update application",
             )
         return updated
+
+    def batch_update_applications(
+        self, account_id: UUID, job_id: UUID, dto: BatchUpdateApplicationsDto
+    ) -> list[ApplicationBatchResult]:
+        """Accept or reject several applications of a job; only job owner can perform."""
+        job = self.job_repository.get_by_id(job_id)
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+        account = self.account_repository.get_by_id(account_id)
+        if not account:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Account not found")
+
+        if account.account_type != AccountType.EMPLOYER:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only employer accounts can update applications",
+            )
+
+        if job.account_id != account.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not authorized to update applications for this job",
+            )
+
+        statuses = {update.application_id: update.status for update in dto.updates}
+        updated = self.application_repository.update_statuses(job.id, statuses)
+        return [
+            ApplicationBatchResult(
+                application_id=application_id,
+                status=new_status,
+                outcome=ApplicationBatchOutcome.UPDATED
+                if application_id in updated
+                else ApplicationBatchOutcome.NOT_FOUND,
+                updated_at=updated.get(application_id),
+            )
+            for application_id, new_status in statuses.items()
+        ]
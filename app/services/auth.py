@@ -1,21 +1,39 @@
 import datetime
+import math
+import time
 from typing import Literal
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import jwt
 from fastapi import HTTPException, status
 from redis.client import Redis
 from sqlalchemy.exc import IntegrityError
 
-from app.domain.models.account import Account
+from app.config.metrics import (
+    AUTH_PRINCIPAL_CACHE,
+    AUTH_REFRESH_ROTATIONS,
+    AUTH_REVOCATION_CHECKS,
+)
+from app.config.revocation import (
+    BLACKLIST_CHANNEL,
+    EPOCH_CHANNEL,
+    SESSION_EPOCH_PREFIX,
+    USER_EPOCH_PREFIX,
+    RevocationList,
+    is_revoked_by,
+    revocation_keys,
+)
+from app.config.throttle import LoginThrottle
 from app.domain.models.session import UserSession
 from app.domain.models.user import User
 from app.domain.repositories.interfaces.account import IAccountRepository
 from app.domain.repositories.interfaces.auth import IAuthRepository, JwtTokenPayload, JwtTokenType
+from app.domain.repositories.interfaces.principal import IPrincipalRepository, Principal
+from app.domain.repositories.interfaces.refresh import IRefreshTokenRepository, RotationResult
 from app.domain.repositories.interfaces.session import ISessionRepository
 from app.domain.repositories.interfaces.user import IUserRepository
 from app.dto.auth import SigninDTO, SignupDTO
-from app.services.interfaces.auth import IAuthService
+from app.services.interfaces.auth import AuthenticatedAccount, IAuthService
 
 
 class AuthService(IAuthService):
@@ -28,12 +46,25 @@ class AuthService(IAuthService):
         user_repository: IUserRepository,
         session_repository: ISessionRepository,
         account_repository: IAccountRepository,
+        principal_repository: IPrincipalRepository | None = None,
+        revocation_list: RevocationList | None = None,
+        account_claims: bool = False,
+        revocation_ttl_seconds: int | None = None,
+        refresh_token_repository: IRefreshTokenRepository | None = None,
+        login_throttle: LoginThrottle | None = None,
     ):
         self.cache = cache
         self.auth_repository = auth_repository
         self.user_repository = user_repository
         self.session_repository = session_repository
         self.account_repository = account_repository
+        self.principal_repository = principal_repository
+        self.revocation_list = revocation_list
+        self.account_claims = account_claims
+        # Revocation epochs must outlive every access token issued before them
+        self.revocation_ttl_seconds = revocation_ttl_seconds
+        self.refresh_token_repository = refresh_token_repository
+        self.login_throttle = login_throttle
 
     def _decode_token_safely(
         self, token: str, expected_type: JwtTokenType | None = None
@@ -76,9 +107,27 @@ class AuthService(IAuthService):
 
         return payload
 
-    def _check_token_blacklist(self, jti: str) -> None:
-        """Check if token is blacklisted and raise exception if it is."""
-        if jti and self.cache.get(f"blacklist:{jti}"):
+    def _is_revoked_locally(self, payload: JwtTokenPayload) -> bool | None:
+        """Check the worker's copy of the revocations; None means Redis must be asked."""
+        if self.revocation_list is None:
+            return None
+        return self.revocation_list.is_revoked(
+            payload.jti, payload.sid, payload.sub, payload.issued_at
+        )
+
+    def _check_token_revoked(self, payload: JwtTokenPayload, use_local: bool = True) -> None:
+        """
+        Raise if the token is blacklisted or its session or user was revoked after it was issued.
+
+        The worker's copy of the revocations answers when it is in sync; otherwise, or with
+        `use_local=False`, a single MGET reads the token's blacklist entry and epochs.
+        """
+        revoked = self._is_revoked_locally(payload) if use_local else None
+        AUTH_REVOCATION_CHECKS.labels("redis" if revoked is None else "local").inc()
+        if revoked is None:
+            values = self.cache.mget(revocation_keys(payload.jti, payload.sid, payload.sub))
+            revoked = is_revoked_by(values, payload.issued_at)
+        if revoked:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been revoked",
@@ -112,8 +161,8 @@ class AuthService(IAuthService):
             )
 
         # Check if session has expired
-        if session.is_expired():
-            self.session_repository.deactivate(session_id)
+        if self._is_session_expired(session):
+            self._deactivate_session(session_id)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Session has expired",
@@ -122,6 +171,24 @@ class AuthService(IAuthService):
 
         return session
 
+    def _is_session_expired(self, session: UserSession) -> bool:
+        """
+        Check if the session has expired, counting a refresh whose new expiry is not yet
+        written to the database.
+        """
+        if not session.is_expired():
+            return False
+        if self.refresh_token_repository is None:
+            return True
+        expires_at = self.refresh_token_repository.get_pending_expiry(session.id)
+        return expires_at is None or expires_at <= datetime.datetime.now(datetime.UTC)
+
+    def _deactivate_session(self, session_id: UUID) -> None:
+        """Deactivate a session and drop its cached principals."""
+        self.session_repository.deactivate(session_id)
+        if self.principal_repository:
+            self.principal_repository.invalidate_session(session_id)
+
     def _calculate_token_ttl(self, exp: int) -> int:
         """Calculate TTL for a token based on its expiration."""
         return exp - int(datetime.datetime.now(datetime.UTC).timestamp())
@@ -132,6 +199,22 @@ class AuthService(IAuthService):
             ttl = self._calculate_token_ttl(exp)
             if ttl > 0:
                 self.cache.setex(f"blacklist:{jti}", ttl, "1")
+                self.cache.publish(BLACKLIST_CHANNEL, f"{jti}:{exp}")
+                if self.revocation_list:
+                    self.revocation_list.add(jti, exp)
+
+    def _revoke(self, key: str) -> None:
+        """
+        Set the revocation epoch under `key` to now, revoking every token of the session or
+        user issued until now, and announce it to the other workers.
+        """
+        epoch = time.time()
+        ttl = self.revocation_ttl_seconds
+        expires_at = epoch + ttl if ttl else math.inf
+        self.cache.set(key, epoch, ex=ttl)
+        self.cache.publish(EPOCH_CHANNEL, f"{key}:{epoch}:{expires_at}")
+        if self.revocation_list:
+            self.revocation_list.add_epoch(key, epoch, expires_at)
 
     def _validate_user_exists_and_active(self, user_id: UUID) -> User:
         """Validate user exists and is active."""
@@ -152,23 +235,45 @@ class AuthService(IAuthService):
 
         return user
 
+    def _access_claims(self, user_id: UUID) -> dict | None:
+        """
+        Active accounts of the user and their claims version, for a new access token.
+
+        The version is read before the accounts, so a change racing with the token issue
+        leaves the token with an outdated version rather than outdated accounts.
+        """
+        if not self.account_claims or self.principal_repository is None:
+            return None
+        version = self.principal_repository.get_version(user_id)
+        accounts = self.account_repository.get_user_accounts(user_id)
+        return {
+            "acc": {
+                str(account.id): account.account_type for account in accounts if account.is_active
+            },
+            "ver": version,
+        }
+
     def _create_session_and_tokens(self, user: User, client_ip: str) -> tuple[str, str]:
-        """Create session and generate access and refresh tokens."""
-        session = UserSession(
-            user_id=user.id,
-            host=client_ip,
-            expires_at=datetime.datetime.now(datetime.UTC),
-        )
-        session = self.session_repository.create(session)
+        """
+        Create session and generate access and refresh tokens.
 
-        # Create tokens with the actual session ID and get expiration
+        The session ID is generated up front, so the tokens and the session expiry are known
+        before the row is written in a single INSERT.
+        """
+        session_id = uuid4()
         (access_token, refresh_token, refresh_token_exp) = self.auth_repository.create_token(
-            {"sub": str(user.id), "sid": str(session.id)}
+            {"sub": str(user.id), "sid": str(session_id)},
+            access_claims=self._access_claims(user.id),
         )
 
-        # Update session expiry to match the refresh token
-        session.expires_at = refresh_token_exp
-        self.session_repository.update(session)
+        self.session_repository.create(
+            UserSession(
+                id=session_id,
+                user_id=user.id,
+                host=client_ip,
+                expires_at=refresh_token_exp,
+            )
+        )
 
         return access_token, refresh_token
 
@@ -191,15 +296,33 @@ class AuthService(IAuthService):
         return user, access_token, refresh_token
 
     def signin(self, client_ip: str, dto: SigninDTO) -> tuple[str, str]:
-        """Authenticate a user and return JWT access token and refresh token."""
+        """
+        Authenticate a user and return JWT access token and refresh token.
+
+        The login throttle runs first, so rejected attempts cost neither a query nor a
+        password hash. A password hashed with other Argon2 parameters than the configured
+        ones is rehashed with them once verified.
+        """
+        if self.login_throttle:
+            self.login_throttle.check(client_ip, dto.email)
+
         user = self.user_repository.get_by_email(dto.email)
 
-        if not user or not self.auth_repository.verify_password(dto.password, user.hashed_password):
+        valid, updated_hash = (
+            self.auth_repository.verify_and_update_password(dto.password, user.hashed_password)
+            if user
+            else (False, None)
+        )
+        if not user or not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
             )
 
+        if updated_hash:
+            user.hashed_password = updated_hash
+            user = self.user_repository.update(user)
+
         return self._create_session_and_tokens(user, client_ip)
 
     def authorize(self, token: str) -> JwtTokenPayload:
@@ -210,18 +333,28 @@ class AuthService(IAuthService):
         """Get authenticated user from access token."""
         payload = self.authorize(token)
 
-        self._check_token_blacklist(payload.jti)
+        self._check_token_revoked(payload)
         self._validate_token_payload(payload, ["sub", "sid"])
         self._validate_session(payload.sid)
 
         return self._validate_user_exists_and_active(payload.sub)
 
-    def get_authenticated_account(self, token: str, account_id: UUID) -> Account:
+    def get_authenticated_account(self, token: str, account_id: UUID) -> AuthenticatedAccount:
         """
         Get authenticated account from access token and account ID.
 
         Validates that the user is authenticated and owns the specified account.
         """
+        if self.principal_repository:
+            payload = self.authorize(token)
+            self._validate_token_payload(payload, ["sub", "sid"])
+            claimed = self._get_account_from_claims(payload, account_id)
+            if claimed is not None:
+                return claimed
+            return AuthenticatedAccount.from_account(
+                self._get_authenticated_principal(payload, account_id).account
+            )
+
         # First, authenticate the user
         user = self.get_authenticated_user(token)
 
@@ -246,13 +379,161 @@ class AuthService(IAuthService):
                 detail="Your account has been deactivated",
             )
 
-        return account
+        return AuthenticatedAccount.from_account(account)
+
+    def _get_account_from_claims(
+        self, payload: JwtTokenPayload, account_id: UUID
+    ) -> AuthenticatedAccount | None:
+        """
+        Authorize the account from the access token's claims, without touching the database.
+
+        One MGET checks the token's revocation (unless the worker's copy of the revocations
+        already answered) and reads the user's claims version. Returns None, for the caller to
+        load the principal instead, when the token does not list the account or its version
+        is outdated because the user or their accounts changed since it was issued.
+        """
+        assert self.principal_repository is not None
+
+        account_type = (payload.acc or {}).get(account_id)
+        if account_type is None or payload.ver is None:
+            return None
+
+        revoked_locally = self._is_revoked_locally(payload)
+        AUTH_REVOCATION_CHECKS.labels("redis" if revoked_locally is None else "local").inc()
+        lookup = self.principal_repository.lookup_version(
+            payload if revoked_locally is None else None, payload.sub
+        )
+        if revoked_locally or lookup.revoked:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if lookup.version != payload.ver:
+            return None
+
+        AUTH_PRINCIPAL_CACHE.labels("claims").inc()
+        return AuthenticatedAccount(id=account_id, user_id=payload.sub, account_type=account_type)
+
+    def _get_authenticated_principal(self, payload: JwtTokenPayload, account_id: UUID) -> Principal:
+        """
+        Resolve the principal for a validated access token payload and account ID.
+
+        A single cache round trip checks the token's revocation (unless the worker's copy of
+        the revocations already answered) and fetches the cached principal; on a miss the
+        session, user and account are loaded with one joined query, validated and cached.
+        """
+        assert self.principal_repository is not None
+
+        revoked_locally = self._is_revoked_locally(payload)
+        AUTH_REVOCATION_CHECKS.labels("redis" if revoked_locally is None else "local").inc()
+        lookup = self.principal_repository.lookup(
+            payload if revoked_locally is None else None, payload.sid, account_id
+        )
+        if revoked_locally or lookup.revoked:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        principal = lookup.principal
+        if principal and principal.user.id == payload.sub and not principal.session.is_expired():
+            AUTH_PRINCIPAL_CACHE.labels("hit").inc()
+            return principal
+        AUTH_PRINCIPAL_CACHE.labels("miss").inc()
+
+        row = self.session_repository.get_principal(payload.sid, account_id)
+        if row is None or not row[0].is_active or row[0].user_id != payload.sub:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        session, user, account = row
+        if self._is_session_expired(session):
+            self._deactivate_session(session.id)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Session has expired",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Inactive user account",
+            )
+
+        if not account:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Account not found",
+            )
+
+        if account.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not authorized to access this account",
+            )
+
+        if not account.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Your account has been deactivated",
+            )
+
+        principal = Principal(session=session, user=user, account=account)
+        self.principal_repository.store(principal)
+        return principal
 
     def refresh_token(self, refresh_token: str) -> tuple[str, str]:
-        """Refresh access token using refresh token."""
+        """
+        Refresh access token using refresh token.
+
+        With the refresh token repository, the token is spent and its successor recorded by
+        one atomic Redis script, and the session's new expiry is left for the session reaper
+        to write in a batch. Reusing a spent token revokes the session.
+        """
         payload = self._decode_token_safely(refresh_token, expected_type=JwtTokenType.REFRESH)
+        if self.refresh_token_repository is None:
+            return self._refresh_token_and_session(payload)
+
+        self._validate_token_payload(payload, ["sub", "sid", "jti"])
+        self._validate_session(payload.sid)
+
+        new_jti = str(uuid4())
+        access_token, new_refresh_token, refresh_token_exp = self.auth_repository.create_token(
+            {"sub": str(payload.sub), "sid": str(payload.sid)},
+            access_claims=self._access_claims(payload.sub),
+            refresh_jti=new_jti,
+        )
+
+        result = self.refresh_token_repository.rotate(
+            payload, new_jti, refresh_token_exp, self.revocation_ttl_seconds
+        )
+        AUTH_REFRESH_ROTATIONS.labels(result.name.lower()).inc()
+        if result is RotationResult.REUSED:
+            self._deactivate_session(payload.sid)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token reuse detected, session revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if result is RotationResult.REVOKED:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return access_token, new_refresh_token
 
-        self._check_token_blacklist(payload.jti)
+    def _refresh_token_and_session(self, payload: JwtTokenPayload) -> tuple[str, str]:
+        """Refresh by blacklisting the spent token and updating the session right away."""
+        # A refresh token is spent on first use, so never trust a lagging local copy here.
+        self._check_token_revoked(payload, use_local=False)
         self._validate_token_payload(payload, ["sub", "sid"])
 
         session = self._validate_session(payload.sid)
@@ -260,7 +541,8 @@ class AuthService(IAuthService):
         self._blacklist_token(payload.jti, payload.exp_timestamp)
 
         access_token, new_refresh_token, refresh_token_exp = self.auth_repository.create_token(
-            {"sub": str(payload.sub), "sid": str(payload.sid)}
+            {"sub": str(payload.sub), "sid": str(payload.sid)},
+            access_claims=self._access_claims(payload.sub),
         )
 
         session.expires_at = refresh_token_exp
@@ -273,6 +555,22 @@ class AuthService(IAuthService):
 
         payload = self.authorize(token)
 
-        self.session_repository.deactivate(payload.sid)
-        self._blacklist_token(payload.jti, payload.exp_timestamp)
+        self._deactivate_session(payload.sid)
+        self._revoke(f"{SESSION_EPOCH_PREFIX}{payload.sid}")
         return True
+
+    def signout_all(self, token: str) -> int:
+        """
+        Revoke every session of the user and return how many were active.
+
+        One revocation epoch revokes all the user's tokens without enumerating them, and
+        the sessions are deactivated in a single UPDATE so none can be refreshed.
+        """
+        payload = self.authorize(token)
+        self._check_token_revoked(payload)
+
+        self._revoke(f"{USER_EPOCH_PREFIX}{payload.sub}")
+        count = self.session_repository.deactivate_all_by_user_id(payload.sub)
+        if self.principal_repository:
+            self.principal_repository.invalidate_user(payload.sub)
+        return count
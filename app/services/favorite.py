@@ -4,6 +4,7 @@ from uuid import UUID
 from fastapi import HTTPException, status
 
 from app.domain.models.favorite import Favorite
+from app.domain.pagination import Page, parse_cursor
 from app.domain.repositories.interfaces.favorite import IFavoriteRepository
 from app.dto.favorite import CreateFavoriteDto
 from app.services.interfaces.favorite import IFavoriteService
@@ -14,7 +15,7 @@ class FavoriteService(IFavoriteService):
         self.favorite_repository = favorite_repository
 
     def create_favorite(self, account_id: UUID, dto: CreateFavoriteDto) -> Favorite:
-        """Create a new favorite entry."""
+        """Create a new favorite entry; favoriting the same job again returns the existing one."""
         favorite = Favorite(account_id=account_id, job_id=dto.job_id)
         return self.favorite_repository.create(favorite)
 
@@ -28,9 +29,23 @@ class FavoriteService(IFavoriteService):
             )
         return favorite
 
-    def get_favorites_by_account_id(self, account_id: UUID) -> Sequence[Favorite]:
-        """Retrieve favorite entries by Account ID."""
-        return self.favorite_repository.get_by_account_id(account_id)
+    def get_favorites_by_account_id(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_job: bool = False,
+    ) -> Page[Favorite]:
+        """Retrieve a page of favorite entries by Account ID, newest first."""
+        rows = self.favorite_repository.get_by_account_id(
+            account_id, limit=limit + 1, cursor=parse_cursor(cursor), include_job=include_job
+        )
+        return Page.from_rows(rows, limit)
+
+    def get_favorited(self, account_id: UUID, job_ids: Sequence[UUID]) -> list[bool]:
+        """Whether the account has favorited each of `job_ids`, in order."""
+        favorited = self.favorite_repository.get_favorited_job_ids(account_id, job_ids)
+        return [job_id in favorited for job_id in job_ids]
 
     def delete_favorite(self, account_id: UUID, favorite_id: UUID) -> bool:
         """Delete a favorite entry by ID."""
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
 from uuid import UUID
 
-from app.domain.models.application import Application
-from app.dto.application import CreateApplicationDto
+from app.domain.models.application import Application, ApplicationBatchResult, ApplicationStatus
+from app.domain.pagination import Page
+from app.dto.application import BatchUpdateApplicationsDto, CreateApplicationDto
 
 
 class IApplicationService(ABC):
@@ -14,12 +14,24 @@ class IApplicationService(ABC):
         """Create an application for a job by a droner account belonging to user."""
 
     @abstractmethod
-    def list_applications_for_job(self, account_id: UUID, job_id: UUID) -> Sequence[Application]:
-        """List applications for a job (only if account owns the job)."""
+    def list_applications_for_job(
+        self, account_id: UUID, job_id: UUID, limit: int = 100, cursor: str | None = None
+    ) -> Page[Application]:
+        """List a page of applications for a job (only if account owns the job)."""
 
     @abstractmethod
-    def list_applications_for_account(self, account_id: UUID) -> Sequence[Application]:
-        """List all applications submitted by the account."""
+    def list_applications_for_account(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: str | None = None,
+        application_status: ApplicationStatus | None = None,
+        include_job: bool = False,
+    ) -> Page[Application]:
+        """
+        List a page of applications submitted by the account, optionally only those in
+        `application_status` and with their job loaded in the same query.
+        """
 
     @abstractmethod
     def get_application(self, account_id: UUID, application_id: UUID) -> Application:
@@ -36,3 +48,9 @@ class IApplicationService(ABC):
     @abstractmethod
     def reject_application(self, account_id: UUID, application_id: UUID) -> Application:
         """Reject an application (set status to REJECTED); only job owner can perform."""
+
+    @abstractmethod
+    def batch_update_applications(
+        self, account_id: UUID, job_id: UUID, dto: BatchUpdateApplicationsDto
+    ) -> list[ApplicationBatchResult]:
+        """Accept or reject several applications of a job; only job owner can perform."""
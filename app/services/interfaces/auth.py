@@ -1,12 +1,32 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from uuid import UUID
 
-from app.domain.models.account import Account
+from app.domain.models.account import Account, AccountType
 from app.domain.models.user import User
 from app.domain.repositories.interfaces.auth import JwtTokenPayload
 from app.dto.auth import SigninDTO, SignupDTO
 
 
+@dataclass(frozen=True)
+class AuthenticatedAccount:
+    """
+    Account an authenticated request acts as.
+
+    Only what the access token's claims can vouch for: it may be built without loading
+    the account, so it carries no name or other profile fields.
+    """
+
+    id: UUID
+    user_id: UUID
+    account_type: AccountType
+
+    @classmethod
+    def from_account(cls, account: Account) -> "AuthenticatedAccount":
+        """Build from a loaded account."""
+        return cls(id=account.id, user_id=account.user_id, account_type=account.account_type)
+
+
 class IAuthService(ABC):
     """Auth service interface."""
 
@@ -27,7 +47,7 @@ class IAuthService(ABC):
         """Get authenticated user from access token."""
 
     @abstractmethod
-    def get_authenticated_account(self, token: str, account_id: UUID) -> Account:
+    def get_authenticated_account(self, token: str, account_id: UUID) -> AuthenticatedAccount:
         """Get authenticated account from access token and account ID."""
 
     @abstractmethod
@@ -37,3 +57,7 @@ class IAuthService(ABC):
     @abstractmethod
     def signout(self, token: str) -> bool:
         """Sign out a user and revoke their session."""
+
+    @abstractmethod
+    def signout_all(self, token: str) -> int:
+        """Revoke every session of the user and return how many were active."""
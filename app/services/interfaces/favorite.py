@@ -3,6 +3,7 @@ from collections.abc import Sequence
 from uuid import UUID
 
 from app.domain.models.favorite import Favorite
+from app.domain.pagination import Page
 from app.dto.favorite import CreateFavoriteDto
 
 
@@ -16,8 +17,18 @@ class IFavoriteService(ABC):
         """Retrieve a favorite entry by ID."""
 
     @abstractmethod
-    def get_favorites_by_account_id(self, account_id: UUID) -> Sequence[Favorite]:
-        """Retrieve favorite entries by Account ID."""
+    def get_favorites_by_account_id(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        cursor: str | None = None,
+        include_job: bool = False,
+    ) -> Page[Favorite]:
+        """Retrieve a page of favorite entries by Account ID, newest first."""
+
+    @abstractmethod
+    def get_favorited(self, account_id: UUID, job_ids: Sequence[UUID]) -> list[bool]:
+        """Whether the account has favorited each of `job_ids`, in order."""
 
     @abstractmethod
     def delete_favorite(self, account_id: UUID, favorite_id: UUID) -> bool:
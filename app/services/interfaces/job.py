@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from uuid import UUID
 
+from app.domain.models.application import ApplicationCounts
 from app.domain.models.job import Job
+from app.domain.pagination import Page
 from app.dto.job import CreateJobDto, UpdateJobDto
 
 
@@ -16,8 +18,29 @@ class IJobService(ABC):
         """Retrieve a job by ID."""
 
     @abstractmethod
-    def get_all(self, offset: int = 0, limit: int = 100) -> Sequence[Job]:
-        """Retrieve all jobs."""
+    def get_all(self, offset: int = 0, limit: int = 100, cursor: str | None = None) -> Page[Job]:
+        """Retrieve a page of jobs, newest first."""
+
+    @abstractmethod
+    def search(
+        self, query: str, location: str | None = None, offset: int = 0, limit: int = 100
+    ) -> Sequence[Job]:
+        """Search jobs by keyword."""
+
+    @abstractmethod
+    def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> Page[tuple[Job, float]]:
+        """Retrieve a page of jobs near a coordinate, nearest first, with distances in km."""
+
+    @abstractmethod
+    def get_application_counts(self, job_ids: Sequence[UUID]) -> dict[UUID, ApplicationCounts]:
+        """Get the number of applications per status of each job."""
 
     @abstractmethod
     def update_job(self, account_id: UUID, job_id: UUID, dto: UpdateJobDto) -> Job:
@@ -1,9 +1,12 @@
+import math
 from collections.abc import Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
 
+from app.domain.models.application import ApplicationCounts
 from app.domain.models.job import Job, JobUpdate
+from app.domain.pagination import DistanceCursor, Page, parse_cursor, parse_distance_cursor
 from app.domain.repositories.interfaces.job import IJobRepository
 from app.dto.job import CreateJobDto, UpdateJobDto
 from app.services.interfaces.job import IJobService
@@ -21,6 +24,8 @@ class JobService(IJobService):
             description=dto.description,
             budget=dto.budget,
             location=dto.location,
+            latitude=dto.latitude,
+            longitude=dto.longitude,
             start_date=dto.start_date,
             end_date=dto.end_date,
         )
@@ -38,9 +43,46 @@ class JobService(IJobService):
             )
         return job
 
-    def get_all(self, offset: int = 0, limit: int = 100) -> Sequence[Job]:
-        """Retrieve all jobs."""
-        return self.job_repository.get_all(offset=offset, limit=limit)
+    def get_all(self, offset: int = 0, limit: int = 100, cursor: str | None = None) -> Page[Job]:
+        """Retrieve a page of jobs, newest first."""
+        rows = self.job_repository.get_all(
+            offset=offset, limit=limit + 1, cursor=parse_cursor(cursor)
+        )
+        return Page.from_rows(rows, limit)
+
+    def search(
+        self, query: str, location: str | None = None, offset: int = 0, limit: int = 100
+    ) -> Sequence[Job]:
+        """Search jobs by keyword, best matches first."""
+        return self.job_repository.search(query, location=location, offset=offset, limit=limit)
+
+    def get_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> Page[tuple[Job, float]]:
+        """Retrieve a page of jobs near a coordinate, nearest first, with distances in km."""
+        rows = self.job_repository.get_nearby(
+            latitude,
+            longitude,
+            radius_km,
+            limit=limit + 1,
+            cursor=parse_distance_cursor(cursor),
+        )
+        page = Page.from_rows(
+            rows, limit, cursor_for=lambda row: DistanceCursor(row[1], row[0].id).encode()
+        )
+        return Page(
+            items=[(job, math.sqrt(distance_sq)) for job, distance_sq in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    def get_application_counts(self, job_ids: Sequence[UUID]) -> dict[UUID, ApplicationCounts]:
+        """Get the number of applications per status of each job, in one query for a page."""
+        return self.job_repository.get_application_counts(job_ids)
 
     def update_job(self, account_id: UUID, job_id: UUID, dto: UpdateJobDto) -> Job:
         """Update an existing job."""
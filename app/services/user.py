@@ -6,15 +6,27 @@ from fastapi import HTTPException, status
 
 from app.domain.models.session import UserSession
 from app.domain.models.user import User
+from app.domain.repositories.interfaces.principal import IPrincipalRepository
 from app.domain.repositories.interfaces.session import ISessionRepository
 from app.domain.repositories.interfaces.user import IUserRepository
 from app.services.interfaces.user import IUserService
 
 
 class UserService(IUserService):
-    def __init__(self, user_repository: IUserRepository, session_repository: ISessionRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        session_repository: ISessionRepository,
+        principal_repository: IPrincipalRepository | None = None,
+    ):
         self.user_repository = user_repository
         self.session_repository = session_repository
+        self.principal_repository = principal_repository
+
+    def _invalidate_principals(self, user_id: UUID) -> None:
+        """Drop cached principals so user changes (e.g. deactivation) apply immediately."""
+        if self.principal_repository:
+            self.principal_repository.invalidate_user(user_id)
 
     def get_user_by_id(self, user_id: UUID) -> User | None:
         """Get a user by ID."""
@@ -48,9 +60,13 @@ class UserService(IUserService):
         # Update allowed fields
         if "email" in kwargs:
             user.email = kwargs["email"]
+        if "is_active" in kwargs:
+            user.is_active = kwargs["is_active"]
 
         user.updated_at = datetime.now(UTC)
-        return self.user_repository.update(user)
+        updated_user = self.user_repository.update(user)
+        self._invalidate_principals(user_id)
+        return updated_user
 
     def delete_user(self, user_id: UUID) -> bool:
         """Delete a user."""
@@ -60,6 +76,7 @@ class UserService(IUserService):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with ID {user_id} not found",
             )
+        self._invalidate_principals(user_id)
         return bool(success)
 
     def get_user_sessions(self, user_id: UUID) -> Sequence[UserSession]:
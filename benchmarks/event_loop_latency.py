@@ -0,0 +1,165 @@
+"""
+Concurrent-request latency benchmark.
+
+Runs the app in-process on a single event loop (like one uvicorn worker) against a
+temporary SQLite database and fakeredis, fires concurrent `GET /jobs` requests and,
+alongside them, probes `GET /health`. The probe latency is the signal: when handlers
+block the event loop on database round trips, `/health` queues behind every query.
+
+`--db-latency-ms` adds a fixed delay to every statement to emulate the network round
+trip to Postgres, which an on-disk SQLite database does not have.
+
+Usage:
+    python -m benchmarks.event_loop_latency --concurrency 50 --requests 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("DB_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("CACHE_CONNECTION_STRING", "redis://localhost:6379/0")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production-use")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "1440")
+
+import fakeredis  # noqa: E402
+import httpx  # noqa: E402
+import orjson  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.config.cache import get_cache  # noqa: E402
+from app.config.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list[float], elapsed: float) -> dict:
+    """Summarize latency samples (seconds) as milliseconds."""
+    return {
+        "count": len(samples),
+        "throughput_rps": round(len(samples) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 2),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+    }
+
+
+def install_database(db_latency_ms: float) -> None:
+    """Point the app at a temporary SQLite database with simulated round-trip latency."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as db_file:
+        db_path = db_file.name
+
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+
+    if db_latency_ms > 0:
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _simulate_round_trip(*_):
+            time.sleep(db_latency_ms / 1000)
+
+    def _get_db():
+        with Session(engine) as db:
+            yield db
+
+    cache = fakeredis.FakeRedis(decode_responses=True)
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_cache] = lambda: cache
+
+
+async def seed(client: httpx.AsyncClient, jobs: int) -> dict:
+    """Create an employer account with `jobs` jobs and return its request headers."""
+    response = await client.post(
+        "/auth/signup", json={"email": "bench@example.com", "password": "benchmark-password"}
+    )
+    token = response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.post(
+        "/accounts/", json={"name": "Bench Employer", "account_type": "EMPLOYER"}, headers=headers
+    )
+    headers["x-account-id"] = response.json()["id"]
+
+    for i in range(jobs):
+        await client.post(
+            "/jobs/",
+            json={
+                "title": f"Benchmark job {i}",
+                "description": "Aerial survey of a benchmark field",
+                "budget": 1000,
+                "location": "Benchmark City",
+                "start_date": "2099-01-01",
+                "end_date": "2099-01-31",
+            },
+            headers=headers,
+        )
+    return headers
+
+
+async def run(concurrency: int, requests: int, jobs: int, probe_interval_ms: float) -> dict:
+    """Run the benchmark and return the report."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        headers = await seed(client, jobs)
+
+        list_samples: list[float] = []
+        probe_samples: list[float] = []
+        done = asyncio.Event()
+
+        async def worker() -> None:
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.get("/jobs/", params={"limit": 100}, headers=headers)
+                list_samples.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        async def probe() -> None:
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                probe_samples.append(time.perf_counter() - start)
+                await asyncio.sleep(probe_interval_ms / 1000)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return {
+        "GET /jobs": summarize(list_samples, elapsed),
+        "GET /health (probe)": summarize(probe_samples, elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--jobs", type=int, default=100, help="jobs seeded before the run")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    parser.add_argument("--probe-interval-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    install_database(args.db_latency_ms)
+    results = asyncio.run(run(args.concurrency, args.requests, args.jobs, args.probe_interval_ms))
+    report = {"benchmark": "event_loop_latency", "config": vars(args), "results": results}
+    print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Response serialization micro-benchmark.
+
+Renders pages of in-memory `Job` rows the way the routers used to (a hand-built dict per
+row, `jsonable_encoder`, then `ORJSONResponse`) and with the shared `job_serializer`
+(attribute getter straight into orjson), and reports the per-item cost of each path.
+
+Usage:
+    python -m benchmarks.serialization --page-size 100 --iterations 2000
+"""
+
+import argparse
+import os
+import time
+import uuid
+from datetime import UTC, date, datetime
+
+os.environ.setdefault("DB_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("CACHE_CONNECTION_STRING", "redis://localhost:6379/0")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production-use")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "1440")
+
+import orjson  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import ORJSONResponse  # noqa: E402
+
+import app.domain.models.application  # noqa: E402, F401  (registers the Application mapper)
+from app.domain.models.job import Job  # noqa: E402
+from app.dto.job import job_serializer  # noqa: E402
+
+
+def make_jobs(count: int) -> list[Job]:
+    """Build `count` jobs with every response field populated."""
+    now = datetime.now(UTC)
+    return [
+        Job(
+            id=uuid.uuid4(),
+            account_id=uuid.uuid4(),
+            title=f"Benchmark job {i}",
+            description="Aerial survey of a benchmark field",
+            budget=1000.0 + i,
+            location="Benchmark City",
+            latitude=-34.6,
+            longitude=-58.4,
+            start_date=date(2099, 1, 1),
+            end_date=date(2099, 1, 31),
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def encoder_path(jobs: list[Job]) -> bytes:
+    """Hand-built dicts through jsonable_encoder and ORJSONResponse."""
+    content = [
+        {
+            "id": job.id,
+            "account_id": job.account_id,
+            "title": job.title,
+            "description": job.description,
+            "budget": job.budget,
+            "location": job.location,
+            "latitude": job.latitude,
+            "longitude": job.longitude,
+            "start_date": job.start_date,
+            "end_date": job.end_date,
+            "created_at": job.created_at,
+            "updated_at": job.updated_at,
+        }
+        for job in jobs
+    ]
+    return ORJSONResponse(jsonable_encoder(content)).body
+
+
+def serializer_path(jobs: list[Job]) -> bytes:
+    """Shared response serializer."""
+    return job_serializer.list_response(jobs).body
+
+
+def measure(render, jobs: list[Job], iterations: int) -> dict:
+    """Time `iterations` renders of the page and return per-page and per-item cost."""
+    render(jobs)  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render(jobs)
+    elapsed = time.perf_counter() - start
+    per_page = elapsed / iterations
+    return {
+        "per_page_us": round(per_page * 1e6, 2),
+        "per_item_us": round(per_page / len(jobs) * 1e6, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.page_size)
+    if orjson.loads(encoder_path(jobs)) != orjson.loads(serializer_path(jobs)):
+        raise SystemExit("serializer output differs from the encoder path")
+
+    results = {
+        "jsonable_encoder + ORJSONResponse": measure(encoder_path, jobs, args.iterations),
+        "job_serializer": measure(serializer_path, jobs, args.iterations),
+    }
+    baseline = results["jsonable_encoder + ORJSONResponse"]["per_page_us"]
+    results["job_serializer"]["speedup"] = round(
+        baseline / results["job_serializer"]["per_page_us"], 1
+    )
+    report = {"benchmark": "serialization", "config": vars(args), "results": results}
+    print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
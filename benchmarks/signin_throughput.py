@@ -0,0 +1,130 @@
+"""
+Signin throughput benchmark.
+
+Runs the app in-process against a temporary SQLite database and fakeredis, fires
+concurrent `POST /auth/signin` requests for one user and reports latency, throughput and
+the number of SQL statements and commits each signin issues. Password verification
+dominates the latency; the statement count tracks the session write.
+
+`--db-latency-ms` adds a fixed delay to every statement to emulate the network round
+trip to Postgres.
+
+Usage:
+    python -m benchmarks.signin_throughput --concurrency 8 --requests 10
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+os.environ.setdefault("DB_CONNECTION_STRING", "sqlite://")
+os.environ.setdefault("CACHE_CONNECTION_STRING", "redis://localhost:6379/0")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production-use")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", "1440")
+
+import fakeredis  # noqa: E402
+import httpx  # noqa: E402
+import orjson  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.config.cache import get_cache  # noqa: E402
+from app.config.database import get_db  # noqa: E402
+from app.main import app  # noqa: E402
+from benchmarks.event_loop_latency import summarize  # noqa: E402
+
+EMAIL = "signin-bench@example.com"
+PASSWORD = "benchmark-password"
+
+
+class StatementCounter:
+    """Counts statements and commits issued on an engine."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+def install_database(db_latency_ms: float) -> StatementCounter:
+    """Point the app at a temporary SQLite database and count its statements."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as db_file:
+        db_path = db_file.name
+
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(engine)
+    counter = StatementCounter()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(*_):
+        counter.statements += 1
+        if db_latency_ms > 0:
+            time.sleep(db_latency_ms / 1000)
+
+    @event.listens_for(engine, "commit")
+    def _count_commit(*_):
+        counter.commits += 1
+
+    def _get_db():
+        with Session(engine) as db:
+            yield db
+
+    cache = fakeredis.FakeRedis(decode_responses=True)
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_cache] = lambda: cache
+    return counter
+
+
+async def run(concurrency: int, requests: int, counter: StatementCounter) -> dict:
+    """Run the benchmark and return the report."""
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/auth/signup", json={"email": EMAIL, "password": PASSWORD})
+        response.raise_for_status()
+        counter.reset()
+
+        samples: list[float] = []
+
+        async def worker() -> None:
+            for _ in range(requests):
+                start = time.perf_counter()
+                response = await client.post(
+                    "/auth/signin", json={"email": EMAIL, "password": PASSWORD}
+                )
+                samples.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    signins = len(samples)
+    return {
+        "POST /auth/signin": summarize(samples, elapsed),
+        "statements_per_signin": round(counter.statements / signins, 2),
+        "commits_per_signin": round(counter.commits / signins, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=10, help="requests per client")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    counter = install_database(args.db_latency_ms)
+    results = asyncio.run(run(args.concurrency, args.requests, counter))
+    report = {"benchmark": "signin_throughput", "config": vars(args), "results": results}
+    print(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode())
+
+
+if __name__ == "__main__":
+    main()
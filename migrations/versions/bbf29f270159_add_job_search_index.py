@@ -0,0 +1,38 @@
+"""Add Job full-text search index
+
+Revision ID: bbf29f270159
+Revises: d5b1b680fec4
+Create Date: 2026-10-17 23:55:12.481305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "bbf29f270159"
+down_revision: Union[str, None] = "d5b1b680fec4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match app.domain.models.job.job_search_document for the planner to use it
+    op.create_index(
+        "ix_job_search_document",
+        "job",
+        [
+            sa.text(
+                "(setweight(to_tsvector('simple'::regconfig, title), 'A') || "
+                "setweight(to_tsvector('simple'::regconfig, description), 'B'))"
+            )
+        ],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_search_document", table_name="job", postgresql_using="gin")
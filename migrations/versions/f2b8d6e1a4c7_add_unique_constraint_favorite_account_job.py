@@ -0,0 +1,40 @@
+"""Add unique constraint on favorite account and job
+
+Revision ID: f2b8d6e1a4c7
+Revises: e4f7a2c9b1d3
+Create Date: 2026-10-18 01:52:14.306781
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2b8d6e1a4c7"
+down_revision: str | None = "e4f7a2c9b1d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Keep the oldest favorite of each (account, job) pair before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM favorite AS duplicate
+        USING favorite AS original
+        WHERE duplicate.account_id = original.account_id
+          AND duplicate.job_id = original.job_id
+          AND (duplicate.created_at, duplicate.id) > (original.created_at, original.id)
+        """
+    )
+    op.create_index(
+        "uix_favorite_account_job",
+        "favorite",
+        ["account_id", "job_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uix_favorite_account_job", table_name="favorite")
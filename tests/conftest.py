@@ -1,7 +1,7 @@
 import tempfile
 from collections.abc import Generator
-from unittest.mock import MagicMock
 
+import fakeredis
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
@@ -10,6 +10,7 @@ from app.config.cache import get_cache
 from app.config.database import get_db
 from app.config.settings import Environment, Settings, get_settings
 from app.main import app
+from tests.utils import INTERNAL_API_TOKEN
 
 # Create a temporary database file
 with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as _test_db_file:
@@ -60,13 +61,9 @@ def override_get_db(db_session: Session):
 @pytest.fixture(scope="function")
 def mock_cache():
     """
-    Mock Redis cache for testing.
+    In-memory Redis cache for testing.
     """
-    mock_redis = MagicMock()
-    mock_redis.get.return_value = None
-    mock_redis.set.return_value = True
-    mock_redis.delete.return_value = True
-    mock_redis.exists.return_value = False
+    mock_redis = fakeredis.FakeRedis(decode_responses=True)
 
     app.dependency_overrides[get_cache] = lambda: mock_redis
     yield mock_redis
@@ -89,6 +86,7 @@ def test_settings():
         algorithm="HS256",
         access_token_expire_minutes=30,
         refresh_token_expire_minutes=1440,
+        internal_api_token=INTERNAL_API_TOKEN,
     )
 
     # Clear the cache to allow new settings
@@ -1,5 +1,7 @@
 from uuid import uuid4
 
+from sqlalchemy import event
+
 from app.domain.models.account import AccountType
 from app.domain.models.application import ApplicationStatus, ApplicationUpdate
 from app.domain.repositories.application import ApplicationRepository
@@ -316,3 +318,128 @@ class TestApplicationRepositoryUpdate:
 
         # Assert
         assert result is None
+
+
+class TestApplicationRepositoryUpdateStatuses:
+    """Tests for ApplicationRepository.update_statuses"""
+
+    def test_update_statuses_applies_each_status(self, db_session):
+        """Test that every application gets its own status in one statement"""
+        # Arrange
+        employer = create_test_user(db_session, email="batch-employer@test.com")
+        employer_account = create_test_account(
+            db_session, employer.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id)
+        applications = []
+        for i in range(3):
+            droner = create_test_user(db_session, email=f"batch-droner{i}@test.com")
+            droner_account = create_test_account(
+                db_session, droner.id, account_type=AccountType.DRONER
+            )
+            applications.append(create_test_application(db_session, job.id, droner_account.id))
+        repository = ApplicationRepository(db_session)
+
+        # Act
+        updated = repository.update_statuses(
+            job.id,
+            {
+                applications[0].id: ApplicationStatus.ACCEPTED,
+                applications[1].id: ApplicationStatus.REJECTED,
+            },
+        )
+
+        # Assert
+        assert set(updated) == {applications[0].id, applications[1].id}
+        for application in applications:
+            db_session.refresh(application)
+        assert applications[0].status == ApplicationStatus.ACCEPTED
+        assert applications[1].status == ApplicationStatus.REJECTED
+        assert applications[2].status == ApplicationStatus.PENDING
+        assert updated[applications[0].id] == applications[0].updated_at
+
+    def test_update_statuses_ignores_other_jobs(self, db_session):
+        """Test that applications of another job are neither updated nor returned"""
+        # Arrange
+        employer = create_test_user(db_session, email="batch-employer2@test.com")
+        employer_account = create_test_account(
+            db_session, employer.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id)
+        other_job = create_test_job(db_session, employer_account.id)
+        droner = create_test_user(db_session, email="batch-droner-other@test.com")
+        droner_account = create_test_account(db_session, droner.id, account_type=AccountType.DRONER)
+        application = create_test_application(db_session, other_job.id, droner_account.id)
+        repository = ApplicationRepository(db_session)
+
+        # Act
+        updated = repository.update_statuses(
+            job.id,
+            {application.id: ApplicationStatus.ACCEPTED, uuid4(): ApplicationStatus.REJECTED},
+        )
+
+        # Assert
+        assert updated == {}
+        db_session.refresh(application)
+        assert application.status == ApplicationStatus.PENDING
+
+
+class TestApplicationRepositoryGetByAccountId:
+    """Tests for ApplicationRepository.get_by_account_id"""
+
+    def test_get_by_account_id_filters_by_status(self, db_session):
+        """Test that only applications in the requested status are listed"""
+        # Arrange
+        employer = create_test_user(db_session, email="list-employer@test.com")
+        employer_account = create_test_account(
+            db_session, employer.id, account_type=AccountType.EMPLOYER
+        )
+        droner = create_test_user(db_session, email="list-droner@test.com")
+        droner_account = create_test_account(db_session, droner.id, account_type=AccountType.DRONER)
+        pending_job = create_test_job(db_session, employer_account.id)
+        accepted_job = create_test_job(db_session, employer_account.id)
+        create_test_application(db_session, pending_job.id, droner_account.id)
+        accepted = create_test_application(
+            db_session, accepted_job.id, droner_account.id, status=ApplicationStatus.ACCEPTED
+        )
+        repository = ApplicationRepository(db_session)
+
+        # Act
+        applications = repository.get_by_account_id(
+            droner_account.id, status=ApplicationStatus.ACCEPTED
+        )
+
+        # Assert
+        assert [application.id for application in applications] == [accepted.id]
+
+    def test_get_by_account_id_includes_job_in_the_same_query(self, db_session):
+        """Test that include_job loads every job without further statements"""
+        # Arrange
+        employer = create_test_user(db_session, email="join-employer@test.com")
+        employer_account = create_test_account(
+            db_session, employer.id, account_type=AccountType.EMPLOYER
+        )
+        droner = create_test_user(db_session, email="join-droner@test.com")
+        droner_account = create_test_account(db_session, droner.id, account_type=AccountType.DRONER)
+        jobs = [create_test_job(db_session, employer_account.id) for _ in range(3)]
+        for job in jobs:
+            create_test_application(db_session, job.id, droner_account.id)
+        droner_account_id = droner_account.id
+        expected_job_ids = {job.id for job in jobs}
+        db_session.expunge_all()
+        repository = ApplicationRepository(db_session)
+
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            # Act
+            applications = repository.get_by_account_id(droner_account_id, include_job=True)
+            job_ids = {application.job.id for application in applications}
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # Assert
+        assert job_ids == expected_job_ids
+        assert len(statements) == 1
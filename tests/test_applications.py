@@ -230,6 +230,44 @@ class TestListApplicationsForJob:
         assert str(app1.id) in app_ids
         assert str(app2.id) in app_ids
 
+    def test_list_applications_for_job_cursor_pagination(self, client, db_session):
+        """Test that job applications are paginated with the X-Next-Cursor header"""
+        employer_user = create_test_user(db_session, email="employer6c@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id)
+
+        droner_user = create_test_user(db_session, email="droner6c@test.com")
+        for i in range(3):
+            droner_account = create_test_account(
+                db_session, droner_user.id, name=f"Droner {i}", account_type=AccountType.DRONER
+            )
+            create_test_application(db_session, job.id, droner_account.id)
+
+        # Signin as employer
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer_account.id)
+
+        first = client.get(f"/jobs/{job.id}/applications?limit=2", headers=headers)
+        assert first.status_code == status.HTTP_200_OK
+        assert len(first.json()) == 2
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get(
+            f"/jobs/{job.id}/applications", params={"limit": 2, "cursor": cursor}, headers=headers
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert len(second.json()) == 1
+        assert "X-Next-Cursor" not in second.headers
+
+        ids = [app["id"] for app in first.json() + second.json()]
+        assert len(set(ids)) == 3
+
     def test_list_applications_for_job_unauthorized(self, client, db_session):
         """Test listing applications for a job you don't own"""
         # Create employer user and account
@@ -324,6 +362,46 @@ class TestListApplicationsForUser:
         assert str(app1.id) in app_ids
         assert str(app2.id) in app_ids
 
+    def test_list_applications_for_user_with_jobs_filtered_by_status(self, client, db_session):
+        """Test embedding job summaries and filtering by status"""
+        employer_user = create_test_user(db_session, email="employer11@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        job1 = create_test_job(db_session, employer_account.id, title="Survey the north field")
+        job2 = create_test_job(db_session, employer_account.id)
+
+        droner_user = create_test_user(db_session, email="droner11@test.com")
+        droner_account = create_test_account(
+            db_session, droner_user.id, account_type=AccountType.DRONER
+        )
+        accepted = create_test_application(
+            db_session, job1.id, droner_account.id, status=ApplicationStatus.ACCEPTED
+        )
+        create_test_application(db_session, job2.id, droner_account.id)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": droner_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, droner_account.id)
+
+        response = client.get(
+            "/applications/",
+            params={"status": "ACCEPTED", "include_job": "true"},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [app["id"] for app in data] == [str(accepted.id)]
+        assert data[0]["job"]["id"] == str(job1.id)
+        assert data[0]["job"]["title"] == "Survey the north field"
+
+        response = client.get("/applications/", headers=headers)
+        assert len(response.json()) == 2
+        assert "job" not in response.json()[0]
+
     def test_list_applications_for_user_no_droner_account(self, client, db_session):
         """Test listing applications when user has no droner account"""
         user = create_test_user(db_session, email="user10@test.com")
@@ -847,3 +925,113 @@ class TestRejectApplication:
         fake_application_id = uuid4()
         response = client.post(f"/applications/{fake_application_id}/reject")
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestBatchUpdateApplications:
+    """Tests for POST /jobs/{job_id}/applications:batch-update"""
+
+    def _setup(self, client, db_session, prefix: str, applicants: int = 2):
+        employer_user = create_test_user(db_session, email=f"{prefix}-employer@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id)
+        applications = []
+        for i in range(applicants):
+            droner_user = create_test_user(db_session, email=f"{prefix}-droner{i}@test.com")
+            droner_account = create_test_account(
+                db_session, droner_user.id, account_type=AccountType.DRONER
+            )
+            applications.append(create_test_application(db_session, job.id, droner_account.id))
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        return job, applications, get_account_headers(token, employer_account.id)
+
+    def test_batch_update_success(self, client, db_session):
+        """Test accepting and rejecting applications in one request"""
+        job, applications, headers = self._setup(client, db_session, "batch1")
+        missing_id = uuid4()
+
+        response = client.post(
+            f"/jobs/{job.id}/applications:batch-update",
+            json={
+                "updates": [
+                    {"application_id": str(applications[0].id), "status": "ACCEPTED"},
+                    {"application_id": str(applications[1].id), "status": "REJECTED"},
+                    {"application_id": str(missing_id), "status": "REJECTED"},
+                ]
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["outcome"] for item in data] == ["UPDATED", "UPDATED", "NOT_FOUND"]
+        assert data[0]["status"] == ApplicationStatus.ACCEPTED.value
+        assert data[0]["updated_at"] is not None
+        assert data[2]["application_id"] == str(missing_id)
+        assert data[2]["updated_at"] is None
+
+        listed = client.get(f"/jobs/{job.id}/applications", headers=headers).json()
+        statuses = {item["id"]: item["status"] for item in listed}
+        assert statuses[str(applications[0].id)] == ApplicationStatus.ACCEPTED.value
+        assert statuses[str(applications[1].id)] == ApplicationStatus.REJECTED.value
+
+    def test_batch_update_not_job_owner(self, client, db_session):
+        """Test that another employer cannot update the applications of a job"""
+        job, applications, _ = self._setup(client, db_session, "batch2", applicants=1)
+        _, _, other_headers = self._setup(client, db_session, "batch2-other", applicants=0)
+
+        response = client.post(
+            f"/jobs/{job.id}/applications:batch-update",
+            json={"updates": [{"application_id": str(applications[0].id), "status": "ACCEPTED"}]},
+            headers=other_headers,
+        )
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_batch_update_rejects_withdrawn_status(self, client, db_session):
+        """Test that only ACCEPTED and REJECTED transitions are allowed"""
+        job, applications, headers = self._setup(client, db_session, "batch3", applicants=1)
+
+        response = client.post(
+            f"/jobs/{job.id}/applications:batch-update",
+            json={"updates": [{"application_id": str(applications[0].id), "status": "WITHDRAWN"}]},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_update_rejects_duplicates(self, client, db_session):
+        """Test that an application cannot appear twice in a batch"""
+        job, applications, headers = self._setup(client, db_session, "batch4", applicants=1)
+        application_id = str(applications[0].id)
+
+        response = client.post(
+            f"/jobs/{job.id}/applications:batch-update",
+            json={
+                "updates": [
+                    {"application_id": application_id, "status": "ACCEPTED"},
+                    {"application_id": application_id, "status": "REJECTED"},
+                ]
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_update_job_not_found(self, client, db_session):
+        """Test updating applications of a non-existent job"""
+        _, applications, headers = self._setup(client, db_session, "batch5", applicants=1)
+
+        response = client.post(
+            f"/jobs/{uuid4()}/applications:batch-update",
+            json={"updates": [{"application_id": str(applications[0].id), "status": "ACCEPTED"}]},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,6 +1,6 @@
 from fastapi import status
 
-from tests.utils import create_test_user
+from tests.utils import create_test_user, get_query_count
 
 
 class TestSignup:
@@ -88,6 +88,74 @@ class TestSignin:
         assert "refresh_token" in data
         assert data["token_type"] == "bearer"
 
+    def test_signin_throttled(self, client, db_session, test_settings):
+        """Test that repeated attempts for one email are rejected before checking them"""
+        # Arrange
+        create_test_user(db_session, email="throttled@example.com", password="testpassword123")
+        credentials = {"email": "throttled@example.com", "password": "wrongpassword123"}
+        for _ in range(test_settings.login_throttle_email_capacity):
+            client.post("/auth/signin", json=credentials)
+
+        # Act
+        response = client.post(
+            "/auth/signin",
+            json={"email": "throttled@example.com", "password": "testpassword123"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response.headers["Retry-After"]) >= 1
+        assert get_query_count(response) == 0
+
+    def test_signin_throttled_per_ip_despite_forwarded_for(self, client, test_settings):
+        """Test that rotating X-Forwarded-For does not reset the per-IP bucket"""
+        # Arrange
+        test_settings.login_throttle_ip_capacity = 3
+        for i in range(3):
+            client.post(
+                "/auth/signin",
+                json={"email": f"user{i}@example.com", "password": "wrongpassword123"},
+                headers={"X-Forwarded-For": f"203.0.113.{i}"},
+            )
+
+        # Act
+        response = client.post(
+            "/auth/signin",
+            json={"email": "user3@example.com", "password": "wrongpassword123"},
+            headers={"X-Forwarded-For": "203.0.113.3"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_signin_throttled_per_ip_behind_trusted_proxy(self, client, test_settings):
+        """Test that only the hop appended by the trusted proxy identifies the client"""
+        # Arrange
+        test_settings.login_throttle_ip_capacity = 3
+        test_settings.trusted_proxy_count = 1
+        for i in range(3):
+            client.post(
+                "/auth/signin",
+                json={"email": f"user{i}@example.com", "password": "wrongpassword123"},
+                headers={"X-Forwarded-For": f"203.0.113.{i}, 198.51.100.7"},
+            )
+
+        # Act
+        throttled = client.post(
+            "/auth/signin",
+            json={"email": "user3@example.com", "password": "wrongpassword123"},
+            headers={"X-Forwarded-For": "203.0.113.3, 198.51.100.7"},
+        )
+        other_client = client.post(
+            "/auth/signin",
+            json={"email": "user3@example.com", "password": "wrongpassword123"},
+            headers={"X-Forwarded-For": "198.51.100.8"},
+        )
+
+        # Assert
+        assert throttled.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert other_client.status_code == status.HTTP_401_UNAUTHORIZED
+
     def test_signin_wrong_password(self, client, db_session):
         """Test signin with wrong password returns 401"""
         create_test_user(
@@ -204,6 +272,72 @@ class TestSignout:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+class TestSignoutAll:
+    """Tests for POST /auth/signout-all"""
+
+    def test_signout_all_revokes_every_session(self, client):
+        """Test that the tokens of every session stop working, including refresh tokens"""
+        # Arrange
+        credentials = {"email": "signout-all@example.com", "password": "password123"}
+        first = client.post("/auth/signup", json=credentials).json()
+        second = client.post("/auth/signin", json=credentials).json()
+
+        # Act
+        response = client.post(
+            "/auth/signout-all",
+            headers={"Authorization": f"Bearer {first['access_token']}"},
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"revoked_sessions": 2}
+        for tokens in (first, second):
+            me = client.get(
+                "/users/me", headers={"Authorization": f"Bearer {tokens['access_token']}"}
+            )
+            assert me.status_code == status.HTTP_401_UNAUTHORIZED
+            refresh = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+            assert refresh.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_signin_after_signout_all(self, client):
+        """Test that tokens issued right after the revocation are accepted"""
+        # Arrange
+        credentials = {"email": "signout-all2@example.com", "password": "password123"}
+        token = client.post("/auth/signup", json=credentials).json()["access_token"]
+        client.post("/auth/signout-all", headers={"Authorization": f"Bearer {token}"})
+
+        # Act
+        new_token = client.post("/auth/signin", json=credentials).json()["access_token"]
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {new_token}"})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_signout_all_with_revoked_token(self, client):
+        """Test that a token revoked by signing out cannot sign out every session"""
+        # Arrange
+        credentials = {"email": "signout-all3@example.com", "password": "password123"}
+        revoked = client.post("/auth/signup", json=credentials).json()["access_token"]
+        active = client.post("/auth/signin", json=credentials).json()["access_token"]
+        client.post("/auth/signout", headers={"Authorization": f"Bearer {revoked}"})
+
+        # Act
+        response = client.post("/auth/signout-all", headers={"Authorization": f"Bearer {revoked}"})
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        me = client.get("/users/me", headers={"Authorization": f"Bearer {active}"})
+        assert me.status_code == status.HTTP_200_OK
+
+    def test_signout_all_invalid_token(self, client):
+        """Test signout-all with invalid token returns 401"""
+        response = client.post(
+            "/auth/signout-all",
+            headers={"Authorization": "Bearer invalid_token"},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 class TestRefresh:
     """Tests for POST /auth/refresh"""
 
@@ -233,6 +367,42 @@ class TestRefresh:
         assert data["access_token"] != signup_response.json()["access_token"]
         assert data["refresh_token"] != refresh_token
 
+    def test_refresh_reuse_revokes_the_session(self, client):
+        """Test that replaying a spent refresh token revokes the whole session"""
+        # Arrange
+        tokens = client.post(
+            "/auth/signup",
+            json={"email": "refresh-reuse@example.com", "password": "password123"},
+        ).json()
+        rotated = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        ).json()
+
+        # Act
+        response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        refresh = client.post("/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+        assert refresh.status_code == status.HTTP_401_UNAUTHORIZED
+        me = client.get("/users/me", headers={"Authorization": f"Bearer {rotated['access_token']}"})
+        assert me.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_after_signout(self, client):
+        """Test that a signed-out session cannot be refreshed"""
+        # Arrange
+        tokens = client.post(
+            "/auth/signup",
+            json={"email": "refresh-signout@example.com", "password": "password123"},
+        ).json()
+        client.post("/auth/signout", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+
+        # Act
+        response = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+        # Assert
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
     def test_refresh_invalid_token(self, client):
         """Test refresh with invalid token returns 401"""
         response = client.post(
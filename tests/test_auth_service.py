@@ -12,9 +12,19 @@ from app.domain.models.session import UserSession
 from app.domain.models.user import User
 from app.domain.repositories.interfaces.account import IAccountRepository
 from app.domain.repositories.interfaces.auth import IAuthRepository, JwtTokenPayload, JwtTokenType
+from app.domain.repositories.interfaces.principal import (
+    IPrincipalRepository,
+    Principal,
+    PrincipalLookup,
+    VersionLookup,
+)
+from app.domain.repositories.interfaces.refresh import IRefreshTokenRepository, RotationResult
 from app.domain.repositories.interfaces.session import ISessionRepository
 from app.domain.repositories.interfaces.user import IUserRepository
+from app.dto.auth import SigninDTO
 from app.services.auth import AuthService
+from app.services.interfaces.auth import AuthenticatedAccount
+from tests.utils import create_test_token_payload
 
 
 class TestAuthServiceDecodeTokenSafely:
@@ -177,83 +187,71 @@ class TestAuthServiceDecodeTokenSafely:
         assert "token type" in str(exc_info.value.detail).lower()
 
 
-class TestAuthServiceCheckTokenBlacklist:
-    """Tests for AuthService._check_token_blacklist"""
+class TestAuthServiceCheckTokenRevoked:
+    """Tests for AuthService._check_token_revoked"""
 
-    def test_check_token_blacklist_not_blacklisted(self):
-        """Test checking token that is not blacklisted"""
-        # Arrange
-        jti = "test-jti"
+    def _service(self, values: list) -> tuple[AuthService, MagicMock]:
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # Not blacklisted
-        mock_auth_repository = MagicMock(spec=IAuthRepository)
-        mock_user_repository = MagicMock(spec=IUserRepository)
-        mock_session_repository = MagicMock(spec=ISessionRepository)
-        mock_account_repository = MagicMock(spec=IAccountRepository)
-
+        mock_cache.mget.return_value = values
         service = AuthService(
             mock_cache,
-            mock_auth_repository,
-            mock_user_repository,
-            mock_session_repository,
-            mock_account_repository,
+            MagicMock(spec=IAuthRepository),
+            MagicMock(spec=IUserRepository),
+            MagicMock(spec=ISessionRepository),
+            MagicMock(spec=IAccountRepository),
         )
+        return service, mock_cache
+
+    def test_check_token_not_revoked(self):
+        """Test that the blacklist entry and both epochs are read in one MGET"""
+        # Arrange
+        payload = create_test_token_payload()
+        service, mock_cache = self._service([None, None, None])
 
         # Act - should not raise exception
-        service._check_token_blacklist(jti)
+        service._check_token_revoked(payload)
 
         # Assert
-        mock_cache.get.assert_called_once_with(f"blacklist:{jti}")
+        mock_cache.mget.assert_called_once_with(
+            [
+                f"blacklist:{payload.jti}",
+                f"revoked:session:{payload.sid}",
+                f"revoked:user:{payload.sub}",
+            ]
+        )
 
     def test_check_token_blacklisted(self):
         """Test checking token that is blacklisted"""
         # Arrange
-        jti = "blacklisted-jti"
-        mock_cache = MagicMock()
-        mock_cache.get.return_value = "1"  # Blacklisted
-        mock_auth_repository = MagicMock(spec=IAuthRepository)
-        mock_user_repository = MagicMock(spec=IUserRepository)
-        mock_session_repository = MagicMock(spec=ISessionRepository)
-        mock_account_repository = MagicMock(spec=IAccountRepository)
-
-        service = AuthService(
-            mock_cache,
-            mock_auth_repository,
-            mock_user_repository,
-            mock_session_repository,
-            mock_account_repository,
-        )
+        service, _ = self._service(["1", None, None])
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            service._check_token_blacklist(jti)
+            service._check_token_revoked(create_test_token_payload())
 
         assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
         assert "revoked" in str(exc_info.value.detail).lower()
-        mock_cache.get.assert_called_once_with(f"blacklist:{jti}")
 
-    def test_check_token_blacklist_none_jti(self):
-        """Test checking token with None jti"""
+    def test_check_token_issued_before_session_epoch(self):
+        """Test that a token issued before its session was revoked is rejected"""
         # Arrange
-        mock_cache = MagicMock()
-        mock_auth_repository = MagicMock(spec=IAuthRepository)
-        mock_user_repository = MagicMock(spec=IUserRepository)
-        mock_session_repository = MagicMock(spec=ISessionRepository)
-        mock_account_repository = MagicMock(spec=IAccountRepository)
+        payload = create_test_token_payload()
+        service, _ = self._service([None, str(payload.issued_at + 0.001), None])
 
-        service = AuthService(
-            mock_cache,
-            mock_auth_repository,
-            mock_user_repository,
-            mock_session_repository,
-            mock_account_repository,
-        )
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service._check_token_revoked(payload)
 
-        # Act - should not raise exception when jti is None
-        service._check_token_blacklist(None)  # type: ignore[arg-type]
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
-        # Assert - should not call cache.get when jti is None
-        mock_cache.get.assert_not_called()
+    def test_check_token_issued_after_user_epoch(self):
+        """Test that a token issued after its user was revoked is accepted"""
+        # Arrange
+        payload = create_test_token_payload()
+        service, _ = self._service([None, None, str(payload.issued_at - 0.001)])
+
+        # Act - should not raise exception
+        service._check_token_revoked(payload)
 
 
 class TestAuthServiceValidateTokenPayload:
@@ -636,7 +634,7 @@ class TestAuthServiceGetAuthenticatedAccount:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # Not blacklisted
+        mock_cache.mget.return_value = [None, None, None]  # Not revoked
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
         mock_auth_repository.decode_token.return_value = {
@@ -669,7 +667,7 @@ class TestAuthServiceGetAuthenticatedAccount:
         result = service.get_authenticated_account("test-token", account_id)
 
         # Assert
-        assert result == mock_account
+        assert result == AuthenticatedAccount.from_account(mock_account)
         mock_account_repository.get_by_id.assert_called_once_with(account_id)
 
     def test_get_authenticated_account_not_found(self):
@@ -711,7 +709,7 @@ class TestAuthServiceGetAuthenticatedAccount:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None
+        mock_cache.mget.return_value = [None, None, None]
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
         mock_auth_repository.decode_token.return_value = {
@@ -788,7 +786,7 @@ class TestAuthServiceGetAuthenticatedAccount:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None
+        mock_cache.mget.return_value = [None, None, None]
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
         mock_auth_repository.decode_token.return_value = {
@@ -864,7 +862,7 @@ class TestAuthServiceGetAuthenticatedAccount:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None
+        mock_cache.mget.return_value = [None, None, None]
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
         mock_auth_repository.decode_token.return_value = {
@@ -934,7 +932,7 @@ class TestAuthServiceGetAuthenticatedUser:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # Not blacklisted
+        mock_cache.mget.return_value = [None, None, None]  # Not revoked
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
         mock_auth_repository.decode_token.return_value = {
@@ -968,7 +966,9 @@ class TestAuthServiceGetAuthenticatedUser:
         # Assert
         assert result == mock_user
         mock_auth_repository.decode_token.assert_called_once_with("test-token")
-        mock_cache.get.assert_called_once_with(f"blacklist:{jti}")
+        mock_cache.mget.assert_called_once_with(
+            [f"blacklist:{jti}", f"revoked:session:{session_id}", f"revoked:user:{user_id}"]
+        )
         mock_user_repository.get_by_id.assert_called_once_with(user_id)
 
 
@@ -996,7 +996,7 @@ class TestAuthServiceRefreshToken:
         )
 
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # Not blacklisted
+        mock_cache.mget.return_value = [None, None, None]  # Not revoked
         mock_cache.setex.return_value = True
 
         mock_auth_repository = MagicMock(spec=IAuthRepository)
@@ -1040,6 +1040,195 @@ class TestAuthServiceRefreshToken:
         mock_cache.setex.assert_called_once()
 
 
+class TestAuthServiceRotateRefreshToken:
+    """Tests for AuthService.refresh_token with the refresh token repository"""
+
+    def _service(self, result: RotationResult) -> tuple[AuthService, MagicMock, MagicMock]:
+        now = dt.now(datetime.UTC)
+        user_id, session_id = uuid4(), uuid4()
+        auth_repository = MagicMock(spec=IAuthRepository)
+        auth_repository.decode_token.return_value = {
+            "sub": str(user_id),
+            "sid": str(session_id),
+            "type": JwtTokenType.REFRESH.value,
+            "iat": now.timestamp(),
+            "exp": int(now.timestamp()) + 3600,
+            "jti": "old-jti",
+        }
+        auth_repository.create_token.return_value = (
+            "new-access-token",
+            "new-refresh-token",
+            now + datetime.timedelta(hours=2),
+        )
+        session_repository = MagicMock(spec=ISessionRepository)
+        session_repository.get_by_id.return_value = UserSession(
+            id=session_id,
+            user_id=user_id,
+            host="127.0.0.1",
+            is_active=True,
+            expires_at=now + datetime.timedelta(hours=1),
+        )
+        refresh_token_repository = MagicMock(spec=IRefreshTokenRepository)
+        refresh_token_repository.rotate.return_value = result
+        service = AuthService(
+            MagicMock(),
+            auth_repository,
+            MagicMock(spec=IUserRepository),
+            session_repository,
+            MagicMock(spec=IAccountRepository),
+            revocation_ttl_seconds=60,
+            refresh_token_repository=refresh_token_repository,
+        )
+        return service, session_repository, refresh_token_repository
+
+    def test_rotated(self):
+        """Test that a rotation returns the new tokens and leaves the session row alone"""
+        # Arrange
+        service, session_repository, refresh_token_repository = self._service(
+            RotationResult.ROTATED
+        )
+
+        # Act
+        tokens = service.refresh_token("old-refresh-token")
+
+        # Assert
+        assert tokens == ("new-access-token", "new-refresh-token")
+        token, new_jti, _, ttl = refresh_token_repository.rotate.call_args.args
+        assert (token.jti, ttl) == ("old-jti", 60)
+        create_token = service.auth_repository.create_token
+        assert create_token.call_args.kwargs["refresh_jti"] == new_jti
+        service.auth_repository.decode_token.assert_called_once_with("old-refresh-token")
+        session_repository.update.assert_not_called()
+
+    def test_reused(self):
+        """Test that reusing a spent token deactivates the session"""
+        # Arrange
+        service, session_repository, _ = self._service(RotationResult.REUSED)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.refresh_token("old-refresh-token")
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        session_repository.deactivate.assert_called_once()
+
+    def test_revoked(self):
+        """Test that a revoked session is rejected without counting as reuse"""
+        # Arrange
+        service, session_repository, _ = self._service(RotationResult.REVOKED)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.refresh_token("old-refresh-token")
+
+        assert exc_info.value.detail == "Token has been revoked"
+        session_repository.deactivate.assert_not_called()
+
+    def test_expired_session_with_pending_expiry(self):
+        """Test that a session whose new expiry is not yet written is not taken for expired"""
+        # Arrange
+        service, session_repository, refresh_token_repository = self._service(
+            RotationResult.ROTATED
+        )
+        session = session_repository.get_by_id.return_value
+        session.expires_at = dt.now(datetime.UTC) - datetime.timedelta(minutes=1)
+        refresh_token_repository.get_pending_expiry.return_value = dt.now(
+            datetime.UTC
+        ) + datetime.timedelta(hours=1)
+
+        # Act
+        tokens = service.refresh_token("old-refresh-token")
+
+        # Assert
+        assert tokens == ("new-access-token", "new-refresh-token")
+        session_repository.deactivate.assert_not_called()
+
+
+class TestAuthServiceSignin:
+    """Tests for AuthService.signin"""
+
+    def test_signin_writes_session_once(self):
+        """Test that the session is inserted once, already carrying the token's ID and expiry"""
+        # Arrange
+        user = User(
+            id=uuid4(),
+            email="signin@example.com",
+            hashed_password="hashed",
+            is_active=True,
+            created_at=dt.now(datetime.UTC),
+            updated_at=dt.now(datetime.UTC),
+        )
+        refresh_expires_at = dt.now(datetime.UTC) + datetime.timedelta(days=1)
+
+        mock_auth_repository = MagicMock(spec=IAuthRepository)
+        mock_auth_repository.verify_and_update_password.return_value = (True, None)
+        mock_auth_repository.create_token.return_value = (
+            "access-token",
+            "refresh-token",
+            refresh_expires_at,
+        )
+        mock_user_repository = MagicMock(spec=IUserRepository)
+        mock_user_repository.get_by_email.return_value = user
+        mock_session_repository = MagicMock(spec=ISessionRepository)
+
+        service = AuthService(
+            MagicMock(),
+            mock_auth_repository,
+            mock_user_repository,
+            mock_session_repository,
+            MagicMock(spec=IAccountRepository),
+        )
+
+        # Act
+        tokens = service.signin("127.0.0.1", SigninDTO(email=user.email, password="password"))
+
+        # Assert
+        assert tokens == ("access-token", "refresh-token")
+        mock_session_repository.create.assert_called_once()
+        mock_session_repository.update.assert_not_called()
+        session = mock_session_repository.create.call_args.args[0]
+        claims = mock_auth_repository.create_token.call_args.args[0]
+        assert claims == {"sub": str(user.id), "sid": str(session.id)}
+        assert session.user_id == user.id
+        assert session.host == "127.0.0.1"
+        assert session.expires_at == refresh_expires_at
+        mock_user_repository.update.assert_not_called()
+
+    def test_signin_rehashes_outdated_password_hash(self):
+        """Test that a hash made with outdated parameters is replaced on signin"""
+        # Arrange
+        user = User(
+            id=uuid4(),
+            email="rehash@example.com",
+            hashed_password="old-hash",
+            is_active=True,
+        )
+        mock_auth_repository = MagicMock(spec=IAuthRepository)
+        mock_auth_repository.verify_and_update_password.return_value = (True, "new-hash")
+        mock_auth_repository.create_token.return_value = ("access", "refresh", dt.now(datetime.UTC))
+        mock_user_repository = MagicMock(spec=IUserRepository)
+        mock_user_repository.get_by_email.return_value = user
+        mock_user_repository.update.side_effect = lambda updated: updated
+
+        service = AuthService(
+            MagicMock(),
+            mock_auth_repository,
+            mock_user_repository,
+            MagicMock(spec=ISessionRepository),
+            MagicMock(spec=IAccountRepository),
+        )
+
+        # Act
+        service.signin("127.0.0.1", SigninDTO(email=user.email, password="password"))
+
+        # Assert
+        mock_auth_repository.verify_and_update_password.assert_called_once_with(
+            "password", "old-hash"
+        )
+        mock_user_repository.update.assert_called_once_with(user)
+        assert user.hashed_password == "new-hash"
+
+
 class TestAuthServiceSignout:
     """Tests for AuthService.signout"""
 
@@ -1083,7 +1272,9 @@ class TestAuthServiceSignout:
         assert result is True
         mock_auth_repository.decode_token.assert_called_once_with("test-token")
         mock_session_repository.deactivate.assert_called_once_with(session_id)
-        mock_cache.setex.assert_called_once()
+        mock_cache.set.assert_called_once()
+        assert mock_cache.set.call_args.args[0] == f"revoked:session:{session_id}"
+        mock_cache.setex.assert_not_called()
 
 
 class TestAuthServiceBlacklistToken:
@@ -1227,3 +1418,286 @@ class TestAuthServiceCalculateTokenTTL:
         assert isinstance(ttl, int)
         assert ttl > 0
         assert ttl <= 3600  # Should be close to 3600 (within a few seconds)
+
+
+class TestAuthServiceAuthenticatedPrincipal:
+    """Tests for AuthService.get_authenticated_account with the principal cache"""
+
+    def _build(self, lookup, row=None):
+        user_id = uuid4()
+        session_id = uuid4()
+        account_id = uuid4()
+        now = dt.now(datetime.UTC)
+
+        user = User(
+            id=user_id,
+            email="test@example.com",
+            hashed_password="hashed",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        account = Account(
+            id=account_id,
+            user_id=user_id,
+            name="Test Account",
+            account_type=AccountType.EMPLOYER,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        session = UserSession(
+            id=session_id,
+            user_id=user_id,
+            host="127.0.0.1",
+            is_active=True,
+            expires_at=now + datetime.timedelta(hours=1),
+            created_at=now,
+            updated_at=now,
+        )
+
+        mock_auth_repository = MagicMock(spec=IAuthRepository)
+        mock_auth_repository.decode_token.return_value = {
+            "sub": str(user_id),
+            "sid": str(session_id),
+            "type": JwtTokenType.ACCESS.value,
+            "iat": int(now.timestamp()),
+            "exp": int(now.timestamp()) + 3600,
+            "jti": "test-jti",
+        }
+        mock_session_repository = MagicMock(spec=ISessionRepository)
+        mock_session_repository.get_principal.return_value = (
+            row if row is not None else (session, user, account)
+        )
+        mock_user_repository = MagicMock(spec=IUserRepository)
+        mock_account_repository = MagicMock(spec=IAccountRepository)
+        mock_principal_repository = MagicMock(spec=IPrincipalRepository)
+        principal = Principal(session=session, user=user, account=account)
+        mock_principal_repository.lookup.return_value = lookup(principal)
+
+        service = AuthService(
+            MagicMock(),
+            mock_auth_repository,
+            mock_user_repository,
+            mock_session_repository,
+            mock_account_repository,
+            mock_principal_repository,
+        )
+        return service, principal, mock_session_repository, mock_principal_repository
+
+    def test_cache_hit_skips_database(self):
+        """Test that a cached principal is returned without any repository lookups"""
+        # Arrange
+        service, principal, session_repository, principal_repository = self._build(
+            lambda p: PrincipalLookup(revoked=False, principal=p)
+        )
+
+        # Act
+        result = service.get_authenticated_account("test-token", principal.account.id)
+
+        # Assert
+        assert result == AuthenticatedAccount.from_account(principal.account)
+        token = principal_repository.lookup.call_args.args[0]
+        assert token.jti == "test-jti"
+        principal_repository.lookup.assert_called_once_with(
+            token, principal.session.id, principal.account.id
+        )
+        session_repository.get_principal.assert_not_called()
+        session_repository.get_by_id.assert_not_called()
+        principal_repository.store.assert_not_called()
+
+    def test_cache_miss_runs_joined_query_and_stores(self):
+        """Test that a miss loads the principal with one query and caches it"""
+        # Arrange
+        service, principal, session_repository, principal_repository = self._build(
+            lambda _: PrincipalLookup(revoked=False, principal=None)
+        )
+
+        # Act
+        result = service.get_authenticated_account("test-token", principal.account.id)
+
+        # Assert
+        assert result.id == principal.account.id
+        session_repository.get_principal.assert_called_once_with(
+            principal.session.id, principal.account.id
+        )
+        session_repository.get_by_id.assert_not_called()
+        principal_repository.store.assert_called_once()
+
+    def test_revoked_token(self):
+        """Test that a blacklisted token is rejected before touching the database"""
+        # Arrange
+        service, principal, session_repository, _ = self._build(
+            lambda _: PrincipalLookup(revoked=True, principal=None)
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_authenticated_account("test-token", principal.account.id)
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Token has been revoked"
+        session_repository.get_principal.assert_not_called()
+
+    def test_cache_miss_account_of_another_user(self):
+        """Test that ownership is enforced on a cache miss and nothing is cached"""
+        # Arrange
+        service, principal, _, principal_repository = self._build(
+            lambda _: PrincipalLookup(revoked=False, principal=None)
+        )
+        principal.account.user_id = uuid4()
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_authenticated_account("test-token", principal.account.id)
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        principal_repository.store.assert_not_called()
+
+    def test_signout_invalidates_cached_principals(self):
+        """Test that signing out drops the session's cached principals"""
+        # Arrange
+        service, principal, session_repository, principal_repository = self._build(
+            lambda _: PrincipalLookup(revoked=False, principal=None)
+        )
+
+        # Act
+        service.signout("test-token")
+
+        # Assert
+        session_repository.deactivate.assert_called_once_with(principal.session.id)
+        principal_repository.invalidate_session.assert_called_once_with(principal.session.id)
+
+
+class TestAuthServiceAccountClaims:
+    """Tests for AuthService account claims in access tokens"""
+
+    def _build(self, account_type=AccountType.EMPLOYER, token_version=7, version=7):
+        user_id = uuid4()
+        account_id = uuid4()
+        now = dt.now(datetime.UTC)
+
+        mock_auth_repository = MagicMock(spec=IAuthRepository)
+        mock_auth_repository.decode_token.return_value = {
+            "sub": str(user_id),
+            "sid": str(uuid4()),
+            "type": JwtTokenType.ACCESS.value,
+            "iat": int(now.timestamp()),
+            "exp": int(now.timestamp()) + 3600,
+            "jti": "test-jti",
+            "acc": {str(account_id): account_type.value},
+            "ver": token_version,
+        }
+        mock_session_repository = MagicMock(spec=ISessionRepository)
+        mock_session_repository.get_principal.return_value = None
+        mock_account_repository = MagicMock(spec=IAccountRepository)
+        mock_principal_repository = MagicMock(spec=IPrincipalRepository)
+        mock_principal_repository.lookup_version.return_value = VersionLookup(
+            revoked=False, version=version
+        )
+        mock_principal_repository.lookup.return_value = PrincipalLookup(
+            revoked=False, principal=None
+        )
+
+        service = AuthService(
+            MagicMock(),
+            mock_auth_repository,
+            MagicMock(spec=IUserRepository),
+            mock_session_repository,
+            mock_account_repository,
+            mock_principal_repository,
+            account_claims=True,
+        )
+        return service, user_id, account_id, mock_session_repository, mock_principal_repository
+
+    def test_claims_authorize_without_database(self):
+        """Test that an account listed in the token is authorized from the claims alone"""
+        # Arrange
+        service, user_id, account_id, session_repository, principal_repository = self._build(
+            account_type=AccountType.DRONER
+        )
+
+        # Act
+        account = service.get_authenticated_account("test-token", account_id)
+
+        # Assert
+        assert account.id == account_id
+        assert account.user_id == user_id
+        assert account.account_type == AccountType.DRONER
+        token = principal_repository.lookup_version.call_args.args[0]
+        assert token.jti == "test-jti"
+        principal_repository.lookup_version.assert_called_once_with(token, user_id)
+        principal_repository.lookup.assert_not_called()
+        session_repository.get_principal.assert_not_called()
+
+    def test_outdated_version_loads_principal(self):
+        """Test that a token issued before the user changed falls back to the database"""
+        # Arrange
+        service, _, account_id, session_repository, principal_repository = self._build(
+            token_version=7, version=8
+        )
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_authenticated_account("test-token", account_id)
+
+        assert exc_info.value.detail == "Session has been revoked"
+        principal_repository.lookup.assert_called_once()
+        session_repository.get_principal.assert_called_once()
+
+    def test_unlisted_account_loads_principal(self):
+        """Test that an account missing from the claims skips the version lookup"""
+        # Arrange
+        service, _, _, session_repository, principal_repository = self._build()
+
+        # Act & Assert
+        with pytest.raises(HTTPException):
+            service.get_authenticated_account("test-token", uuid4())
+
+        principal_repository.lookup_version.assert_not_called()
+        session_repository.get_principal.assert_called_once()
+
+    def test_revoked_token_with_claims(self):
+        """Test that the claims never outlive a blacklisted token"""
+        # Arrange
+        service, _, account_id, session_repository, principal_repository = self._build()
+        principal_repository.lookup_version.return_value = VersionLookup(revoked=True, version=7)
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_authenticated_account("test-token", account_id)
+
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert exc_info.value.detail == "Token has been revoked"
+        session_repository.get_principal.assert_not_called()
+
+    def test_signin_embeds_active_accounts_and_version(self):
+        """Test that access tokens list the user's active accounts and claims version"""
+        # Arrange
+        service, user_id, _, _, principal_repository = self._build()
+        now = dt.now(datetime.UTC)
+        user = User(id=user_id, email="claims@example.com", hashed_password="hashed")
+        active, inactive = (
+            Account(
+                id=uuid4(),
+                user_id=user_id,
+                name="Claims Account",
+                account_type=AccountType.EMPLOYER,
+                is_active=is_active,
+                created_at=now,
+                updated_at=now,
+            )
+            for is_active in (True, False)
+        )
+        service.user_repository.get_by_email.return_value = user
+        service.auth_repository.verify_and_update_password.return_value = (True, None)
+        service.auth_repository.create_token.return_value = ("access", "refresh", now)
+        service.account_repository.get_user_accounts.return_value = [active, inactive]
+        principal_repository.get_version.return_value = 42
+
+        # Act
+        service.signin("127.0.0.1", SigninDTO(email=user.email, password="password"))
+
+        # Assert
+        access_claims = service.auth_repository.create_token.call_args.kwargs["access_claims"]
+        assert access_claims == {"acc": {str(active.id): AccountType.EMPLOYER}, "ver": 42}
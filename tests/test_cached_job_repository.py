@@ -0,0 +1,226 @@
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.models.application import Application, ApplicationStatus
+from app.domain.models.job import Job, JobUpdate
+from app.domain.pagination import Cursor
+from app.domain.repositories.application import ApplicationRepository
+from app.domain.repositories.cached_job import CachedJobRepository, JobCacheStats
+from app.domain.repositories.job import JobRepository
+from tests.utils import (
+    create_test_account,
+    create_test_application,
+    create_test_job,
+    create_test_user,
+)
+
+
+@pytest.fixture
+def stats():
+    return JobCacheStats()
+
+
+@pytest.fixture
+def account(db_session):
+    user = create_test_user(db_session)
+    return create_test_account(db_session, user.id)
+
+
+def make_repository(
+    db_session, mock_cache, stats, pages=2
+) -> tuple[CachedJobRepository, MagicMock]:
+    inner = MagicMock(wraps=JobRepository(db_session))
+    return CachedJobRepository(inner, mock_cache, ttl_seconds=60, pages=pages, stats=stats), inner
+
+
+class TestCachedJobRepositoryGetById:
+    """Tests for CachedJobRepository.get_by_id"""
+
+    def test_second_read_is_served_from_cache(self, db_session, mock_cache, stats, account):
+        """Test that a cached job is not read from the database again"""
+        # Arrange
+        job = create_test_job(db_session, account.id, title="Cached Job")
+        repository, inner = make_repository(db_session, mock_cache, stats)
+
+        # Act
+        first = repository.get_by_id(job.id)
+        second = repository.get_by_id(job.id)
+
+        # Assert
+        assert first.id == second.id == job.id
+        assert second.title == "Cached Job"
+        assert second.created_at == job.created_at
+        inner.get_by_id.assert_called_once_with(job.id)
+        assert stats.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+        assert 0 < mock_cache.ttl(f"jobs:{job.id}:v0") <= 60
+
+    def test_missing_job_is_cached(self, db_session, mock_cache, stats):
+        """Test that a lookup of a missing job is cached as well"""
+        repository, inner = make_repository(db_session, mock_cache, stats)
+        job_id = uuid4()
+
+        assert repository.get_by_id(job_id) is None
+        assert repository.get_by_id(job_id) is None
+        inner.get_by_id.assert_called_once_with(job_id)
+
+    def test_update_invalidates_job(self, db_session, mock_cache, stats, account):
+        """Test that an update makes the cached job unreachable"""
+        # Arrange
+        job = create_test_job(db_session, account.id, title="Before")
+        repository, inner = make_repository(db_session, mock_cache, stats)
+        repository.get_by_id(job.id)
+
+        # Act
+        repository.update(job.id, JobUpdate(title="After"))
+        result = repository.get_by_id(job.id)
+
+        # Assert
+        assert result.title == "After"
+        assert inner.get_by_id.call_count == 2
+
+    def test_delete_invalidates_job(self, db_session, mock_cache, stats, account):
+        """Test that a deleted job is no longer served from the cache"""
+        # Arrange
+        job = create_test_job(db_session, account.id)
+        repository, _ = make_repository(db_session, mock_cache, stats)
+        repository.get_by_id(job.id)
+
+        # Act
+        repository.delete(job.id)
+
+        # Assert
+        assert repository.get_by_id(job.id) is None
+
+    def test_stale_write_after_invalidation_is_unreachable(
+        self, db_session, mock_cache, stats, account
+    ):
+        """Test that a payload stored under an old version is never read"""
+        # Arrange
+        job = create_test_job(db_session, account.id, title="Current")
+        repository, _ = make_repository(db_session, mock_cache, stats)
+        repository.update(job.id, JobUpdate(title="Current"))
+        # A reader that fetched the job before the write stores it under the old version
+        mock_cache.set(f"jobs:{job.id}:v0", "[]")
+
+        # Act
+        result = repository.get_by_id(job.id)
+
+        # Assert
+        assert result is not None
+        assert result.title == "Current"
+
+
+class TestCachedJobRepositoryGetAll:
+    """Tests for CachedJobRepository.get_all"""
+
+    def test_first_pages_are_cached(self, db_session, mock_cache, stats, account):
+        """Test that the first offset pages are served from the cache"""
+        # Arrange
+        for i in range(3):
+            create_test_job(db_session, account.id, title=f"Job {i}")
+        repository, inner = make_repository(db_session, mock_cache, stats)
+
+        # Act
+        first = repository.get_all(offset=0, limit=2)
+        second = repository.get_all(offset=0, limit=2)
+
+        # Assert
+        assert [job.id for job in first] == [job.id for job in second]
+        inner.get_all.assert_called_once()
+
+    def test_deep_and_cursor_pages_bypass_cache(self, db_session, mock_cache, stats, account):
+        """Test that pages past the cached window and cursor pages hit the database"""
+        # Arrange
+        job = create_test_job(db_session, account.id)
+        repository, inner = make_repository(db_session, mock_cache, stats, pages=1)
+        cursor = Cursor(job.created_at, job.id)
+
+        # Act
+        repository.get_all(offset=2, limit=2)
+        repository.get_all(offset=2, limit=2)
+        repository.get_all(limit=2, cursor=cursor)
+
+        # Assert
+        assert inner.get_all.call_count == 3
+        assert stats.stats()["hits"] + stats.stats()["misses"] == 0
+
+    @pytest.mark.parametrize("write", ["create", "update", "delete"])
+    def test_writes_invalidate_listing(self, db_session, mock_cache, stats, account, write):
+        """Test that any job write invalidates the cached listing pages"""
+        # Arrange
+        job = create_test_job(db_session, account.id, title="Listed")
+        repository, inner = make_repository(db_session, mock_cache, stats)
+        repository.get_all(offset=0, limit=10)
+
+        # Act
+        if write == "create":
+            repository.create(
+                Job(
+                    account_id=account.id,
+                    title="New",
+                    description="New job",
+                    budget=100.0,
+                    location="Test Location",
+                    start_date=job.start_date,
+                    end_date=job.end_date,
+                )
+            )
+        elif write == "update":
+            repository.update(job.id, JobUpdate(title="Renamed"))
+        else:
+            repository.delete(job.id)
+        repository.get_all(offset=0, limit=10)
+
+        # Assert
+        assert inner.get_all.call_count == 2
+
+
+class TestCachedJobRepositoryGetApplicationCounts:
+    """Tests for CachedJobRepository.get_application_counts"""
+
+    def test_only_missing_jobs_are_counted(self, db_session, mock_cache, stats, account):
+        """Test that cached counts are reused and the rest counted in one query"""
+        # Arrange
+        droner = create_test_account(db_session, account.user_id, name="Droner")
+        first = create_test_job(db_session, account.id)
+        second = create_test_job(db_session, account.id)
+        create_test_application(db_session, first.id, droner.id)
+        repository, inner = make_repository(db_session, mock_cache, stats)
+        repository.get_application_counts([first.id])
+
+        # Act
+        counts = repository.get_application_counts([first.id, second.id])
+
+        # Assert
+        assert list(counts) == [first.id, second.id]
+        assert counts[first.id].pending == 1
+        assert counts[second.id].pending == 0
+        assert inner.get_application_counts.call_args_list[-1].args == ([second.id],)
+
+    def test_application_writes_recount(self, db_session, mock_cache, stats, account):
+        """Test that counts are read again after the application repository wrote"""
+        # Arrange
+        droner = create_test_account(db_session, account.user_id, name="Droner")
+        job = create_test_job(db_session, account.id)
+        repository, _ = make_repository(db_session, mock_cache, stats)
+        repository.get_application_counts([job.id])
+        create_test_application(db_session, job.id, droner.id)
+        stale = repository.get_application_counts([job.id])
+
+        # Act
+        application = ApplicationRepository(db_session, mock_cache).create(
+            Application(job_id=job.id, account_id=account.id)
+        )
+        created = repository.get_application_counts([job.id])
+        ApplicationRepository(db_session, mock_cache).update_statuses(
+            job.id, {application.id: ApplicationStatus.ACCEPTED}
+        )
+        fresh = repository.get_application_counts([job.id])
+
+        # Assert
+        assert stale[job.id].pending == 0
+        assert created[job.id].pending == 2
+        assert fresh[job.id].pending == 1
+        assert fresh[job.id].accepted == 1
@@ -0,0 +1,168 @@
+"""Tests for the database session runner and connection pool."""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config.database import (
+    ASYNC_SESSION_KEY,
+    DbRunner,
+    InstrumentedQueuePool,
+    get_async_db,
+    get_pool_stats,
+)
+from app.config.settings import Settings
+from app.domain.models.user import User
+from app.domain.repositories.user import UserRepository
+from tests.conftest import TEST_DATABASE_URL
+from tests.utils import get_internal_headers
+
+
+class TestDbRunner:
+    """Tests for DbRunner."""
+
+    @pytest.mark.asyncio
+    async def test_run_offloads_sync_session_to_threadpool(self, db_session: Session):
+        """Test that calls on a sync session run outside the event loop thread."""
+        # Arrange
+        runner = DbRunner(db_session)
+        loop_thread = threading.get_ident()
+
+        # Act
+        worker_thread = await runner.run(threading.get_ident)
+
+        # Assert
+        assert worker_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_run_passes_arguments_and_returns_result(self, db_session: Session):
+        """Test that positional and keyword arguments are forwarded."""
+        # Arrange
+        runner = DbRunner(db_session)
+        repository = UserRepository(db_session)
+
+        # Act
+        user = await runner.run(
+            repository.create, User(email="runner@example.com", hashed_password="hashed")
+        )
+        found = await runner.run(repository.get_by_email, email="runner@example.com")
+
+        # Assert
+        assert found is not None
+        assert found.id == user.id
+
+    @pytest.mark.asyncio
+    async def test_run_uses_async_session_when_available(self, db_session: Session):
+        """Test that repositories run unchanged through AsyncSession.run_sync."""
+        # Arrange
+        async_engine = create_async_engine(
+            Settings(
+                db_connection_string=TEST_DATABASE_URL,
+                cache_connection_string="redis://localhost:6379/0",
+                secret_key="test",
+                algorithm="HS256",
+                access_token_expire_minutes=30,
+                refresh_token_expire_minutes=1440,
+            ).db_async_connection_string
+        )
+
+        try:
+            async with AsyncSession(async_engine, expire_on_commit=False) as db:
+                db.sync_session.info[ASYNC_SESSION_KEY] = db
+                runner = DbRunner(db.sync_session)
+                repository = UserRepository(db.sync_session)
+
+                # Act
+                user = await runner.run(
+                    repository.create, User(email="async@example.com", hashed_password="hashed")
+                )
+                found = await runner.run(repository.get_by_id, user.id)
+        finally:
+            await async_engine.dispose()
+
+        # Assert
+        assert found is not None
+        assert found.email == "async@example.com"
+
+    @pytest.mark.asyncio
+    async def test_get_async_db_requires_async_engine(self):
+        """Test that the async session dependency fails when the engine is disabled."""
+        with pytest.raises(RuntimeError):
+            await anext(get_async_db())
+
+
+class TestPoolTelemetry:
+    """Tests for the instrumented connection pool."""
+
+    def test_checkouts_and_timeouts_are_recorded(self):
+        """Test that waits are measured and pool exhaustion is counted."""
+        # Arrange
+        engine = create_engine(
+            TEST_DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        try:
+            held = engine.connect()
+            held.execute(text("SELECT 1"))
+
+            # Act
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+            busy = get_pool_stats(engine)
+            held.close()
+            idle = get_pool_stats(engine)
+        finally:
+            engine.dispose()
+
+        # Assert
+        assert busy["pool_size"] == 1
+        assert busy["checked_out"] == 1
+        assert busy["checkouts"] == 1
+        assert busy["timeouts"] == 1
+        assert idle["checked_out"] == 0
+        assert idle["checked_in"] == 1
+        assert idle["wait_ms_max"] >= idle["wait_ms_avg"] > 0
+
+    def test_db_pool_stats_endpoint(self, client):
+        """Test the internal database pool stats endpoint."""
+        response = client.get("/internal/db-pool", headers=get_internal_headers())
+
+        assert response.status_code == 200
+        data = response.json()
+        assert {"pool_size", "checked_out", "overflow", "wait_ms_avg"} <= data["sync"].keys()
+        assert data["async"] is None
+
+
+class TestSettingsAsyncConnectionString:
+    """Tests for Settings.db_async_connection_string."""
+
+    @pytest.mark.parametrize(
+        ("connection_string", "expected"),
+        [
+            ("postgresql://u:p@localhost:5432/db", "postgresql+asyncpg://u:p@localhost:5432/db"),
+            (
+                "postgresql+psycopg2://u:p@localhost:5432/db",
+                "postgresql+asyncpg://u:p@localhost:5432/db",
+            ),
+            ("sqlite:///tmp/test.db", "sqlite+aiosqlite:///tmp/test.db"),
+        ],
+    )
+    def test_async_driver_is_selected(self, connection_string: str, expected: str):
+        """Test that the sync connection string is mapped to an async driver."""
+        settings = Settings(
+            db_connection_string=connection_string,
+            cache_connection_string="redis://localhost:6379/0",
+            secret_key="test",
+            algorithm="HS256",
+            access_token_expire_minutes=30,
+            refresh_token_expire_minutes=1440,
+        )
+
+        assert settings.db_async_connection_string == expected
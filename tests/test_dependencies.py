@@ -6,26 +6,26 @@ from uuid import uuid4
 import pytest
 from fastapi import HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
+from sqlmodel import Session
 
+from app.config.database import DbRunner
 from app.config.dependencies import get_authenticated_account
-from app.domain.models.account import Account, AccountType
+from app.domain.models.account import AccountType
 from app.services.interfaces import IAuthService
+from app.services.interfaces.auth import AuthenticatedAccount
 
 
 class TestGetAuthenticatedAccount:
     """Tests for get_authenticated_account dependency function."""
 
-    def test_get_authenticated_account_success(self):
+    @pytest.mark.asyncio
+    async def test_get_authenticated_account_success(self):
         """Test getting authenticated account successfully with valid UUID."""
         # Arrange
         account_id = uuid4()
         token = "test-token"
-        mock_account = Account(
-            id=account_id,
-            user_id=uuid4(),
-            name="Test Account",
-            account_type=AccountType.EMPLOYER,
-            is_active=True,
+        mock_account = AuthenticatedAccount(
+            id=account_id, user_id=uuid4(), account_type=AccountType.EMPLOYER
         )
 
         mock_auth_service = MagicMock(spec=IAuthService)
@@ -35,9 +35,10 @@ class TestGetAuthenticatedAccount:
         mock_credentials.credentials = token
 
         # Act
-        result = get_authenticated_account(
+        result = await get_authenticated_account(
             credentials=mock_credentials,
             auth_service=mock_auth_service,
+            db=DbRunner(Session()),
             x_account_id=str(account_id),
         )
 
@@ -45,7 +46,8 @@ class TestGetAuthenticatedAccount:
         assert result == mock_account
         mock_auth_service.get_authenticated_account.assert_called_once_with(token, account_id)
 
-    def test_get_authenticated_account_invalid_uuid_format(self):
+    @pytest.mark.asyncio
+    async def test_get_authenticated_account_invalid_uuid_format(self):
         """Test that invalid UUID format raises HTTPException."""
         # Arrange
         mock_auth_service = MagicMock(spec=IAuthService)
@@ -54,9 +56,10 @@ class TestGetAuthenticatedAccount:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            get_authenticated_account(
+            await get_authenticated_account(
                 credentials=mock_credentials,
                 auth_service=mock_auth_service,
+                db=DbRunner(Session()),
                 x_account_id="invalid-uuid-format",
             )
 
@@ -65,7 +68,8 @@ class TestGetAuthenticatedAccount:
         # Should not call auth service if UUID is invalid
         mock_auth_service.get_authenticated_account.assert_not_called()
 
-    def test_get_authenticated_account_empty_string(self):
+    @pytest.mark.asyncio
+    async def test_get_authenticated_account_empty_string(self):
         """Test that empty string UUID raises HTTPException."""
         # Arrange
         mock_auth_service = MagicMock(spec=IAuthService)
@@ -74,9 +78,10 @@ class TestGetAuthenticatedAccount:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            get_authenticated_account(
+            await get_authenticated_account(
                 credentials=mock_credentials,
                 auth_service=mock_auth_service,
+                db=DbRunner(Session()),
                 x_account_id="",
             )
 
@@ -84,7 +89,8 @@ class TestGetAuthenticatedAccount:
         assert "Invalid account ID format" in exc_info.value.detail
         mock_auth_service.get_authenticated_account.assert_not_called()
 
-    def test_get_authenticated_account_propagates_auth_service_errors(self):
+    @pytest.mark.asyncio
+    async def test_get_authenticated_account_propagates_auth_service_errors(self):
         """Test that errors from auth service are propagated."""
         # Arrange
         account_id = uuid4()
@@ -100,9 +106,10 @@ class TestGetAuthenticatedAccount:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            get_authenticated_account(
+            await get_authenticated_account(
                 credentials=mock_credentials,
                 auth_service=mock_auth_service,
+                db=DbRunner(Session()),
                 x_account_id=str(account_id),
             )
 
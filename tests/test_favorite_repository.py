@@ -1,5 +1,6 @@
 from uuid import uuid4
 
+from app.domain.models.favorite import Favorite
 from app.domain.repositories.favorite import FavoriteRepository
 from tests.utils import (
     create_test_account,
@@ -308,3 +309,91 @@ class TestFavoriteRepositoryDelete:
 
         # Assert
         assert result is False
+
+
+class TestFavoriteRepositoryCreate:
+    """Tests for FavoriteRepository.create"""
+
+    def test_create_favorite(self, db_session):
+        """Test creating a new favorite"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        job = create_test_job(db_session, account.id)
+        repository = FavoriteRepository(db_session)
+
+        # Act
+        favorite = repository.create(Favorite(account_id=account.id, job_id=job.id))
+
+        # Assert
+        assert repository.get_by_id(favorite.id) is not None
+
+    def test_create_duplicate_returns_existing(self, db_session):
+        """Test that favoriting a job twice keeps a single row"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        job = create_test_job(db_session, account.id)
+        existing = create_test_favorite(db_session, account.id, job.id)
+        repository = FavoriteRepository(db_session)
+
+        # Act
+        favorite = repository.create(Favorite(account_id=account.id, job_id=job.id))
+
+        # Assert
+        assert favorite.id == existing.id
+        assert len(repository.get_all()) == 1
+
+
+class TestFavoriteRepositoryGetByAccountId:
+    """Tests for FavoriteRepository.get_by_account_id"""
+
+    def test_get_by_account_id_includes_job(self, db_session):
+        """Test that include_job loads the jobs with the favorites"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        job = create_test_job(db_session, account.id)
+        create_test_favorite(db_session, account.id, job.id)
+        account_id, job_id = account.id, job.id
+        db_session.expunge_all()
+        repository = FavoriteRepository(db_session)
+
+        # Act
+        favorites = repository.get_by_account_id(account_id, include_job=True)
+        db_session.expunge_all()
+
+        # Assert
+        assert favorites[0].job.id == job_id
+
+
+class TestFavoriteRepositoryGetFavoritedJobIds:
+    """Tests for FavoriteRepository.get_favorited_job_ids"""
+
+    def test_get_favorited_job_ids(self, db_session):
+        """Test that only the account's favorited jobs among those asked are returned"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        other_account = create_test_account(db_session, user.id, name="Other")
+        favorited_job = create_test_job(db_session, account.id)
+        other_job = create_test_job(db_session, account.id)
+        unasked_job = create_test_job(db_session, account.id)
+        create_test_favorite(db_session, account.id, favorited_job.id)
+        create_test_favorite(db_session, account.id, unasked_job.id)
+        create_test_favorite(db_session, other_account.id, other_job.id)
+        repository = FavoriteRepository(db_session)
+
+        # Act
+        favorited = repository.get_favorited_job_ids(account.id, [favorited_job.id, other_job.id])
+
+        # Assert
+        assert favorited == {favorited_job.id}
+
+    def test_get_favorited_job_ids_empty(self, db_session):
+        """Test that no job IDs returns an empty set"""
+        # Arrange
+        repository = FavoriteRepository(db_session)
+
+        # Act & Assert
+        assert repository.get_favorited_job_ids(uuid4(), []) == set()
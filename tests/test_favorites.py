@@ -42,6 +42,29 @@ class TestCreateFavorite:
         assert "id" in data
         assert "created_at" in data
 
+    def test_create_favorite_twice_returns_existing(self, client, db_session):
+        """Test that favoriting the same job again is idempotent"""
+        employer_user = create_test_user(db_session, email="employer-dup@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer_account.id)
+
+        first = client.post("/jobs/favorites/", json={"job_id": str(job.id)}, headers=headers)
+        second = client.post("/jobs/favorites/", json={"job_id": str(job.id)}, headers=headers)
+        assert second.status_code == status.HTTP_201_CREATED
+        assert second.json()["id"] == first.json()["id"]
+
+        response = client.get("/jobs/favorites/", headers=headers)
+        assert len(response.json()) == 1
+
     def test_create_favorite_droner_account(self, client, db_session):
         """Test creating a favorite with a droner account"""
         # Create employer user and account
@@ -210,6 +233,62 @@ class TestGetFavorites:
             assert "job_id" in favorite
             assert "created_at" in favorite
 
+    def test_get_favorites_with_jobs(self, client, db_session):
+        """Test embedding a job summary in every favorite"""
+        employer_user = create_test_user(db_session, email="employer3j@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        job = create_test_job(db_session, employer_account.id, title="Inspect the bridge")
+        create_test_favorite(db_session, employer_account.id, job.id)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer_account.id)
+
+        response = client.get("/jobs/favorites/", params={"include_job": "true"}, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data[0]["job"]["id"] == str(job.id)
+        assert data[0]["job"]["title"] == "Inspect the bridge"
+
+    def test_get_favorites_cursor_pagination(self, client, db_session):
+        """Test that favorites are paginated newest first with the X-Next-Cursor header"""
+        employer_user = create_test_user(db_session, email="employer3c@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        favorites = [
+            create_test_favorite(
+                db_session, employer_account.id, create_test_job(db_session, employer_account.id).id
+            )
+            for _ in range(3)
+        ]
+
+        # Signin
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer_account.id)
+
+        first = client.get("/jobs/favorites/?limit=2", headers=headers)
+        assert first.status_code == status.HTTP_200_OK
+        assert [fav["id"] for fav in first.json()] == [str(favorites[2].id), str(favorites[1].id)]
+
+        second = client.get(
+            "/jobs/favorites/",
+            params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+            headers=headers,
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert [fav["id"] for fav in second.json()] == [str(favorites[0].id)]
+        assert "X-Next-Cursor" not in second.headers
+
     def test_get_favorites_empty(self, client, db_session):
         """Test getting favorites when account has none"""
         user = create_test_user(db_session, email="user6@test.com")
@@ -277,6 +356,50 @@ class TestGetFavorites:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
 
+class TestLookupFavorites:
+    """Tests for GET /jobs/favorites/lookup"""
+
+    def test_lookup_favorites_bitmap_in_request_order(self, client, db_session):
+        """Test that each character reports whether the job at that position is favorited"""
+        employer_user = create_test_user(db_session, email="employer-lookup@test.com")
+        employer_account = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        jobs = [create_test_job(db_session, employer_account.id) for _ in range(3)]
+        create_test_favorite(db_session, employer_account.id, jobs[0].id)
+        create_test_favorite(db_session, employer_account.id, jobs[2].id)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": employer_user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer_account.id)
+
+        response = client.get(
+            "/jobs/favorites/lookup",
+            params={"job_ids": [str(jobs[0].id), str(jobs[1].id), str(jobs[2].id)]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"bitmap": "101"}
+
+    def test_lookup_favorites_requires_job_ids(self, client, db_session):
+        """Test that at least one job ID must be given"""
+        user = create_test_user(db_session, email="user-lookup@test.com")
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        response = client.get("/jobs/favorites/lookup", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
 class TestDeleteFavorite:
     """Tests for DELETE /jobs/favorites/{favorite_id}"""
 
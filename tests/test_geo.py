@@ -0,0 +1,47 @@
+"""Tests for geohash helpers."""
+
+import pytest
+
+from app.domain.geo import MAX_COVERING_CELLS, covering_cells, encode_geohash
+
+
+class TestEncodeGeohash:
+    """Tests for encode_geohash"""
+
+    def test_encode_known_coordinate(self):
+        """Test encoding against a reference geohash"""
+        assert encode_geohash(57.64911, 10.40744, precision=11) == "u4pruydqqvj"
+
+    def test_encode_default_precision(self):
+        """Test that geohashes are stored at a fixed length"""
+        assert len(encode_geohash(-31.4201, -64.1888)) == 12
+
+
+class TestCoveringCells:
+    """Tests for covering_cells"""
+
+    @pytest.mark.parametrize("radius_km", [0.5, 5, 25, 200])
+    def test_cells_cover_points_on_the_circle(self, radius_km):
+        """Test that points at the edge of the circle fall inside a covering cell"""
+        # Arrange
+        latitude, longitude = -31.4201, -64.1888
+        delta = radius_km / 111.2 * 0.99
+        edge_points = [
+            (latitude + delta, longitude),
+            (latitude - delta, longitude),
+            (latitude, longitude + delta / 0.853),
+            (latitude, longitude - delta / 0.853),
+        ]
+
+        # Act
+        cells = covering_cells(latitude, longitude, radius_km)
+
+        # Assert
+        assert 0 < len(cells) <= MAX_COVERING_CELLS
+        for point in [(latitude, longitude), *edge_points]:
+            geohash = encode_geohash(*point)
+            assert any(geohash.startswith(cell) for cell in cells)
+
+    def test_smaller_radius_uses_finer_cells(self):
+        """Test that the cell precision follows the radius"""
+        assert len(covering_cells(0, 0, 1)[0]) > len(covering_cells(0, 0, 100)[0])
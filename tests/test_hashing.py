@@ -0,0 +1,204 @@
+"""Tests for the password hasher pool."""
+
+import threading
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.config import hashing
+from app.config.hashing import (
+    MIN_MEMORY_COST,
+    MIN_TIME_COST,
+    PasswordHasherPool,
+    calibrate_argon2,
+    write_env,
+)
+from app.domain.repositories.auth import AuthRepository
+from tests.utils import get_internal_headers
+
+
+class TestPasswordHasherPool:
+    """Tests for PasswordHasherPool."""
+
+    def test_run_returns_result_from_worker_thread(self):
+        """Test that the call runs on a pool thread and its result is returned."""
+        # Arrange
+        pool = PasswordHasherPool(max_workers=1, max_pending=0)
+
+        # Act
+        thread_name = pool.run(lambda: threading.current_thread().name)
+
+        # Assert
+        assert thread_name.startswith("argon2")
+        assert pool.stats()["processed"] == 1
+        assert pool.stats()["in_flight"] == 0
+
+    def test_run_rejects_when_saturated(self):
+        """Test that a full pool sheds load with 503 and Retry-After."""
+        # Arrange
+        pool = PasswordHasherPool(max_workers=1, max_pending=0)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block() -> None:
+            started.set()
+            release.wait(timeout=5)
+
+        holder = threading.Thread(target=pool.run, args=(block,))
+        holder.start()
+        started.wait(timeout=5)
+
+        # Act & Assert
+        try:
+            with pytest.raises(HTTPException) as exc_info:
+                pool.run(lambda: None)
+            assert pool.stats()["in_flight"] == 1
+        finally:
+            release.set()
+            holder.join(timeout=5)
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        assert pool.stats()["rejected"] == 1
+
+    def test_run_releases_slot_when_call_fails(self):
+        """Test that an exception in the worker does not leak a pool slot."""
+        # Arrange
+        pool = PasswordHasherPool(max_workers=1, max_pending=0)
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        # Act
+        with pytest.raises(ValueError):
+            pool.run(fail)
+
+        # Assert
+        assert pool.run(lambda: "ok") == "ok"
+        assert pool.stats()["in_flight"] == 0
+
+
+class TestAuthRepositoryHasherPool:
+    """Tests for AuthRepository hashing through the pool."""
+
+    def test_hash_and_verify_through_pool(self, test_settings):
+        """Test that hashing and verification are executed on the pool."""
+        # Arrange
+        pool = PasswordHasherPool(max_workers=2, max_pending=2)
+        repository = AuthRepository(test_settings, pool)
+
+        # Act
+        hashed = repository.hash_password("s3cret-password")
+
+        # Assert
+        assert repository.verify_password("s3cret-password", hashed) is True
+        assert repository.verify_password("wrong-password", hashed) is False
+        assert pool.stats()["processed"] == 3
+
+    def test_verify_and_update_rehashes_outdated_parameters(self, test_settings):
+        """Test that a hash made with other parameters is verified and replaced."""
+        # Arrange
+        old = AuthRepository(
+            test_settings.model_copy(update={"password_hash_memory_cost": 8 * 1024})
+        )
+        current = AuthRepository(
+            test_settings.model_copy(update={"password_hash_memory_cost": 16 * 1024})
+        )
+        hashed = old.hash_password("s3cret-password")
+
+        # Act
+        valid, updated = current.verify_and_update_password("s3cret-password", hashed)
+
+        # Assert
+        assert valid is True
+        assert updated is not None and "m=16384" in updated
+        assert current.verify_and_update_password("s3cret-password", updated) == (True, None)
+        assert current.verify_and_update_password("wrong-password", hashed) == (False, None)
+
+
+class TestCalibrateArgon2:
+    """Tests for calibrate_argon2."""
+
+    @pytest.fixture(autouse=True)
+    def fake_latency(self, monkeypatch):
+        """Latency proportional to the work, 1 ms per pass over each MiB."""
+        monkeypatch.setattr(
+            hashing,
+            "measure_argon2",
+            lambda time_cost, memory_cost, parallelism, samples: time_cost * memory_cost / 1024,
+        )
+
+    def test_raises_memory_then_passes_within_budget(self):
+        """Test that memory is doubled first and passes are added with the remaining budget."""
+        # Act
+        parameters = calibrate_argon2(budget_ms=200, parallelism=1)
+
+        # Assert
+        assert parameters.memory_cost == MIN_MEMORY_COST * 4
+        assert parameters.time_cost == 2
+        assert parameters.latency_ms <= 200
+
+    def test_respects_max_memory(self):
+        """Test that a generous budget goes to passes once memory is capped."""
+        # Act
+        parameters = calibrate_argon2(
+            budget_ms=200, parallelism=1, max_memory_cost=MIN_MEMORY_COST * 2
+        )
+
+        # Assert
+        assert parameters.memory_cost == MIN_MEMORY_COST * 2
+        assert parameters.time_cost == 5
+
+    def test_never_goes_below_the_minimum(self):
+        """Test that a budget too small for the minimum still returns the minimum."""
+        # Act
+        parameters = calibrate_argon2(budget_ms=1, parallelism=1)
+
+        # Assert
+        assert (parameters.time_cost, parameters.memory_cost) == (MIN_TIME_COST, MIN_MEMORY_COST)
+        assert parameters.latency_ms > 1
+
+
+def test_write_env_replaces_and_appends(tmp_path):
+    """Test that existing variables are replaced in place and new ones appended."""
+    # Arrange
+    env = tmp_path / ".env"
+    env.write_text('SECRET_KEY="secret"\nPASSWORD_HASH_TIME_COST="3"\n')
+
+    # Act
+    write_env(env, {"PASSWORD_HASH_TIME_COST": "4", "PASSWORD_HASH_MEMORY_COST": "77824"})
+
+    # Assert
+    assert env.read_text().splitlines() == [
+        'SECRET_KEY="secret"',
+        'PASSWORD_HASH_TIME_COST="4"',
+        'PASSWORD_HASH_MEMORY_COST="77824"',
+    ]
+
+
+def test_hashing_stats_endpoint(client):
+    """Test the internal hashing stats endpoint."""
+    response = client.get("/internal/hashing", headers=get_internal_headers())
+    assert response.status_code == 200
+    data = response.json()
+    assert {"workers", "in_flight", "queue_depth", "rejected"} <= data.keys()
+
+
+class TestInternalEndpointsAuthorization:
+    """Tests for the internal API token guarding /internal"""
+
+    def test_rejects_requests_without_the_token(self, client):
+        """Test that the endpoints are hidden from callers without the token"""
+        response = client.get("/internal/hashing")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_rejects_a_wrong_token(self, client):
+        """Test that a wrong token is treated like none"""
+        response = client.get("/internal/hashing", headers={"x-internal-token": "guess"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_disabled_without_a_configured_token(self, client, test_settings, monkeypatch):
+        """Test that the endpoints are disabled when no token is configured"""
+        monkeypatch.setattr(test_settings, "internal_api_token", None)
+        response = client.get("/internal/hashing", headers=get_internal_headers())
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -1,3 +1,15 @@
+import time
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.config.health import ReadinessProbe, get_readiness_probe
+from app.main import app
+from tests.conftest import test_engine
+
+
 def test_health_endpoint(client):
     """Test the health check endpoint."""
     response = client.get("/health")
@@ -5,3 +17,91 @@ def test_health_endpoint(client):
     data = response.json()
     assert data["status"] == "healthy"
     assert "timestamp" in data
+
+
+def test_liveness_endpoint(client):
+    """Test the liveness endpoint."""
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+
+
+@pytest.fixture
+def override_readiness_probe():
+    """Point the readiness endpoint at a probe of the given cache."""
+
+    def _override(cache) -> ReadinessProbe:
+        probe = ReadinessProbe(test_engine, cache, timeout_seconds=0.5, ttl_seconds=60)
+        app.dependency_overrides[get_readiness_probe] = lambda: probe
+        return probe
+
+    yield _override
+    app.dependency_overrides.pop(get_readiness_probe, None)
+
+
+def test_readiness_endpoint_ready(client, override_readiness_probe):
+    """Test that readiness reports each dependency's latency."""
+    override_readiness_probe(fakeredis.FakeRedis())
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    for name in ("database", "cache"):
+        assert data["checks"][name]["status"] == "up"
+        assert data["checks"][name]["latency_ms"] >= 0
+
+
+def test_readiness_endpoint_cache_down(client, override_readiness_probe):
+    """Test that a failing dependency makes the worker unavailable."""
+    cache = MagicMock()
+    cache.ping.side_effect = RedisConnectionError("connection refused")
+    override_readiness_probe(cache)
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unavailable"
+    assert data["checks"]["database"]["status"] == "up"
+    assert data["checks"]["cache"] == {
+        "status": "down",
+        "latency_ms": data["checks"]["cache"]["latency_ms"],
+        "error": "ConnectionError",
+    }
+
+
+class TestReadinessProbe:
+    """Tests for ReadinessProbe."""
+
+    @pytest.mark.asyncio
+    async def test_check_is_cached(self):
+        """Test that probe results are reused within the TTL."""
+        # Arrange
+        cache = MagicMock()
+        probe = ReadinessProbe(test_engine, cache, timeout_seconds=0.5, ttl_seconds=60)
+
+        # Act
+        first = await probe.check()
+        second = await probe.check()
+
+        # Assert
+        assert first is second
+        cache.ping.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_check_times_out_slow_dependency(self):
+        """Test that a hanging dependency is reported after the timeout."""
+        # Arrange
+        cache = MagicMock()
+        cache.ping.side_effect = lambda: time.sleep(0.5)
+        probe = ReadinessProbe(test_engine, cache, timeout_seconds=0.05, ttl_seconds=0)
+
+        # Act
+        report = await probe.check()
+
+        # Assert
+        assert report.ready is False
+        assert report.checks["cache"]["error"] == "timeout"
+        assert report.checks["cache"]["latency_ms"] < 400
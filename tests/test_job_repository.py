@@ -1,8 +1,13 @@
+from unittest.mock import MagicMock
 from uuid import uuid4
 
+import pytest
+from sqlalchemy.dialects import postgresql
+
 from app.domain.models.account import AccountType
 from app.domain.models.application import ApplicationStatus
 from app.domain.models.job import JobUpdate
+from app.domain.pagination import Cursor, DistanceCursor
 from app.domain.repositories.job import JobRepository
 from tests.utils import (
     create_test_account,
@@ -50,6 +55,198 @@ class TestJobRepositoryUpdate:
         assert result is None
 
 
+class TestJobRepositoryGetAll:
+    """Tests for JobRepository.get_all"""
+
+    def test_get_all_with_cursor(self, db_session):
+        """Test walking every job with keyset pagination"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        jobs = [create_test_job(db_session, account.id, title=f"Job {i}") for i in range(5)]
+        expected = sorted(jobs, key=lambda job: (job.created_at, job.id.hex), reverse=True)
+
+        repository = JobRepository(db_session)
+
+        # Act
+        seen = []
+        cursor = None
+        while True:
+            page = repository.get_all(limit=2, cursor=cursor)
+            if not page:
+                break
+            seen.extend(page)
+            cursor = Cursor(page[-1].created_at, page[-1].id)
+
+        # Assert
+        assert [job.id for job in seen] == [job.id for job in expected]
+
+
+class TestJobRepositoryGetNearby:
+    """Tests for JobRepository.get_nearby"""
+
+    def test_get_nearby_sorted_by_distance(self, db_session):
+        """Test that only jobs inside the radius are returned, nearest first"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        repository = JobRepository(db_session)
+        create_test_job(db_session, account.id, title="No coordinates")
+        jobs = {}
+        for title, latitude, longitude in [
+            ("Centro", -31.4201, -64.1888),
+            ("Nueva Cordoba", -31.4289, -64.1848),
+            ("Villa Carlos Paz", -31.4241, -64.4978),
+            ("Rosario", -32.9442, -60.6505),
+        ]:
+            job = create_test_job(db_session, account.id, title=title)
+            job.latitude, job.longitude = latitude, longitude
+            jobs[title] = repository.create(job)
+
+        # Act
+        results = repository.get_nearby(-31.4201, -64.1888, radius_km=40)
+
+        # Assert
+        assert [job.title for job, _ in results] == ["Centro", "Nueva Cordoba", "Villa Carlos Paz"]
+        assert results[0][1] == pytest.approx(0)
+        assert results[2][1] == pytest.approx(29.4**2, rel=0.02)
+        assert jobs["Centro"].geohash.startswith("6d6m")
+
+    def test_get_nearby_with_cursor(self, db_session):
+        """Test walking nearby jobs with a distance cursor"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        repository = JobRepository(db_session)
+        for i in range(5):
+            job = create_test_job(db_session, account.id, title=f"Job {i}")
+            job.latitude, job.longitude = -31.42 + i * 0.01, -64.18
+            repository.create(job)
+
+        # Act
+        first = repository.get_nearby(-31.42, -64.18, radius_km=10, limit=3)
+        last_job, last_distance = first[-1]
+        second = repository.get_nearby(
+            -31.42, -64.18, radius_km=10, cursor=DistanceCursor(last_distance, last_job.id)
+        )
+
+        # Assert
+        assert [job.title for job, _ in first + second] == [f"Job {i}" for i in range(5)]
+
+    def test_get_nearby_across_the_antimeridian(self, db_session):
+        """Test that jobs just across ±180° longitude are within the radius"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        repository = JobRepository(db_session)
+        job = create_test_job(db_session, account.id, title="Taveuni")
+        job.latitude, job.longitude = -16.80, -179.95
+        repository.create(job)
+
+        # Act
+        results = repository.get_nearby(-16.80, 179.95, radius_km=20)
+
+        # Assert
+        assert [job.title for job, _ in results] == ["Taveuni"]
+        assert results[0][1] == pytest.approx(10.6**2, rel=0.02)
+
+    def test_update_reindexes_location(self, db_session):
+        """Test that changing coordinates updates the geohash"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        job = create_test_job(db_session, account.id)
+        repository = JobRepository(db_session)
+
+        # Act
+        result = repository.update(job.id, JobUpdate(latitude=-31.4201, longitude=-64.1888))
+
+        # Assert
+        assert result is not None
+        assert result.geohash is not None
+        assert result.geohash.startswith("6d6m")
+        assert repository.get_nearby(-31.4201, -64.1888, radius_km=1)[0][0].id == job.id
+
+
+class TestJobRepositorySearch:
+    """Tests for JobRepository.search"""
+
+    def test_search_ranks_title_matches_first(self, db_session):
+        """Test that title matches outrank description-only matches"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        in_description = create_test_job(
+            db_session, account.id, title="Roof survey", description="Thermal drone inspection"
+        )
+        in_title = create_test_job(
+            db_session, account.id, title="Drone mapping", description="Orthomosaic of a farm"
+        )
+        create_test_job(db_session, account.id, title="Unrelated", description="Nothing here")
+
+        repository = JobRepository(db_session)
+
+        # Act
+        results = repository.search("DRONE")
+
+        # Assert
+        assert [job.id for job in results] == [in_title.id, in_description.id]
+
+    def test_search_requires_every_keyword(self, db_session):
+        """Test that all keywords must match and location narrows the results"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        match = create_test_job(
+            db_session, account.id, title="Aerial photography", location="Córdoba"
+        )
+        create_test_job(db_session, account.id, title="Aerial mapping", location="Córdoba")
+        create_test_job(db_session, account.id, title="Aerial photography", location="Rosario")
+
+        repository = JobRepository(db_session)
+
+        # Act
+        results = repository.search("aerial photography", location="córdoba")
+
+        # Assert
+        assert [job.id for job in results] == [match.id]
+
+    def test_search_escapes_like_wildcards(self, db_session):
+        """Test that LIKE wildcards in the keywords are matched literally"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        create_test_job(db_session, account.id, title="Drone job")
+
+        repository = JobRepository(db_session)
+
+        # Act
+        results = repository.search("%")
+
+        # Assert
+        assert results == []
+
+    def test_search_full_text_matches_index_expression(self):
+        """Test that the Postgres query uses the expression of the GIN index"""
+        # Arrange
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "postgresql"
+        repository = JobRepository(session)
+
+        # Act
+        repository.search("drone photography")
+
+        # Assert
+        statement = session.exec.call_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert (
+            "(setweight(to_tsvector('simple'::regconfig, job.title), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, job.description), 'B')) @@ "
+            "websearch_to_tsquery('simple'::regconfig, "
+        ) in sql
+        assert "ORDER BY ts_rank(" in sql
+
+
 class TestJobRepositoryGetTotalApplications:
     """Tests for JobRepository.get_total_applications"""
 
@@ -346,3 +543,76 @@ class TestJobRepositoryGetTotalApplications:
 
         # Assert - should return the same result each time
         assert total1 == total2 == total3 == 1
+
+
+class TestJobRepositoryGetApplicationCounts:
+    """Tests for JobRepository.get_application_counts"""
+
+    def test_get_application_counts_per_status_for_a_page(self, db_session):
+        """Test counting applications per status of several jobs at once"""
+        # Arrange
+        user = create_test_user(db_session)
+        employer_account = create_test_account(
+            db_session, user.id, account_type=AccountType.EMPLOYER
+        )
+        droners = [
+            create_test_account(
+                db_session, user.id, name=f"Droner {i}", account_type=AccountType.DRONER
+            )
+            for i in range(3)
+        ]
+        busy_job = create_test_job(db_session, employer_account.id, title="Busy job")
+        quiet_job = create_test_job(db_session, employer_account.id, title="Quiet job")
+        create_test_application(db_session, busy_job.id, droners[0].id)
+        create_test_application(db_session, busy_job.id, droners[1].id)
+        create_test_application(
+            db_session, busy_job.id, droners[2].id, status=ApplicationStatus.ACCEPTED
+        )
+        create_test_application(
+            db_session, quiet_job.id, droners[0].id, status=ApplicationStatus.WITHDRAWN
+        )
+
+        repository = JobRepository(db_session)
+
+        # Act
+        counts = repository.get_application_counts([busy_job.id, quiet_job.id])
+
+        # Assert
+        assert counts[busy_job.id].pending == 2
+        assert counts[busy_job.id].accepted == 1
+        assert counts[busy_job.id].rejected == 0
+        assert counts[quiet_job.id].withdrawn == 1
+        assert counts[quiet_job.id].pending == 0
+
+    def test_get_application_counts_job_without_applications(self, db_session):
+        """Test that jobs without applications get all-zero counts"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        job = create_test_job(db_session, account.id)
+
+        repository = JobRepository(db_session)
+
+        # Act
+        counts = repository.get_application_counts([job.id])
+
+        # Assert
+        assert counts[job.id].model_dump() == {
+            "pending": 0,
+            "accepted": 0,
+            "rejected": 0,
+            "withdrawn": 0,
+        }
+
+    def test_get_application_counts_no_jobs(self, db_session):
+        """Test that an empty page issues no query"""
+        # Arrange
+        mock_session = MagicMock()
+        repository = JobRepository(mock_session)
+
+        # Act
+        counts = repository.get_application_counts([])
+
+        # Assert
+        assert counts == {}
+        mock_session.exec.assert_not_called()
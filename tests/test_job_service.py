@@ -6,6 +6,7 @@ import pytest
 from fastapi import HTTPException, status
 
 from app.domain.models.job import Job
+from app.domain.pagination import DistanceCursor
 from app.domain.repositories.interfaces.job import IJobRepository
 from app.dto.job import UpdateJobDto
 from app.services.job import JobService
@@ -320,3 +321,63 @@ class TestJobServiceDeleteJob:
         assert "not authorized" in str(exc_info.value.detail).lower()
         mock_job_repository.get_by_id.assert_called_once_with(job_id)
         mock_job_repository.delete.assert_not_called()
+
+
+class TestJobServiceSearch:
+    """Tests for JobService.search"""
+
+    def test_search_delegates_to_repository(self):
+        """Test that search forwards the keywords, filters and pagination"""
+        # Arrange
+        mock_job_repository = MagicMock(spec=IJobRepository)
+        mock_job_repository.search.return_value = []
+
+        service = JobService(mock_job_repository)
+
+        # Act
+        result = service.search("drone", location="Córdoba", offset=5, limit=10)
+
+        # Assert
+        assert result == []
+        mock_job_repository.search.assert_called_once_with(
+            "drone", location="Córdoba", offset=5, limit=10
+        )
+
+
+class TestJobServiceGetNearby:
+    """Tests for JobService.get_nearby"""
+
+    def test_get_nearby_returns_distances_in_km(self):
+        """Test that squared distances become km and the cursor uses the raw ordering key"""
+        # Arrange
+        jobs = [
+            Job(
+                id=uuid4(),
+                account_id=uuid4(),
+                title=f"Job {i}",
+                description="Test description",
+                budget=1000.0,
+                location="Test Location",
+                start_date=date.today() + timedelta(days=1),
+                end_date=date.today() + timedelta(days=7),
+            )
+            for i in range(3)
+        ]
+        mock_job_repository = MagicMock(spec=IJobRepository)
+        mock_job_repository.get_nearby.return_value = [
+            (jobs[0], 4.0),
+            (jobs[1], 9.0),
+            (jobs[2], 16.0),
+        ]
+
+        service = JobService(mock_job_repository)
+
+        # Act
+        page = service.get_nearby(-31.42, -64.18, 10, limit=2)
+
+        # Assert
+        assert page.items == [(jobs[0], 2.0), (jobs[1], 3.0)]
+        assert DistanceCursor.decode(page.next_cursor) == DistanceCursor(9.0, jobs[1].id)
+        mock_job_repository.get_nearby.assert_called_once_with(
+            -31.42, -64.18, 10, limit=3, cursor=None
+        )
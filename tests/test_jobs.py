@@ -3,7 +3,15 @@ from uuid import uuid4
 
 from fastapi import status
 
-from tests.utils import create_test_account, create_test_job, create_test_user, get_account_headers
+from app.domain.models.account import AccountType
+from tests.utils import (
+    create_test_account,
+    create_test_job,
+    create_test_user,
+    get_account_headers,
+    get_internal_headers,
+    get_query_count,
+)
 
 
 class TestCreateJob:
@@ -44,6 +52,46 @@ class TestCreateJob:
         assert "created_at" in data
         assert "updated_at" in data
 
+    def test_create_job_with_coordinates(self, client, db_session):
+        """Test creating a job with coordinates"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        job_data = {
+            "title": "Drone Photography Job",
+            "description": "Need aerial photography for real estate",
+            "budget": 1500.0,
+            "location": "Córdoba, Argentina",
+            "latitude": -31.4201,
+            "longitude": -64.1888,
+            "start_date": str(date.today() + timedelta(days=7)),
+            "end_date": str(date.today() + timedelta(days=14)),
+        }
+
+        response = client.post("/jobs/", json=job_data, headers=headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["latitude"] == job_data["latitude"]
+        assert data["longitude"] == job_data["longitude"]
+
+        # Test latitude without longitude
+        job_data.pop("longitude")
+        response = client.post("/jobs/", json=job_data, headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # Test latitude out of range
+        job_data.update(latitude=91, longitude=0)
+        response = client.post("/jobs/", json=job_data, headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
     def test_create_job_invalid_account_id(self, client, db_session):
         """Test creating a job with invalid account_id in header"""
         user = create_test_user(db_session)
@@ -329,6 +377,99 @@ class TestGetJob:
         assert data["description"] == job.description
         assert data["budget"] == job.budget
         assert data["account_id"] == str(job.account_id)
+        assert data["application_counts"]["pending"] == 0
+
+    def test_get_job_application_counts_follow_application_writes(self, client, db_session):
+        """Test that cached counts are refreshed by applications made and decided via the API"""
+        user = create_test_user(db_session)
+        employer = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        droner1 = create_test_account(
+            db_session, user.id, name="Droner 1", account_type=AccountType.DRONER
+        )
+        droner2 = create_test_account(
+            db_session, user.id, name="Droner 2", account_type=AccountType.DRONER
+        )
+        job = create_test_job(db_session, employer.id)
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, employer.id)
+
+        client.get(f"/jobs/{job.id}", headers=headers)
+        client.post(
+            f"/jobs/{job.id}/applications",
+            json={},
+            headers=get_account_headers(token, droner1.id),
+        )
+        second = client.post(
+            f"/jobs/{job.id}/applications",
+            json={},
+            headers=get_account_headers(token, droner2.id),
+        ).json()
+        client.get(f"/jobs/{job.id}", headers=headers)
+        client.post(
+            f"/jobs/{job.id}/applications:batch-update",
+            json={"updates": [{"application_id": second["id"], "status": "ACCEPTED"}]},
+            headers=headers,
+        )
+
+        response = client.get(f"/jobs/{job.id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["application_counts"] == {
+            "pending": 1,
+            "accepted": 1,
+            "rejected": 0,
+            "withdrawn": 0,
+        }
+
+    def test_get_job_served_without_queries_once_cached(self, client, db_session):
+        """Test that a cached job and its counts cost no database round trip"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        job = create_test_job(db_session, account.id)
+        token = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        ).json()["access_token"]
+        headers = get_account_headers(token, account.id)
+        client.get(f"/jobs/{job.id}", headers=headers)
+
+        response = client.get(f"/jobs/{job.id}", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert get_query_count(response) == 0
+
+    def test_get_job_served_from_cache_until_updated(self, client, db_session):
+        """Test that a cached job reflects an update made through the API"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        job = create_test_job(db_session, account.id, title="Original Title")
+
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        hits_before = client.get("/internal/job-cache", headers=get_internal_headers()).json()[
+            "hits"
+        ]
+        client.get(f"/jobs/{job.id}", headers=headers)
+        cached = client.get(f"/jobs/{job.id}", headers=headers)
+        assert cached.json()["title"] == "Original Title"
+        assert (
+            client.get("/internal/job-cache", headers=get_internal_headers()).json()["hits"]
+            > hits_before
+        )
+
+        client.put(f"/jobs/{job.id}", json={"title": "Updated Title"}, headers=headers)
+        response = client.get(f"/jobs/{job.id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "Updated Title"
 
     def test_get_job_not_found(self, client, db_session):
         """Test getting a non-existent job returns 404"""
@@ -422,6 +563,12 @@ class TestListJobs:
             assert "description" in job
             assert "budget" in job
             assert "account_id" in job
+            assert set(job["application_counts"]) == {
+                "pending",
+                "accepted",
+                "rejected",
+                "withdrawn",
+            }
 
     def test_list_jobs_pagination(self, client, db_session):
         """Test listing jobs with pagination and authentication"""
@@ -474,6 +621,50 @@ class TestListJobs:
         data = response.json()
         assert len(data) == 0  # Empty result
 
+    def test_list_jobs_cursor_pagination(self, client, db_session):
+        """Test walking the job list with the X-Next-Cursor header"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        for i in range(5):
+            create_test_job(db_session, account.id, title=f"Job {i}")
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(3):
+            response = client.get("/jobs/", params=params, headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            seen.extend(job["id"] for job in response.json())
+            params["cursor"] = response.headers.get("X-Next-Cursor")
+
+        # The third page is the last one
+        assert params["cursor"] is None
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_list_jobs_invalid_cursor(self, client, db_session):
+        """Test that a malformed cursor is rejected"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        response = client.get("/jobs/?cursor=not-a-cursor", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_list_jobs_empty(self, client, db_session):
         """Test listing jobs when no jobs exist with authentication"""
         user = create_test_user(db_session)
@@ -580,6 +771,137 @@ class TestListJobs:
         assert response.status_code == status.HTTP_200_OK
 
 
+class TestNearbyJobs:
+    """Tests for GET /jobs/nearby"""
+
+    def test_nearby_jobs_success(self, client, db_session):
+        """Test listing jobs near a location, nearest first, with cursor pagination"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        for title, latitude, longitude in [
+            ("Villa Carlos Paz survey", -31.4241, -64.4978),
+            ("Centro survey", -31.4201, -64.1888),
+            ("Rosario survey", -32.9442, -60.6505),
+        ]:
+            job_data = {
+                "title": title,
+                "description": "Aerial survey of the area",
+                "budget": 1500.0,
+                "location": title,
+                "latitude": latitude,
+                "longitude": longitude,
+                "start_date": str(date.today() + timedelta(days=7)),
+                "end_date": str(date.today() + timedelta(days=14)),
+            }
+            assert client.post("/jobs/", json=job_data, headers=headers).status_code == 201
+
+        params = {"lat": -31.42, "lon": -64.19, "radius_km": 50, "limit": 1}
+        response = client.get("/jobs/nearby", params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [job["title"] for job in data] == ["Centro survey"]
+        assert data[0]["distance_km"] < 1
+
+        params["cursor"] = response.headers["X-Next-Cursor"]
+        response = client.get("/jobs/nearby", params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [job["title"] for job in data] == ["Villa Carlos Paz survey"]
+        assert 25 < data[0]["distance_km"] < 35
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_nearby_jobs_validation(self, client, db_session):
+        """Test nearby parameter validation"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        # Test missing coordinates
+        response = client.get("/jobs/nearby", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+        # Test radius exceeding maximum (200)
+        response = client.get("/jobs/nearby?lat=0&lon=0&radius_km=201", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+        # Test malformed cursor
+        response = client.get("/jobs/nearby?lat=0&lon=0&cursor=oops", headers=headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestSearchJobs:
+    """Tests for GET /jobs/search"""
+
+    def test_search_jobs_success(self, client, db_session):
+        """Test searching jobs by keyword and location"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        create_test_job(db_session, account.id, title="Drone mapping", location="Córdoba")
+        create_test_job(db_session, account.id, title="Drone mapping", location="Rosario")
+        create_test_job(db_session, account.id, title="Warehouse inventory")
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        response = client.get("/jobs/search?q=mapping", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+        response = client.get("/jobs/search?q=mapping&location=C%C3%B3rdoba", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["title"] == "Drone mapping"
+        assert data[0]["location"] == "Córdoba"
+
+    def test_search_jobs_validation(self, client, db_session):
+        """Test search parameter validation"""
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        # Signin to get a token
+        signin_response = client.post(
+            "/auth/signin",
+            json={"email": user.email, "password": "testpassword123"},
+        )
+        token = signin_response.json()["access_token"]
+        headers = get_account_headers(token, account.id)
+
+        # Test missing keywords
+        response = client.get("/jobs/search", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+        # Test empty keywords
+        response = client.get("/jobs/search?q=", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+        # Test limit exceeding maximum (100)
+        response = client.get("/jobs/search?q=drone&limit=101", headers=headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
 class TestUpdateJob:
     """Tests for PUT /jobs/{job_id}"""
 
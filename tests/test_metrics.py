@@ -0,0 +1,138 @@
+import fakeredis
+import redis
+from fastapi import status
+from prometheus_client import REGISTRY
+
+from app.config.cache import InstrumentedRedis
+from app.domain.models.account import AccountType
+from tests.utils import (
+    create_test_account,
+    create_test_job,
+    create_test_user,
+    get_account_headers,
+)
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics endpoint"""
+
+    def test_exposes_prometheus_text(self, client):
+        """Test that the scrape returns every metric family in the text format"""
+        # Act
+        response = client.get("/metrics")
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain")
+        for name in (
+            "http_request_duration_seconds",
+            "http_requests_in_progress",
+            "db_pool_connections_checked_out",
+            "db_pool_checkout_wait_seconds",
+            "redis_command_duration_seconds",
+            "auth_principal_cache_lookups",
+        ):
+            assert f"# TYPE {name}" in response.text
+
+    def test_labels_requests_by_route_template(self, client, db_session):
+        """Test that requests for different jobs land in one series"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        jobs = [create_test_job(db_session, account.id) for _ in range(2)]
+        signin = client.post(
+            "/auth/signin", json={"email": user.email, "password": "testpassword123"}
+        )
+        headers = get_account_headers(signin.json()["access_token"], account.id)
+        labels = {"method": "GET", "route": "/jobs/{job_id}", "status": "200"}
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        # Act
+        for job in jobs:
+            client.get(f"/jobs/{job.id}", headers=headers)
+
+        # Assert
+        assert sample("http_request_duration_seconds_count", **labels) == before + 2
+        assert sample("http_requests_in_progress") == 0
+
+    def test_labels_unknown_paths_as_unmatched(self, client):
+        """Test that unrouted paths do not create a series each"""
+        # Arrange
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = sample("http_request_duration_seconds_count", **labels)
+
+        # Act
+        client.get("/does-not-exist/123")
+
+        # Assert
+        assert sample("http_request_duration_seconds_count", **labels) == before + 1
+
+    def test_counts_principal_cache_outcomes(self, client, db_session):
+        """Test that the first authenticated request misses the cache and the next hits"""
+        # Arrange
+        user = create_test_user(db_session)
+        signin = client.post(
+            "/auth/signin", json={"email": user.email, "password": "testpassword123"}
+        )
+        # Opened after signin, so the token's claims do not list it
+        account = create_test_account(db_session, user.id)
+        headers = get_account_headers(signin.json()["access_token"], account.id)
+        misses = sample("auth_principal_cache_lookups_total", outcome="miss")
+        hits = sample("auth_principal_cache_lookups_total", outcome="hit")
+
+        # Act
+        client.get("/jobs/", headers=headers)
+        client.get("/jobs/", headers=headers)
+
+        # Assert
+        assert sample("auth_principal_cache_lookups_total", outcome="miss") == misses + 1
+        assert sample("auth_principal_cache_lookups_total", outcome="hit") == hits + 1
+
+    def test_counts_claims_authorizations(self, client, db_session):
+        """Test that requests for an account listed in the token count as claims outcomes"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        signin = client.post(
+            "/auth/signin", json={"email": user.email, "password": "testpassword123"}
+        )
+        headers = get_account_headers(signin.json()["access_token"], account.id)
+        claims = sample("auth_principal_cache_lookups_total", outcome="claims")
+
+        # Act
+        client.get("/jobs/", headers=headers)
+
+        # Assert
+        assert sample("auth_principal_cache_lookups_total", outcome="claims") == claims + 1
+
+
+class TestInstrumentedRedis:
+    """Tests for InstrumentedRedis"""
+
+    def test_records_commands_and_pipelines(self):
+        """Test that single commands and pipelines are timed under their own label"""
+        # Arrange
+        pool = redis.ConnectionPool(
+            connection_class=fakeredis.FakeRedisConnection,
+            server=fakeredis.FakeServer(),
+            decode_responses=True,
+        )
+        cache = InstrumentedRedis(connection_pool=pool)
+        commands = sample("redis_command_duration_seconds_count", command="SET")
+        pipelines = sample("redis_command_duration_seconds_count", command="PIPELINE")
+
+        # Act
+        cache.set("key", "value")
+        pipe = cache.pipeline(transaction=False)
+        pipe.get("key")
+        pipe.ttl("key")
+        result = pipe.execute()
+
+        # Assert
+        assert result == ["value", -1]
+        assert sample("redis_command_duration_seconds_count", command="SET") == commands + 1
+        assert sample("redis_command_duration_seconds_count", command="PIPELINE") == pipelines + 1
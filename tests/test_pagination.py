@@ -0,0 +1,80 @@
+"""Tests for cursor pagination helpers."""
+
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, status
+
+from app.domain.models.job import Job
+from app.domain.pagination import Cursor, Page, parse_cursor
+
+
+def make_job(created_at: datetime) -> Job:
+    return Job(
+        id=uuid4(),
+        account_id=uuid4(),
+        title="Test Job",
+        description="Test description",
+        budget=1000.0,
+        location="Test Location",
+        start_date=created_at.date(),
+        end_date=created_at.date(),
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+class TestCursor:
+    """Tests for Cursor"""
+
+    def test_encode_decode_round_trip(self):
+        """Test that a cursor survives encoding as an opaque token"""
+        cursor = Cursor(created_at=datetime(2025, 11, 14, 11, 58, 21, 83223), id=uuid4())
+
+        token = cursor.encode()
+
+        assert "=" not in token
+        assert Cursor.decode(token) == cursor
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "WzFd", "WyJ4IiwieSJd"])
+    def test_decode_malformed_token(self, token):
+        """Test that malformed tokens are rejected with ValueError"""
+        with pytest.raises(ValueError):
+            Cursor.decode(token)
+
+    def test_parse_cursor_rejects_malformed_token(self):
+        """Test that a malformed client cursor is a 400"""
+        assert parse_cursor(None) is None
+
+        with pytest.raises(HTTPException) as exc_info:
+            parse_cursor("not-a-cursor")
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPage:
+    """Tests for Page.from_rows"""
+
+    def test_from_rows_last_page(self):
+        """Test that a short page has no next cursor"""
+        rows = [make_job(datetime(2025, 1, 1))]
+
+        page = Page.from_rows(rows, limit=2)
+
+        assert page.items == rows
+        assert page.next_cursor is None
+
+    def test_from_rows_trims_lookahead_row(self):
+        """Test that the look-ahead row is dropped and the cursor points at the last item"""
+        # Arrange
+        now = datetime(2025, 1, 1)
+        rows = [make_job(now - timedelta(minutes=i)) for i in range(3)]
+
+        # Act
+        page = Page.from_rows(rows, limit=2)
+
+        # Assert
+        assert page.items == rows[:2]
+        assert page.next_cursor is not None
+        assert Cursor.decode(page.next_cursor) == Cursor(rows[1].created_at, rows[1].id)
@@ -0,0 +1,207 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.domain.models.account import Account, AccountType
+from app.domain.models.session import UserSession
+from app.domain.models.user import User
+from app.domain.repositories.interfaces.principal import Principal
+from app.domain.repositories.principal import PrincipalRepository
+from tests.utils import create_test_token_payload
+
+
+def make_principal(user_id=None, session_id=None) -> Principal:
+    user_id = user_id or uuid4()
+    now = datetime.now(UTC)
+    return Principal(
+        session=UserSession(
+            id=session_id or uuid4(),
+            user_id=user_id,
+            host="127.0.0.1",
+            is_active=True,
+            expires_at=now + timedelta(hours=1),
+            created_at=now,
+            updated_at=now,
+        ),
+        user=User(
+            id=user_id,
+            email="principal@example.com",
+            hashed_password="secret-hash",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        ),
+        account=Account(
+            id=uuid4(),
+            user_id=user_id,
+            name="Principal Account",
+            account_type=AccountType.EMPLOYER,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        ),
+    )
+
+
+class TestPrincipalRepositoryLookup:
+    """Tests for PrincipalRepository.lookup"""
+
+    def test_lookup_miss(self, mock_cache):
+        """Test lookup when nothing is cached"""
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+
+        lookup = repository.lookup(create_test_token_payload(), uuid4(), uuid4())
+
+        assert lookup.revoked is False
+        assert lookup.principal is None
+
+    def test_lookup_hit_after_store(self, mock_cache):
+        """Test that a stored principal round-trips with typed fields"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        principal = make_principal()
+        repository.store(principal)
+
+        # Act
+        lookup = repository.lookup(
+            create_test_token_payload(principal.user.id, principal.session.id),
+            principal.session.id,
+            principal.account.id,
+        )
+
+        # Assert
+        assert lookup.revoked is False
+        assert lookup.principal is not None
+        assert lookup.principal.account.id == principal.account.id
+        assert lookup.principal.account.account_type == AccountType.EMPLOYER
+        assert lookup.principal.user.id == principal.user.id
+        assert lookup.principal.session.is_expired() is False
+
+    def test_store_never_caches_password_hash(self, mock_cache):
+        """Test that the password hash is not written to the cache"""
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        principal = make_principal()
+
+        repository.store(principal)
+
+        raw = mock_cache.hget(f"principal:{principal.session.id}", str(principal.account.id))
+        assert "secret-hash" not in raw
+        assert mock_cache.ttl(f"principal:{principal.session.id}") == 30
+
+    def test_lookup_blacklisted_token(self, mock_cache):
+        """Test that a blacklisted jti is reported as revoked"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        principal = make_principal()
+        repository.store(principal)
+        mock_cache.setex("blacklist:revoked-jti", 60, "1")
+
+        # Act
+        lookup = repository.lookup(
+            create_test_token_payload(principal.user.id, principal.session.id, jti="revoked-jti"),
+            principal.session.id,
+            principal.account.id,
+        )
+
+        # Assert
+        assert lookup.revoked is True
+        assert lookup.principal is None
+
+
+class TestPrincipalRepositoryInvalidate:
+    """Tests for PrincipalRepository invalidation"""
+
+    def test_invalidate_session(self, mock_cache):
+        """Test dropping the principals of one session"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        principal = make_principal()
+        repository.store(principal)
+
+        # Act
+        repository.invalidate_session(principal.session.id)
+
+        # Assert
+        lookup = repository.lookup(
+            create_test_token_payload(principal.user.id, principal.session.id),
+            principal.session.id,
+            principal.account.id,
+        )
+        assert lookup.principal is None
+
+    def test_invalidate_user_drops_every_session(self, mock_cache):
+        """Test dropping the principals of all of a user's sessions"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        user_id = uuid4()
+        first = make_principal(user_id=user_id)
+        second = make_principal(user_id=user_id)
+        other = make_principal()
+        for principal in (first, second, other):
+            repository.store(principal)
+
+        # Act
+        repository.invalidate_user(user_id)
+
+        # Assert
+        assert repository.lookup(None, first.session.id, first.account.id).principal is None
+        assert repository.lookup(None, second.session.id, second.account.id).principal is None
+        assert repository.lookup(None, other.session.id, other.account.id).principal is not None
+
+
+class TestPrincipalRepositoryVersion:
+    """Tests for the claims version of PrincipalRepository"""
+
+    def test_version_defaults_to_zero(self, mock_cache):
+        """Test that a user whose principals were never invalidated has version 0"""
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+
+        lookup = repository.lookup_version(create_test_token_payload(), uuid4())
+
+        assert lookup.revoked is False
+        assert lookup.version == 0
+
+    def test_invalidate_user_moves_version_on(self, mock_cache):
+        """Test that invalidating a user changes only that user's version, with the TTL"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30, version_ttl_seconds=900)
+        user_id = uuid4()
+        other_id = uuid4()
+
+        # Act
+        repository.invalidate_user(user_id)
+        first = repository.get_version(user_id)
+        repository.invalidate_user(user_id)
+
+        # Assert
+        assert first > 0
+        assert repository.get_version(user_id) > first
+        assert repository.get_version(other_id) == 0
+        assert 0 < mock_cache.ttl(f"principal:version:{user_id}") <= 900
+
+    def test_lookup_version_blacklisted_token(self, mock_cache):
+        """Test that the version lookup also reports a blacklisted token"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        mock_cache.setex("blacklist:revoked-jti", 60, "1")
+
+        # Act
+        lookup = repository.lookup_version(create_test_token_payload(jti="revoked-jti"), uuid4())
+
+        # Assert
+        assert lookup.revoked is True
+
+    def test_lookup_token_of_revoked_user(self, mock_cache):
+        """Test that tokens issued before the user's revocation epoch are revoked"""
+        # Arrange
+        repository = PrincipalRepository(mock_cache, ttl_seconds=30)
+        principal = make_principal()
+        repository.store(principal)
+        token = create_test_token_payload(principal.user.id, principal.session.id)
+        mock_cache.set(f"revoked:user:{principal.user.id}", token.issued_at + 1)
+
+        # Act
+        lookup = repository.lookup(token, principal.session.id, principal.account.id)
+
+        # Assert
+        assert lookup.revoked is True
+        assert lookup.principal is None
@@ -0,0 +1,166 @@
+import logging
+
+from fastapi import status
+
+from app.config import query_stats
+from app.config.query_stats import SERVER_TIMING_HEADER
+from app.domain.models.account import AccountType
+from tests.utils import (
+    assert_max_queries,
+    create_test_account,
+    create_test_application,
+    create_test_favorite,
+    create_test_job,
+    create_test_user,
+    get_account_headers,
+    get_internal_headers,
+    get_query_count,
+)
+
+
+def signin(client, email: str, account_id) -> dict:
+    response = client.post("/auth/signin", json={"email": email, "password": "testpassword123"})
+    return get_account_headers(response.json()["access_token"], account_id)
+
+
+class TestQueryStatsMiddleware:
+    """Tests for QueryStatsMiddleware"""
+
+    def test_reports_statement_count_and_time(self, client, db_session):
+        """Test that every response carries the request's database timing"""
+        # Arrange
+        user = create_test_user(db_session)
+
+        # Act
+        response = client.post(
+            "/auth/signin", json={"email": user.email, "password": "testpassword123"}
+        )
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers[SERVER_TIMING_HEADER].startswith("db;dur=")
+        assert get_query_count(response) >= 1
+
+    def test_reports_zero_for_requests_without_queries(self, client):
+        """Test that a request without statements reports none"""
+        # Act
+        response = client.get("/internal/job-cache", headers=get_internal_headers())
+
+        # Assert
+        assert get_query_count(response) == 0
+
+    def test_logs_slow_queries_with_their_route(self, client, db_session, monkeypatch, caplog):
+        """Test that statements over the threshold are logged with the route template"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        job = create_test_job(db_session, account.id)
+        headers = signin(client, user.email, account.id)
+        monkeypatch.setattr(query_stats.settings, "db_slow_query_ms", 0)
+
+        # Act
+        with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+            client.get(f"/jobs/{job.id}", headers=headers)
+
+        # Assert
+        assert any("GET /jobs/{job_id}" in record.getMessage() for record in caplog.records)
+
+
+class TestQueryBudgets:
+    """Maximum statements per request of the hot endpoints, to catch N+1 regressions"""
+
+    def test_list_jobs(self, client, db_session):
+        """Test that listing jobs costs the same for any page size"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        for _ in range(5):
+            create_test_job(db_session, account.id)
+        account_id = account.id
+        headers = signin(client, user.email, account_id)
+        db_session.expunge_all()
+
+        # Act
+        response = client.get("/jobs/", headers=headers)
+
+        # Assert: the jobs and their application counts; the token's claims authorize
+        assert response.status_code == status.HTTP_200_OK
+        assert_max_queries(response, 2)
+
+    def test_accept_application(self, client, db_session):
+        """Test the statements of accepting an application"""
+        # Arrange
+        employer_user = create_test_user(db_session, email="budget-employer@test.com")
+        employer = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        droner_user = create_test_user(db_session, email="budget-droner@test.com")
+        droner = create_test_account(db_session, droner_user.id, account_type=AccountType.DRONER)
+        job = create_test_job(db_session, employer.id)
+        application_id = create_test_application(db_session, job.id, droner.id).id
+        headers = signin(client, employer_user.email, employer.id)
+        db_session.expunge_all()
+
+        # Act
+        response = client.post(f"/applications/{application_id}/accept", headers=headers)
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert_max_queries(response, 5)
+
+    def test_list_applications_with_jobs(self, client, db_session):
+        """Test that embedding jobs does not load them one by one"""
+        # Arrange
+        employer_user = create_test_user(db_session, email="budget-employer2@test.com")
+        employer = create_test_account(
+            db_session, employer_user.id, account_type=AccountType.EMPLOYER
+        )
+        droner_user = create_test_user(db_session, email="budget-droner2@test.com")
+        droner = create_test_account(db_session, droner_user.id, account_type=AccountType.DRONER)
+        for _ in range(5):
+            create_test_application(
+                db_session, create_test_job(db_session, employer.id).id, droner.id
+            )
+        headers = signin(client, droner_user.email, droner.id)
+        db_session.expunge_all()
+
+        # Act
+        response = client.get("/applications/", params={"include_job": "true"}, headers=headers)
+
+        # Assert
+        assert len(response.json()) == 5
+        assert_max_queries(response, 2)
+
+    def test_list_favorites_with_jobs(self, client, db_session):
+        """Test that embedding jobs in favorites does not load them one by one"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        for _ in range(5):
+            create_test_favorite(db_session, account.id, create_test_job(db_session, account.id).id)
+        headers = signin(client, user.email, account.id)
+        db_session.expunge_all()
+
+        # Act
+        response = client.get("/jobs/favorites/", params={"include_job": "true"}, headers=headers)
+
+        # Assert
+        assert len(response.json()) == 5
+        assert_max_queries(response, 1)
+
+    def test_refresh(self, client, db_session):
+        """Test that refreshing reads the session without writing it"""
+        # Arrange
+        user = create_test_user(db_session)
+        create_test_account(db_session, user.id, account_type=AccountType.EMPLOYER)
+        refresh_token = client.post(
+            "/auth/signin", json={"email": user.email, "password": "testpassword123"}
+        ).json()["refresh_token"]
+        db_session.expunge_all()
+
+        # Act
+        response = client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+        # Assert: the session and the accounts for the token's claims; the expiry is deferred
+        assert response.status_code == status.HTTP_200_OK
+        assert_max_queries(response, 2)
@@ -0,0 +1,133 @@
+from datetime import UTC, datetime, timedelta
+
+from app.config.revocation import BLACKLIST_PREFIX, EPOCH_CHANNEL, SESSION_EPOCH_PREFIX
+from app.domain.repositories.interfaces.auth import JwtTokenType
+from app.domain.repositories.interfaces.refresh import RotationResult
+from app.domain.repositories.refresh import RefreshTokenRepository
+from tests.utils import create_test_token_payload
+
+
+def in_one_day() -> datetime:
+    return (datetime.now(UTC) + timedelta(days=1)).replace(microsecond=0)
+
+
+class TestRefreshTokenRepositoryRotate:
+    """Tests for RefreshTokenRepository.rotate"""
+
+    def test_rotate_records_successor_and_pending_expiry(self, mock_cache):
+        """Test that the first use rotates and defers the session expiry"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        token = create_test_token_payload(token_type=JwtTokenType.REFRESH)
+        expires_at = in_one_day()
+
+        # Act
+        result = repository.rotate(token, "next-jti", expires_at)
+
+        # Assert
+        assert result is RotationResult.ROTATED
+        assert mock_cache.get(f"refresh:{token.sid}") == "next-jti"
+        assert repository.get_pending_expiry(token.sid) == expires_at
+
+    def test_rotate_successor_token(self, mock_cache):
+        """Test that the successor rotates in turn"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        token = create_test_token_payload(token_type=JwtTokenType.REFRESH)
+        repository.rotate(token, "next-jti", in_one_day())
+
+        # Act
+        result = repository.rotate(
+            create_test_token_payload(
+                session_id=token.sid, token_type=JwtTokenType.REFRESH, jti="next-jti"
+            ),
+            "third-jti",
+            in_one_day(),
+        )
+
+        # Assert
+        assert result is RotationResult.ROTATED
+
+    def test_reuse_revokes_the_session(self, mock_cache):
+        """Test that spending a token twice revokes its session and announces the epoch"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        token = create_test_token_payload(token_type=JwtTokenType.REFRESH)
+        repository.rotate(token, "next-jti", in_one_day())
+        pubsub = mock_cache.pubsub()
+        pubsub.subscribe(EPOCH_CHANNEL)
+        pubsub.get_message(timeout=1)
+
+        # Act
+        result = repository.rotate(token, "stolen-jti", in_one_day(), revocation_ttl_seconds=60)
+
+        # Assert
+        assert result is RotationResult.REUSED
+        epoch_key = f"{SESSION_EPOCH_PREFIX}{token.sid}"
+        assert float(mock_cache.get(epoch_key)) >= token.issued_at
+        assert 0 < mock_cache.ttl(epoch_key) <= 60
+        assert pubsub.get_message(timeout=1)["data"].startswith(f"{epoch_key}:")
+        # Neither the successor nor the thief's token can rotate any more
+        successor = create_test_token_payload(
+            session_id=token.sid, token_type=JwtTokenType.REFRESH, jti="next-jti"
+        )
+        assert repository.rotate(successor, "jti-4", in_one_day()) is not RotationResult.ROTATED
+
+    def test_blacklisted_token_counts_as_reused(self, mock_cache):
+        """Test that a token spent before rotation was tracked is still detected"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        token = create_test_token_payload(token_type=JwtTokenType.REFRESH)
+        mock_cache.set(f"{BLACKLIST_PREFIX}{token.jti}", "1")
+
+        # Act
+        result = repository.rotate(token, "next-jti", in_one_day())
+
+        # Assert
+        assert result is RotationResult.REUSED
+
+    def test_token_issued_before_the_epoch_is_revoked(self, mock_cache):
+        """Test that a signed-out session cannot rotate, without counting as reuse"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        token = create_test_token_payload(
+            token_type=JwtTokenType.REFRESH, iat=datetime.now(UTC).timestamp() - 10
+        )
+        mock_cache.set(f"{SESSION_EPOCH_PREFIX}{token.sid}", datetime.now(UTC).timestamp())
+
+        # Act
+        result = repository.rotate(token, "next-jti", in_one_day())
+
+        # Assert
+        assert result is RotationResult.REVOKED
+        assert mock_cache.get(f"refresh:{token.sid}") is None
+
+
+class TestRefreshTokenRepositoryPendingExpiries:
+    """Tests for the deferred session expiries of RefreshTokenRepository"""
+
+    def test_clear_keeps_expiries_replaced_by_a_later_rotation(self, mock_cache):
+        """Test that clearing only drops the expiries that were written"""
+        # Arrange
+        repository = RefreshTokenRepository(mock_cache)
+        first, second = (
+            create_test_token_payload(token_type=JwtTokenType.REFRESH),
+            create_test_token_payload(token_type=JwtTokenType.REFRESH),
+        )
+        repository.rotate(first, "a", in_one_day())
+        repository.rotate(second, "b", in_one_day())
+        written = repository.get_pending_expiries()
+        later = in_one_day() + timedelta(hours=1)
+        repository.rotate(
+            create_test_token_payload(
+                session_id=second.sid, token_type=JwtTokenType.REFRESH, jti="b"
+            ),
+            "c",
+            later,
+        )
+
+        # Act
+        repository.clear_pending_expiries(written)
+
+        # Assert
+        assert repository.get_pending_expiries() == {second.sid: later}
@@ -0,0 +1,208 @@
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.config.revocation import BLACKLIST_CHANNEL, EPOCH_CHANNEL, RevocationList
+from app.services.auth import AuthService
+from tests.utils import create_test_token_payload
+
+
+def wait_until(condition, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def revocation_list(mock_cache):
+    revocations = RevocationList(
+        mock_cache, max_staleness_seconds=5, max_entries=100, poll_seconds=0.05
+    )
+    yield revocations
+    revocations.stop()
+
+
+class TestRevocationList:
+    """Tests for RevocationList"""
+
+    def test_unsynced_list_defers_to_redis(self, revocation_list):
+        """Test that a list whose listener is not running cannot answer"""
+        assert revocation_list.is_synced() is False
+        assert revocation_list.is_revoked("jti") is None
+        assert revocation_list.stats()["fallbacks"] == 1
+
+    def test_start_loads_existing_blacklist(self, mock_cache, revocation_list):
+        """Test that tokens blacklisted before the listener started are known"""
+        # Arrange
+        mock_cache.setex("blacklist:revoked-jti", 60, "1")
+
+        # Act
+        revocation_list.start()
+
+        # Assert
+        assert wait_until(revocation_list.is_synced)
+        assert revocation_list.is_revoked("revoked-jti") is True
+        assert revocation_list.is_revoked("valid-jti") is False
+
+    def test_published_revocation_propagates(self, mock_cache, revocation_list):
+        """Test that a revocation announced by another worker is applied"""
+        # Arrange
+        revocation_list.start()
+        assert wait_until(revocation_list.is_synced)
+
+        # Act
+        mock_cache.publish(BLACKLIST_CHANNEL, f"other-worker-jti:{time.time() + 60}")
+
+        # Assert
+        assert wait_until(lambda: revocation_list.is_revoked("other-worker-jti"))
+
+    def test_start_loads_existing_epochs(self, mock_cache, revocation_list):
+        """Test that sessions revoked before the listener started are known"""
+        # Arrange
+        session_id, user_id = uuid4(), uuid4()
+        revoked_at = time.time()
+        mock_cache.set(f"revoked:session:{session_id}", revoked_at, ex=60)
+
+        # Act
+        revocation_list.start()
+
+        # Assert
+        assert wait_until(revocation_list.is_synced)
+        assert revocation_list.is_revoked("jti", session_id, user_id, revoked_at - 1) is True
+        assert revocation_list.is_revoked("jti", session_id, user_id, revoked_at + 1) is False
+        assert revocation_list.is_revoked("jti", uuid4(), user_id, revoked_at - 1) is False
+
+    def test_published_epoch_propagates(self, mock_cache, revocation_list):
+        """Test that a user revoked by another worker is applied"""
+        # Arrange
+        session_id, user_id = uuid4(), uuid4()
+        revocation_list.start()
+        assert wait_until(revocation_list.is_synced)
+        revoked_at = time.time()
+
+        # Act
+        mock_cache.publish(EPOCH_CHANNEL, f"revoked:user:{user_id}:{revoked_at}:{revoked_at + 60}")
+
+        # Assert
+        assert wait_until(
+            lambda: revocation_list.is_revoked("jti", session_id, user_id, revoked_at - 1)
+        )
+
+    def test_expired_revocation_is_ignored(self, revocation_list):
+        """Test that a token past its expiry is not reported as revoked"""
+        revocation_list.add("expired-jti", time.time() - 1)
+        revocation_list.start()
+        assert wait_until(revocation_list.is_synced)
+
+        assert revocation_list.is_revoked("expired-jti") is False
+
+    def test_stop_falls_back_to_redis(self, revocation_list):
+        """Test that a stopped listener sends callers back to Redis"""
+        revocation_list.start()
+        assert wait_until(revocation_list.is_synced)
+
+        revocation_list.stop()
+
+        assert revocation_list.is_revoked("jti") is None
+
+    def test_overflow_falls_back_to_redis(self, mock_cache):
+        """Test that a full list is discarded rather than missing revocations"""
+        # Arrange
+        revocations = RevocationList(
+            mock_cache, max_staleness_seconds=5, max_entries=2, poll_seconds=1
+        )
+        revocations.start()
+        assert wait_until(revocations.is_synced)
+
+        # Act
+        for i in range(3):
+            revocations.add(f"jti-{i}", time.time() + 60)
+
+        # Assert
+        assert revocations.is_revoked("jti-0") is None
+        revocations.stop()
+
+
+class TestAuthServiceLocalBlacklist:
+    """Tests for AuthService with a local revocation list"""
+
+    def _service(self, mock_cache, revocation_list) -> AuthService:
+        return AuthService(
+            mock_cache, MagicMock(), MagicMock(), MagicMock(), MagicMock(), None, revocation_list
+        )
+
+    def test_synced_list_skips_redis(self):
+        """Test that a non-revoked token is checked without a Redis call"""
+        mock_cache = MagicMock()
+        revocation_list = MagicMock(spec=RevocationList)
+        revocation_list.is_revoked.return_value = False
+
+        self._service(mock_cache, revocation_list)._check_token_revoked(create_test_token_payload())
+
+        mock_cache.mget.assert_not_called()
+
+    def test_unsynced_list_asks_redis(self):
+        """Test that Redis is asked when the local list cannot answer"""
+        mock_cache = MagicMock()
+        mock_cache.mget.return_value = [None, None, None]
+        revocation_list = MagicMock(spec=RevocationList)
+        revocation_list.is_revoked.return_value = None
+
+        self._service(mock_cache, revocation_list)._check_token_revoked(create_test_token_payload())
+
+        mock_cache.mget.assert_called_once()
+
+    def test_blacklist_token_announces_revocation(self, mock_cache):
+        """Test that blacklisting publishes the jti and records it locally"""
+        # Arrange
+        revocation_list = MagicMock(spec=RevocationList)
+        subscriber = mock_cache.pubsub(ignore_subscribe_messages=True)
+        subscriber.subscribe(BLACKLIST_CHANNEL)
+        exp = int(time.time()) + 60
+
+        # Act
+        self._service(mock_cache, revocation_list)._blacklist_token("jti", exp)
+
+        # Assert
+        assert mock_cache.get("blacklist:jti") == "1"
+        messages = []
+        assert wait_until(lambda: messages.append(subscriber.get_message()) or messages[-1])
+        assert messages[-1]["data"] == f"jti:{exp}"
+        revocation_list.add.assert_called_once_with("jti", exp)
+
+    def test_signout_announces_session_epoch(self, mock_cache):
+        """Test that signing out publishes the session's epoch and records it locally"""
+        # Arrange
+        revocation_list = MagicMock(spec=RevocationList)
+        subscriber = mock_cache.pubsub(ignore_subscribe_messages=True)
+        subscriber.subscribe(EPOCH_CHANNEL)
+        payload = create_test_token_payload()
+        auth_repository = MagicMock()
+        auth_repository.decode_token.return_value = payload.model_dump(mode="json")
+        service = AuthService(
+            mock_cache,
+            auth_repository,
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            None,
+            revocation_list,
+            revocation_ttl_seconds=60,
+        )
+
+        # Act
+        service.signout("token")
+
+        # Assert
+        key = f"revoked:session:{payload.sid}"
+        assert float(mock_cache.get(key)) > payload.issued_at
+        assert 0 < mock_cache.ttl(key) <= 60
+        messages = []
+        assert wait_until(lambda: messages.append(subscriber.get_message()) or messages[-1])
+        assert messages[-1]["data"].startswith(f"{key}:")
+        revocation_list.add_epoch.assert_called_once()
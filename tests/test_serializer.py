@@ -0,0 +1,97 @@
+from datetime import UTC, date, datetime
+from uuid import uuid4
+
+import orjson
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.domain.models.account import Account, AccountType
+from app.domain.models.job import Job
+from app.dto.account import account_serializer
+from app.dto.job import JobResponseDto, job_serializer
+from app.dto.serializer import ResponseSerializer
+
+
+def make_job(**overrides) -> Job:
+    now = datetime.now(UTC)
+    fields = {
+        "id": uuid4(),
+        "account_id": uuid4(),
+        "title": "Serialized Job",
+        "description": "Aerial survey",
+        "budget": 1250.5,
+        "location": "Rosario",
+        "latitude": -32.95,
+        "longitude": -60.66,
+        "geohash": "6g7q8r9s0t1u",
+        "start_date": date(2099, 1, 1),
+        "end_date": date(2099, 1, 31),
+        "created_at": now,
+        "updated_at": now,
+    }
+    return Job(**(fields | overrides))
+
+
+class TestResponseSerializer:
+    """Tests for ResponseSerializer"""
+
+    def test_to_dict_picks_response_fields_only(self):
+        """Test that only the fields of the response model are emitted"""
+        job = make_job()
+
+        data = job_serializer.to_dict(job)
+
+        assert tuple(data) == tuple(JobResponseDto.model_fields)
+        assert "geohash" not in data
+
+    def test_to_dict_with_a_single_field(self):
+        """Test that a one-field model is emitted as that field, not its characters"""
+
+        class TitleOnly(BaseModel):
+            title: str
+
+        data = ResponseSerializer(TitleOnly).to_dict(make_job())
+
+        assert data == {"title": "Serialized Job"}
+
+    def test_output_matches_encoder_path(self):
+        """Test that the bytes match the jsonable_encoder rendering of the same fields"""
+        # Arrange
+        jobs = [make_job(), make_job(latitude=None, longitude=None)]
+        expected = jsonable_encoder(
+            [{field: getattr(job, field) for field in JobResponseDto.model_fields} for job in jobs]
+        )
+
+        # Act
+        response = job_serializer.list_response(jobs)
+
+        # Assert
+        assert orjson.loads(response.body) == expected
+        assert response.media_type == "application/json"
+
+    def test_enums_serialize_to_values(self):
+        """Test that enum fields are written as their values"""
+        now = datetime.now(UTC)
+        account = Account(
+            id=uuid4(),
+            user_id=uuid4(),
+            name="Employer",
+            account_type=AccountType.EMPLOYER,
+            created_at=now,
+            updated_at=now,
+        )
+
+        response = account_serializer.response(account, status_code=status.HTTP_201_CREATED)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert orjson.loads(response.body)["account_type"] == "EMPLOYER"
+
+    def test_list_response_headers(self):
+        """Test that headers are passed through to the response"""
+        serializer = ResponseSerializer(JobResponseDto)
+
+        response = serializer.list_response([], headers={"X-Next-Cursor": "abc"})
+
+        assert response.body == b"[]"
+        assert response.headers["X-Next-Cursor"] == "abc"
@@ -0,0 +1,94 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlmodel import select
+
+from app.config.reaper import REAPER_LOCK_KEY, SessionReaper
+from app.domain.models.session import UserSession
+from app.domain.repositories.refresh import PENDING_EXPIRIES_KEY
+from tests.conftest import test_engine
+from tests.utils import create_test_session, create_test_user
+
+
+@pytest.fixture
+def reaper(mock_cache):
+    return SessionReaper(test_engine, mock_cache, interval_seconds=60, batch_size=2)
+
+
+def create_expired_sessions(db_session, count: int) -> None:
+    user = create_test_user(db_session)
+    for minutes in range(1, count + 1):
+        create_test_session(
+            db_session,
+            user.id,
+            expires_at=datetime.now(UTC) - timedelta(minutes=minutes),
+        )
+
+
+class TestSessionReaper:
+    """Tests for SessionReaper"""
+
+    def test_run_once_deactivates_every_expired_session_in_batches(self, db_session, reaper):
+        """Test that a run keeps reaping batches until none are left"""
+        # Arrange
+        create_expired_sessions(db_session, 5)
+
+        # Act
+        deactivated = reaper.run_once()
+
+        # Assert
+        assert deactivated == 5
+        assert db_session.exec(select(UserSession).where(UserSession.is_active)).all() == []
+        stats = reaper.stats()
+        assert stats["runs"] == 1
+        assert stats["deactivated_total"] == 5
+        assert stats["last_deactivated"] == 5
+        assert stats["last_run_at"] is not None
+
+    def test_run_once_writes_pending_expiries_before_reaping(self, db_session, reaper, mock_cache):
+        """Test that a session refreshed since its expiry was written is extended, not reaped"""
+        # Arrange
+        user = create_test_user(db_session)
+        session = create_test_session(
+            db_session, user.id, expires_at=datetime.now(UTC) - timedelta(minutes=1)
+        )
+        session_id = session.id
+        expires_at = (datetime.now(UTC) + timedelta(days=1)).replace(microsecond=0)
+        mock_cache.hset(PENDING_EXPIRIES_KEY, str(session_id), int(expires_at.timestamp()))
+
+        # Act
+        deactivated = reaper.run_once()
+
+        # Assert
+        assert deactivated == 0
+        db_session.expire_all()
+        refreshed = db_session.get(UserSession, session_id)
+        assert refreshed.is_active
+        assert refreshed.expires_at.replace(tzinfo=UTC) == expires_at
+        assert mock_cache.hlen(PENDING_EXPIRIES_KEY) == 0
+        assert reaper.stats()["expiries_updated_total"] == 1
+
+    def test_run_once_takes_the_lock_for_one_interval(self, db_session, reaper, mock_cache):
+        """Test that the run leaves the lock to expire after one interval"""
+        # Act
+        reaper.run_once()
+
+        # Assert
+        assert 0 < mock_cache.ttl(REAPER_LOCK_KEY) <= 60
+
+    def test_run_once_skips_while_another_worker_holds_the_lock(
+        self, db_session, reaper, mock_cache
+    ):
+        """Test that only one worker reaps per interval"""
+        # Arrange
+        create_expired_sessions(db_session, 1)
+        mock_cache.set(REAPER_LOCK_KEY, "1", ex=60)
+
+        # Act
+        deactivated = reaper.run_once()
+
+        # Assert
+        assert deactivated is None
+        assert len(db_session.exec(select(UserSession).where(UserSession.is_active)).all()) == 1
+        assert reaper.stats()["skipped"] == 1
+        assert reaper.stats()["runs"] == 0
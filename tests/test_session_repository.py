@@ -1,10 +1,11 @@
 from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
 from sqlmodel import select
 
 from app.domain.models.session import UserSession
 from app.domain.repositories.session import SessionRepository
-from tests.utils import create_test_session, create_test_user
+from tests.utils import create_test_account, create_test_session, create_test_user
 
 
 class TestSessionRepositoryDeactivateExpiredSessions:
@@ -225,3 +226,127 @@ class TestSessionRepositoryDeactivateExpiredSessions:
         # Verify the active session is still active (commit wasn't called unnecessarily)
         db_session.refresh(active_session)
         assert active_session.is_active is True
+
+    def test_deactivate_expired_sessions_respects_batch_size(self, db_session):
+        """Test that a batch deactivates at most batch_size sessions"""
+        # Arrange
+        user = create_test_user(db_session)
+        for hours in range(1, 4):
+            create_test_session(
+                db_session,
+                user.id,
+                expires_at=datetime.now(UTC) - timedelta(hours=hours),
+                is_active=True,
+            )
+
+        repository = SessionRepository(db_session)
+
+        # Act
+        first_batch = repository.deactivate_expired_sessions(batch_size=2)
+        second_batch = repository.deactivate_expired_sessions(batch_size=2)
+
+        # Assert
+        assert first_batch == 2
+        assert second_batch == 1
+        statement = select(UserSession).where(UserSession.is_active)
+        assert db_session.exec(statement).all() == []
+
+
+class TestSessionRepositoryGetPrincipal:
+    """Tests for SessionRepository.get_principal"""
+
+    def test_get_principal_returns_session_user_and_account(self, db_session):
+        """Test loading session, user and account in one query"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+        user_session = create_test_session(db_session, user.id)
+
+        repository = SessionRepository(db_session)
+
+        # Act
+        row = repository.get_principal(user_session.id, account.id)
+
+        # Assert
+        assert row is not None
+        session, loaded_user, loaded_account = row
+        assert session.id == user_session.id
+        assert loaded_user.id == user.id
+        assert loaded_account is not None
+        assert loaded_account.id == account.id
+
+    def test_get_principal_unknown_account(self, db_session):
+        """Test that a missing account still returns the session and user"""
+        # Arrange
+        user = create_test_user(db_session)
+        user_session = create_test_session(db_session, user.id)
+
+        repository = SessionRepository(db_session)
+
+        # Act
+        row = repository.get_principal(user_session.id, uuid4())
+
+        # Assert
+        assert row is not None
+        assert row[2] is None
+
+    def test_get_principal_unknown_session(self, db_session):
+        """Test that an unknown session returns None"""
+        # Arrange
+        user = create_test_user(db_session)
+        account = create_test_account(db_session, user.id)
+
+        repository = SessionRepository(db_session)
+
+        # Act & Assert
+        assert repository.get_principal(uuid4(), account.id) is None
+
+
+class TestSessionRepositoryDeactivateAllByUserId:
+    """Tests for SessionRepository.deactivate_all_by_user_id"""
+
+    def test_deactivates_only_the_users_active_sessions(self, db_session):
+        """Test that one UPDATE deactivates every active session of the user and no other"""
+        # Arrange
+        user = create_test_user(db_session)
+        other = create_test_user(db_session, email="other-sessions@test.com")
+        expires_at = datetime.now(UTC) + timedelta(hours=1)
+        for _ in range(3):
+            create_test_session(db_session, user.id, expires_at=expires_at, is_active=True)
+        create_test_session(db_session, user.id, expires_at=expires_at, is_active=False)
+        other_session = create_test_session(
+            db_session, other.id, expires_at=expires_at, is_active=True
+        )
+        repository = SessionRepository(db_session)
+
+        # Act
+        count = repository.deactivate_all_by_user_id(user.id)
+
+        # Assert
+        assert count == 3
+        assert repository.get_all_by_user_id(user.id) == []
+        assert repository.get_by_id(other_session.id).is_active is True
+
+
+class TestSessionRepositoryUpdateExpiries:
+    """Tests for SessionRepository.update_expiries"""
+
+    def test_updates_the_expiry_of_every_given_session(self, db_session):
+        """Test that the expiries are written and other sessions are left alone"""
+        # Arrange
+        user = create_test_user(db_session)
+        first = create_test_session(db_session, user.id)
+        second = create_test_session(db_session, user.id)
+        untouched = create_test_session(db_session, user.id)
+        original = untouched.expires_at
+        new_expiry = (datetime.now(UTC) + timedelta(days=2)).replace(microsecond=0)
+        repository = SessionRepository(db_session)
+
+        # Act
+        repository.update_expiries({first.id: new_expiry, second.id: new_expiry})
+
+        # Assert
+        db_session.expire_all()
+        for session in (first, second):
+            assert repository.get_by_id(session.id).expires_at.replace(tzinfo=UTC) == new_expiry
+        assert repository.get_by_id(untouched.id).expires_at == original
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import HTTPException, status
+
+from app.config.throttle import LoginThrottle
+
+
+def make_throttle(mock_cache, ip_capacity: int = 10, email_capacity: int = 3) -> LoginThrottle:
+    return LoginThrottle(
+        mock_cache,
+        ip_capacity=ip_capacity,
+        ip_per_minute=60,
+        email_capacity=email_capacity,
+        email_per_minute=6,
+    )
+
+
+class TestLoginThrottle:
+    """Tests for LoginThrottle"""
+
+    def test_allows_up_to_capacity_per_email(self, mock_cache):
+        """Test that an email gets its burst and is then rejected with Retry-After"""
+        # Arrange
+        throttle = make_throttle(mock_cache)
+        for _ in range(3):
+            throttle.check("10.0.0.1", "user@example.com")
+
+        # Act & Assert
+        with pytest.raises(HTTPException) as exc_info:
+            throttle.check("10.0.0.2", "USER@example.com")
+
+        assert exc_info.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        # One attempt refills every 10 seconds
+        assert 1 <= int(exc_info.value.headers["Retry-After"]) <= 10
+
+    def test_limits_each_ip_across_emails(self, mock_cache):
+        """Test that one address cannot spread attempts over many emails"""
+        # Arrange
+        throttle = make_throttle(mock_cache, ip_capacity=2)
+        throttle.check("10.0.0.1", "a@example.com")
+        throttle.check("10.0.0.1", "b@example.com")
+
+        # Act & Assert
+        with pytest.raises(HTTPException):
+            throttle.check("10.0.0.1", "c@example.com")
+        throttle.check("10.0.0.2", "c@example.com")
+
+    def test_rejected_attempts_take_no_token(self, mock_cache):
+        """Test that an attempt rejected by one bucket leaves the other untouched"""
+        # Arrange
+        throttle = make_throttle(mock_cache, email_capacity=1)
+        throttle.check("10.0.0.1", "a@example.com")
+        for _ in range(5):
+            with pytest.raises(HTTPException):
+                throttle.check("10.0.0.1", "a@example.com")
+
+        # Act
+        tokens = float(mock_cache.hget("throttle:signin:ip:10.0.0.1", "tokens"))
+
+        # Assert
+        assert tokens >= 9
+
+    def test_buckets_expire_once_full(self, mock_cache):
+        """Test that idle buckets do not linger in Redis"""
+        # Act
+        make_throttle(mock_cache).check("10.0.0.1", "a@example.com")
+
+        # Assert
+        assert 0 < mock_cache.pttl("throttle:signin:ip:10.0.0.1") <= 10_000
+        assert 0 < mock_cache.pttl("throttle:signin:email:a@example.com") <= 30_000
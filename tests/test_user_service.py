@@ -7,6 +7,7 @@ from fastapi import HTTPException, status
 
 from app.domain.models.session import UserSession
 from app.domain.models.user import User
+from app.domain.repositories.interfaces.principal import IPrincipalRepository
 from app.domain.repositories.interfaces.session import ISessionRepository
 from app.domain.repositories.interfaces.user import IUserRepository
 from app.services.user import UserService
@@ -154,6 +155,36 @@ class TestUserServiceUpdateUser:
         mock_user_repository.get_by_id.assert_called_once_with(user_id)
         mock_user_repository.update.assert_called_once()
 
+    def test_update_user_deactivation_invalidates_principals(self):
+        """Test that deactivating a user drops its cached principals"""
+        # Arrange
+        user_id = uuid4()
+        mock_user = User(
+            id=user_id,
+            email="user@example.com",
+            hashed_password="hashed",
+            is_active=True,
+            created_at=datetime(2023, 1, 1, tzinfo=UTC),
+            updated_at=datetime(2023, 1, 1, tzinfo=UTC),
+        )
+
+        mock_user_repository = MagicMock(spec=IUserRepository)
+        mock_user_repository.get_by_id.return_value = mock_user
+        mock_user_repository.update.return_value = mock_user
+        mock_session_repository = MagicMock(spec=ISessionRepository)
+        mock_principal_repository = MagicMock(spec=IPrincipalRepository)
+
+        service = UserService(
+            mock_user_repository, mock_session_repository, mock_principal_repository
+        )
+
+        # Act
+        service.update_user(user_id, is_active=False)
+
+        # Assert
+        assert mock_user.is_active is False
+        mock_principal_repository.invalidate_user.assert_called_once_with(user_id)
+
     def test_update_user_success_without_email(self):
         """Test updating user without email field"""
         # Arrange
@@ -1,15 +1,19 @@
+import re
 from datetime import UTC, date, datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from httpx import Response
 from pwdlib import PasswordHash
 from sqlmodel import Session
 
+from app.config.query_stats import SERVER_TIMING_HEADER
 from app.domain.models.account import Account, AccountType
 from app.domain.models.application import Application, ApplicationStatus
 from app.domain.models.favorite import Favorite
 from app.domain.models.job import Job
 from app.domain.models.session import UserSession
 from app.domain.models.user import User
+from app.domain.repositories.interfaces.auth import JwtTokenPayload, JwtTokenType
 
 # Password hasher for creating test users
 _password_hasher = PasswordHash.recommended()
@@ -216,6 +220,37 @@ def create_test_favorite(
     return favorite
 
 
+def create_test_token_payload(
+    user_id: UUID | None = None,
+    session_id: UUID | None = None,
+    token_type: JwtTokenType = JwtTokenType.ACCESS,
+    jti: str = "test-jti",
+    iat: float | None = None,
+) -> JwtTokenPayload:
+    """
+    Create a decoded JWT payload without signing a token.
+
+    Args:
+        user_id: Subject user ID (defaults to a random one)
+        session_id: Session ID (defaults to a random one)
+        token_type: Access or refresh token
+        jti: Token ID
+        iat: Issued-at timestamp (defaults to now)
+
+    Returns:
+        JwtTokenPayload expiring one hour after now
+    """
+    now = datetime.now(UTC).timestamp()
+    return JwtTokenPayload(
+        sub=user_id or uuid4(),
+        sid=session_id or uuid4(),
+        type=token_type,
+        iat=now if iat is None else iat,
+        exp=int(now) + 3600,
+        jti=jti,
+    )
+
+
 def get_auth_headers(token: str) -> dict:
     """
     Get authorization headers for authenticated requests.
@@ -229,6 +264,14 @@ def get_auth_headers(token: str) -> dict:
     return {"Authorization": f"Bearer {token}"}
 
 
+INTERNAL_API_TOKEN = "test-internal-token"
+
+
+def get_internal_headers() -> dict:
+    """Get the headers that authorize requests to the internal endpoints."""
+    return {"x-internal-token": INTERNAL_API_TOKEN}
+
+
 def get_account_headers(token: str, account_id: UUID) -> dict:
     """
     Get authorization headers with account context for requests requiring x-account-id.
@@ -244,3 +287,35 @@ def get_account_headers(token: str, account_id: UUID) -> dict:
         "Authorization": f"Bearer {token}",
         "x-account-id": str(account_id),
     }
+
+
+def get_query_count(response: Response) -> int:
+    """
+    Get the number of SQL statements a request issued, from its Server-Timing header.
+
+    Args:
+        response: Response of a request made through the test client
+
+    Returns:
+        Number of statements counted by QueryStatsMiddleware
+    """
+    match = re.search(r'db;[^,]*desc="(\d+) queries"', response.headers[SERVER_TIMING_HEADER])
+    assert match, f"No database timing in {response.headers[SERVER_TIMING_HEADER]!r}"
+    return int(match.group(1))
+
+
+def assert_max_queries(response: Response, max_queries: int) -> None:
+    """
+    Assert that a request issued at most `max_queries` SQL statements.
+
+    Use it to pin the query budget of an endpoint so N+1 regressions fail the suite.
+
+    Args:
+        response: Response of a request made through the test client
+        max_queries: Maximum number of statements the request may issue
+    """
+    count = get_query_count(response)
+    assert count <= max_queries, (
+        f"{response.request.method} {response.request.url.path} issued {count} queries, "
+        f"expected at most {max_queries}"
+    )